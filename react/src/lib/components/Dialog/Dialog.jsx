@@ -1,7 +1,12 @@
 import React from "react";
 import PropTypes from "prop-types";
 
-import { DialogComponent } from "./components/DialogComponent";
+// Loaded when the dialog is first opened
+const DialogComponent = React.lazy(() =>
+    import(
+        /* webpackChunkName: "dialog" */ "./components/DialogComponent"
+    ).then((module) => ({ default: module.DialogComponent }))
+);
 
 const propTypes = {
     /**
@@ -76,7 +81,16 @@ const defaultProps = {
  * A modal dialog component with optional buttons. Can be set to be draggable.
  */
 export const Dialog = (props) => {
-    return <DialogComponent {...props} />;
+    const wasOpened = React.useRef(false);
+    wasOpened.current = wasOpened.current || props.open;
+    if (!wasOpened.current) {
+        return null;
+    }
+    return (
+        <React.Suspense fallback={null}>
+            <DialogComponent {...props} />
+        </React.Suspense>
+    );
 };
 
 Dialog.propTypes = propTypes;
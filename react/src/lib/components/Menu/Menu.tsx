@@ -37,6 +37,7 @@ export type MenuProps = {
     menuDrawerPosition?: "left" | "right";
     showLogo?: boolean;
     homepageUrl?: string;
+    searchIndex?: string[];
 };
 
 const calculateTextWidth = (text: string): number => {
@@ -325,6 +326,7 @@ export const Menu: React.FC<MenuProps> = (props) => {
                     <MenuContent
                         content={navigationItemsWithAssignedIds}
                         groupsInitiallyCollapsed={props.initiallyCollapsed}
+                        searchIndex={props.searchIndex}
                     />
                 </MenuDrawer>
             </div>
@@ -375,6 +377,14 @@ Menu.propTypes = {
      * URL to be shown when clicking on the logo. If not defined, the first page will be used.
      */
     homepageUrl: PropTypes.string,
+
+    /**
+     * The normalized (lower case, without whitespace) titles of all pages in
+     * `navigationItems`, in the order they appear in `navigationItems`, used when
+     * filtering the pages. Created by `webviz_core_components.menu.menu_search_index`.
+     * Computed in the browser if not given.
+     */
+    searchIndex: PropTypes.arrayOf(PropTypes.string.isRequired),
 };
 
 Menu.defaultProps = {
@@ -15,100 +15,30 @@ import {
     PageType,
     NavigationItemType,
 } from "../../types/navigation";
+import {
+    SearchIndex,
+    normalizeTitle,
+    makeSearchIndex,
+    filterSearchIndex,
+    makeFilteredNavigation,
+} from "../../utils/search-index";
 
 import "./MenuContent.css";
 
 type MenuContentProps = {
     content: NavigationType;
     groupsInitiallyCollapsed?: boolean;
+    searchIndex?: string[];
 };
 
-const searchTitle = (title: string, query: string): boolean => {
-    return title
-        .toLowerCase()
-        .replace(" ", "")
-        .includes(query.toLowerCase().replace(" ", ""));
+type PreviousFilter = {
+    searchIndex: SearchIndex;
+    query: string;
+    matches: number[];
 };
 
-const recursivelyFilterNavigation = (
-    navigation: NavigationType,
-    filter: string
-): NavigationType => {
-    const newNavigation: NavigationType = [];
-
-    const makeFilteredNavigation = (
-        filterItem: NavigationItemType,
-        parentItem: GroupType | SectionType
-    ): boolean => {
-        if (
-            filterItem.type === "page" &&
-            searchTitle(filterItem.title, filter)
-        ) {
-            parentItem.content.push(filterItem as PageType);
-            return true;
-        } else {
-            let test = false;
-            const newItem: GroupType = {
-                type: filterItem.type as "group",
-                title: filterItem.title,
-                icon: filterItem.icon,
-                content: [],
-                id: filterItem.id,
-            };
-            if ((filterItem as GroupType).content) {
-                (filterItem as GroupType).content.forEach((el) => {
-                    test = makeFilteredNavigation(el, newItem) || test;
-                });
-            }
-            if (test) {
-                parentItem.content.push(newItem);
-                return true;
-            }
-        }
-        return false;
-    };
-
-    navigation.forEach((el: NavigationItemType) => {
-        if (el.type === "page" && searchTitle(el.title, filter)) {
-            (newNavigation as (GroupType | PageType)[]).push(el as PageType);
-        } else if (el.type === "group") {
-            let test = false;
-            const newItem: GroupType = {
-                type: el.type as "group",
-                title: el.title,
-                icon: el.icon,
-                content: [],
-                id: el.id,
-            };
-            (el as GroupType).content.forEach((el) => {
-                test = makeFilteredNavigation(el, newItem) || test;
-            });
-            if (test) {
-                (newNavigation as (GroupType | PageType)[]).push(newItem);
-            }
-        } else if (el.type === "section") {
-            let test = false;
-            const newItem: SectionType = {
-                type: el.type as "section",
-                title: el.title,
-                icon: el.icon,
-                content: [],
-                id: el.id,
-            };
-            if ((el as SectionType).content) {
-                (el as SectionType).content.forEach(
-                    (el: NavigationItemType) => {
-                        test = makeFilteredNavigation(el, newItem) || test;
-                    }
-                );
-            }
-            if (test) {
-                (newNavigation as SectionType[]).push(newItem);
-            }
-        }
-    });
-    return newNavigation;
-};
+// Time to wait for further keystrokes before filtering the navigation
+const FILTER_DEBOUNCE_TIME_MS = 150;
 
 const makeNavigation = (
     navigation: NavigationType,
@@ -203,13 +133,39 @@ const makeNavigation = (
 
 export const MenuContent: React.FC<MenuContentProps> = (props) => {
     const [filter, setFilter] = React.useState<string>("");
+    const [debouncedFilter, setDebouncedFilter] = React.useState<string>("");
     const [content, setContent] = React.useState<NavigationType>(props.content);
+    const previousFilter = React.useRef<PreviousFilter | null>(null);
 
     const store = useStore();
 
+    const searchIndex = React.useMemo(
+        () => makeSearchIndex(props.content, props.searchIndex),
+        [props.content, props.searchIndex]
+    );
+
+    React.useEffect(() => {
+        // Clearing the filter is applied immediately
+        const timeout = setTimeout(
+            () => setDebouncedFilter(filter),
+            filter === "" ? 0 : FILTER_DEBOUNCE_TIME_MS
+        );
+        return () => clearTimeout(timeout);
+    }, [filter]);
+
     React.useEffect(() => {
-        setContent(recursivelyFilterNavigation(props.content, filter));
-    }, [filter, props.content]);
+        const query = normalizeTitle(debouncedFilter);
+        const previous = previousFilter.current;
+        const matches = filterSearchIndex(
+            searchIndex,
+            query,
+            previous && previous.searchIndex === searchIndex
+                ? previous
+                : undefined
+        );
+        previousFilter.current = { searchIndex, query, matches };
+        setContent(makeFilteredNavigation(searchIndex, matches));
+    }, [debouncedFilter, searchIndex]);
 
     return (
         <div className="Menu__ContentWrapper">
@@ -224,7 +180,7 @@ export const MenuContent: React.FC<MenuContentProps> = (props) => {
                 ) : (
                     makeNavigation(
                         content,
-                        filter !== "",
+                        debouncedFilter !== "",
                         props.groupsInitiallyCollapsed || false,
                         store.firstPageHref
                     )
@@ -237,4 +193,5 @@ export const MenuContent: React.FC<MenuContentProps> = (props) => {
 MenuContent.propTypes = {
     content: PropTypes.any.isRequired,
     groupsInitiallyCollapsed: PropTypes.bool,
+    searchIndex: PropTypes.arrayOf(PropTypes.string.isRequired),
 };
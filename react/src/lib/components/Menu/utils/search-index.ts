@@ -0,0 +1,119 @@
+import {
+    NavigationType,
+    NavigationItemType,
+    GroupType,
+    SectionType,
+    PageType,
+} from "../types/navigation";
+
+/**
+ * The pages of a navigation tree in depth-first order, together with their
+ * ancestors and normalized titles, such that filtering only has to compare
+ * strings and the filtered tree can be rebuilt from the matching pages.
+ */
+export type SearchIndex = {
+    pages: PageType[];
+    ancestors: (GroupType | SectionType)[][];
+    titles: string[];
+};
+
+export const normalizeTitle = (title: string): string =>
+    title.toLowerCase().replace(/\s+/g, "");
+
+/**
+ * Creates the search index of the given navigation. `titles` are normalized page
+ * titles computed in advance (e.g. by `menu_search_index` in Python), which are
+ * only used if given for all pages.
+ */
+export const makeSearchIndex = (
+    navigation: NavigationType,
+    titles?: string[]
+): SearchIndex => {
+    const pages: PageType[] = [];
+    const ancestors: (GroupType | SectionType)[][] = [];
+
+    const recursivelyIndexPages = (
+        items: NavigationItemType[],
+        parents: (GroupType | SectionType)[]
+    ) => {
+        items.forEach((item) => {
+            if (item.type === "page") {
+                pages.push(item as PageType);
+                ancestors.push(parents);
+            } else if ((item as GroupType | SectionType).content) {
+                recursivelyIndexPages(
+                    (item as GroupType | SectionType).content,
+                    [...parents, item as GroupType | SectionType]
+                );
+            }
+        });
+    };
+    recursivelyIndexPages(navigation, []);
+
+    return {
+        pages: pages,
+        ancestors: ancestors,
+        titles:
+            titles && titles.length === pages.length
+                ? titles
+                : pages.map((page) => normalizeTitle(page.title)),
+    };
+};
+
+/**
+ * Returns the indices of the pages matching the normalized `query`. If the query
+ * contains the query of a previous filtering of the same index, only the pages
+ * matching the previous query are searched.
+ */
+export const filterSearchIndex = (
+    searchIndex: SearchIndex,
+    query: string,
+    previous?: { query: string; matches: number[] }
+): number[] => {
+    if (previous && query.includes(previous.query)) {
+        return previous.matches.filter((index) =>
+            searchIndex.titles[index].includes(query)
+        );
+    }
+    const matches: number[] = [];
+    searchIndex.titles.forEach((title, index) => {
+        if (title.includes(query)) {
+            matches.push(index);
+        }
+    });
+    return matches;
+};
+
+/**
+ * Builds the navigation tree containing only the given pages (as indices in the
+ * search index, in increasing order) and their ancestors.
+ */
+export const makeFilteredNavigation = (
+    searchIndex: SearchIndex,
+    matches: number[]
+): NavigationType => {
+    const navigation: NavigationItemType[] = [];
+    const filteredAncestors = new Map<string, GroupType | SectionType>();
+
+    matches.forEach((index) => {
+        let content: NavigationItemType[] = navigation;
+        searchIndex.ancestors[index].forEach((ancestor) => {
+            let filteredAncestor = filteredAncestors.get(ancestor.id);
+            if (filteredAncestor === undefined) {
+                filteredAncestor = {
+                    type: ancestor.type,
+                    title: ancestor.title,
+                    icon: ancestor.icon,
+                    content: [],
+                    id: ancestor.id,
+                } as GroupType | SectionType;
+                filteredAncestors.set(ancestor.id, filteredAncestor);
+                content.push(filteredAncestor);
+            }
+            content = filteredAncestor.content;
+        });
+        content.push(searchIndex.pages[index]);
+    });
+
+    return navigation as NavigationType;
+};
@@ -13,6 +13,10 @@ import {
     getPropsWithMissingValuesSetToDefault,
     Optionals,
 } from "../../utils/DefaultPropsHelpers";
+import {
+    OptionValue,
+    VirtualizedOptionList,
+} from "./components/VirtualizedOptionList";
 import "./Select.css";
 
 const propTypes = {
@@ -26,29 +30,48 @@ const propTypes = {
     size: PropTypes.number,
     /**
      * An array of options {label: [string|number], value: [string|number]},
-     * an optional disabled field can be used for each option
+     * an optional disabled field can be used for each option.
+     * Alternatively, for large numbers of options, the more compact
+     * {labels: [string|number][], values: [string|number][]} with
+     * the labels and values given as parallel arrays.
      */
-    options: PropTypes.arrayOf(
-        PropTypes.exact({
-            /**
-             * The dropdown's label
-             */
-            label: PropTypes.oneOfType([
-                PropTypes.string.isRequired,
-                PropTypes.number.isRequired,
-            ]).isRequired,
+    options: PropTypes.oneOfType([
+        PropTypes.arrayOf(
+            PropTypes.exact({
+                /**
+                 * The dropdown's label
+                 */
+                label: PropTypes.oneOfType([
+                    PropTypes.string.isRequired,
+                    PropTypes.number.isRequired,
+                ]).isRequired,
 
-            /**
-             * The value of the dropdown. This value
-             * corresponds to the items specified in the
-             * `value` property.
-             */
-            value: PropTypes.oneOfType([
-                PropTypes.string.isRequired,
-                PropTypes.number.isRequired,
-            ]).isRequired,
-        }).isRequired
-    ),
+                /**
+                 * The value of the dropdown. This value
+                 * corresponds to the items specified in the
+                 * `value` property.
+                 */
+                value: PropTypes.oneOfType([
+                    PropTypes.string.isRequired,
+                    PropTypes.number.isRequired,
+                ]).isRequired,
+            }).isRequired
+        ),
+        PropTypes.exact({
+            labels: PropTypes.arrayOf(
+                PropTypes.oneOfType([
+                    PropTypes.string.isRequired,
+                    PropTypes.number.isRequired,
+                ]).isRequired
+            ).isRequired,
+            values: PropTypes.arrayOf(
+                PropTypes.oneOfType([
+                    PropTypes.string.isRequired,
+                    PropTypes.number.isRequired,
+                ]).isRequired
+            ).isRequired,
+        }),
+    ]),
     /**
      * The value of the input. If `multi` is false
      * then value is just a string that corresponds to the values
@@ -77,6 +100,11 @@ const propTypes = {
      * If true, the user can select multiple values
      */
     multi: PropTypes.bool,
+    /**
+     * If true, only the visible options are rendered, in a list box replacing
+     * the html select tag. Use this for large numbers of options.
+     */
+    virtualized: PropTypes.bool,
     /**
      * Appends a class to the select tag
      */
@@ -132,6 +160,7 @@ const defaultProps: Optionals<InferProps<typeof propTypes>> = {
     size: 4,
     value: [],
     multi: true,
+    virtualized: false,
     debounce_time_ms: 0,
     style: {},
     parent_style: {},
@@ -145,6 +174,22 @@ const defaultProps: Optionals<InferProps<typeof propTypes>> = {
     },
 };
 
+type SelectOptions =
+    | { label: OptionValue; value: OptionValue }[]
+    | { labels: OptionValue[]; values: OptionValue[] };
+
+const toCompactOptions = (
+    options: SelectOptions
+): { labels: OptionValue[]; values: OptionValue[] } => {
+    if (Array.isArray(options)) {
+        return {
+            labels: options.map((option) => option.label),
+            values: options.map((option) => option.value),
+        };
+    }
+    return options;
+};
+
 /**
  * Select is a dash wrapper for the html select tag.
  */
@@ -157,6 +202,7 @@ export const Select: React.FC<InferProps<typeof propTypes>> = (
         parent_style,
         value,
         multi,
+        virtualized,
         debounce_time_ms,
         size,
         className,
@@ -185,20 +231,13 @@ export const Select: React.FC<InferProps<typeof propTypes>> = (
         };
     }, []);
 
-    const handleChange = React.useCallback(
-        (e: React.ChangeEvent) => {
-            const selectedOptions = [].slice.call(
-                (e.target as HTMLSelectElement).selectedOptions
-            );
-            const values = options
-                .filter((option) =>
-                    selectedOptions.some(
-                        (selectedOption: HTMLOptionElement) =>
-                            selectedOption.value === option.value.toString()
-                    )
-                )
-                .map((option) => option.value);
+    const { labels, values: optionValues } = React.useMemo(
+        () => toCompactOptions(options as SelectOptions),
+        [options]
+    );
 
+    const updateSelectedValues = React.useCallback(
+        (values: OptionValue[]) => {
             if (!isEqual(values, selectedValues)) {
                 setSelectedValues(values);
             }
@@ -210,15 +249,48 @@ export const Select: React.FC<InferProps<typeof propTypes>> = (
                 setProps({ value: values });
             }, debounce_time_ms);
         },
-        [
-            debounceTimer.current,
-            debounce_time_ms,
-            options,
-            selectedValues,
-            setProps,
-        ]
+        [debounceTimer.current, debounce_time_ms, selectedValues, setProps]
+    );
+
+    const handleChange = React.useCallback(
+        (e: React.ChangeEvent) => {
+            // The option elements are in the same order as the options
+            const values = Array.from(
+                (e.target as HTMLSelectElement).selectedOptions,
+                (selectedOption) => optionValues[selectedOption.index]
+            );
+            updateSelectedValues(values);
+        },
+        [optionValues, updateSelectedValues]
     );
 
+    const selectedValuesAsArray =
+        typeof selectedValues === "string" ||
+        typeof selectedValues === "number"
+            ? [selectedValues]
+            : (selectedValues as OptionValue[]);
+
+    if (virtualized) {
+        return (
+            <div
+                id={id}
+                className={parent_className ? parent_className : ""}
+                style={parent_style ? parent_style : {}}
+            >
+                <VirtualizedOptionList
+                    labels={labels}
+                    values={optionValues}
+                    selectedValues={selectedValuesAsArray}
+                    multi={multi}
+                    size={size}
+                    className={className}
+                    style={style as React.CSSProperties}
+                    onChange={updateSelectedValues}
+                />
+            </div>
+        );
+    }
+
     return (
         <div
             id={id}
@@ -242,13 +314,13 @@ export const Select: React.FC<InferProps<typeof propTypes>> = (
                 className={"webviz-config-select " + className}
                 style={style}
             >
-                {options.map((opt, idx) => {
+                {optionValues.map((optionValue, idx) => {
                     return (
                         <option
-                            key={idx.toString() + opt.value}
-                            value={opt.value}
+                            key={idx.toString() + optionValue}
+                            value={optionValue}
                         >
-                            {opt.label}
+                            {labels[idx]}
                         </option>
                     );
                 })}
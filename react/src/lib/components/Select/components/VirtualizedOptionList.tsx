@@ -0,0 +1,167 @@
+/**
+ * Copyright (c) 2021- Equinor ASA
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+import React from "react";
+
+export type OptionValue = string | number;
+
+type VirtualizedOptionListProps = {
+    labels: OptionValue[];
+    values: OptionValue[];
+    selectedValues: OptionValue[];
+    multi: boolean;
+    size: number;
+    className: string;
+    style: React.CSSProperties;
+    onChange: (values: OptionValue[]) => void;
+};
+
+// Must match the height of .webviz-config-select-virtualized-option
+const ROW_HEIGHT = 20;
+// Number of rows rendered above and below the visible ones
+const OVERSCAN = 10;
+
+/**
+ * A list box behaving like a native select, but only having the visible options
+ * in the DOM.
+ */
+export const VirtualizedOptionList: React.FC<VirtualizedOptionListProps> = (
+    props: VirtualizedOptionListProps
+): JSX.Element => {
+    const { labels, values, selectedValues, multi, size, onChange } = props;
+
+    const [scrollTop, setScrollTop] = React.useState<number>(0);
+    const [anchorIndex, setAnchorIndex] = React.useState<number | null>(null);
+    const listRef = React.useRef<HTMLDivElement>(null);
+
+    const selected = React.useMemo(
+        () => new Set(selectedValues.map((value) => value.toString())),
+        [selectedValues]
+    );
+
+    const selectIndex = React.useCallback(
+        (index: number, toggle: boolean, extend: boolean) => {
+            if (multi && extend && anchorIndex !== null) {
+                const range = values.slice(
+                    Math.min(anchorIndex, index),
+                    Math.max(anchorIndex, index) + 1
+                );
+                if (toggle) {
+                    const rangeSet = new Set(range);
+                    onChange(
+                        values.filter(
+                            (value) =>
+                                rangeSet.has(value) ||
+                                selected.has(value.toString())
+                        )
+                    );
+                } else {
+                    onChange(range);
+                }
+                return;
+            }
+            const value = values[index];
+            if (multi && toggle) {
+                onChange(
+                    values.filter((otherValue) =>
+                        otherValue === value
+                            ? !selected.has(value.toString())
+                            : selected.has(otherValue.toString())
+                    )
+                );
+            } else {
+                onChange([value]);
+            }
+            setAnchorIndex(index);
+        },
+        [multi, anchorIndex, values, selected, onChange]
+    );
+
+    const handleKeyDown = React.useCallback(
+        (e: React.KeyboardEvent) => {
+            if (e.key !== "ArrowDown" && e.key !== "ArrowUp") {
+                return;
+            }
+            e.preventDefault();
+            const current = anchorIndex === null ? -1 : anchorIndex;
+            const index = Math.min(
+                values.length - 1,
+                Math.max(0, current + (e.key === "ArrowDown" ? 1 : -1))
+            );
+            selectIndex(index, false, false);
+
+            const list = listRef.current;
+            if (list) {
+                if (index * ROW_HEIGHT < list.scrollTop) {
+                    list.scrollTop = index * ROW_HEIGHT;
+                } else if (
+                    (index + 1) * ROW_HEIGHT >
+                    list.scrollTop + size * ROW_HEIGHT
+                ) {
+                    list.scrollTop = (index + 1 - size) * ROW_HEIGHT;
+                }
+            }
+        },
+        [anchorIndex, values.length, size, selectIndex]
+    );
+
+    const firstIndex = Math.max(
+        0,
+        Math.floor(scrollTop / ROW_HEIGHT) - OVERSCAN
+    );
+    const lastIndex = Math.min(
+        values.length,
+        Math.ceil(scrollTop / ROW_HEIGHT) + size + OVERSCAN
+    );
+
+    const rows: JSX.Element[] = [];
+    for (let index = firstIndex; index < lastIndex; index++) {
+        const isSelected = selected.has(values[index].toString());
+        rows.push(
+            <div
+                key={index.toString() + values[index]}
+                role="option"
+                aria-selected={isSelected}
+                className={
+                    "webviz-config-select-virtualized-option" +
+                    (isSelected ? " selected" : "")
+                }
+                style={{ top: index * ROW_HEIGHT }}
+                onMouseDown={(e) => {
+                    e.preventDefault();
+                    listRef.current?.focus();
+                    selectIndex(index, e.ctrlKey || e.metaKey, e.shiftKey);
+                }}
+            >
+                {labels[index]}
+            </div>
+        );
+    }
+
+    return (
+        <div
+            ref={listRef}
+            role="listbox"
+            aria-multiselectable={multi}
+            tabIndex={0}
+            className={
+                "webviz-config-select webviz-config-select-virtualized " +
+                props.className
+            }
+            style={{ ...props.style, height: size * ROW_HEIGHT }}
+            onScroll={(e) => setScrollTop(e.currentTarget.scrollTop)}
+            onKeyDown={handleKeyDown}
+        >
+            <div
+                className="webviz-config-select-virtualized-content"
+                style={{ height: values.length * ROW_HEIGHT }}
+            >
+                {rows}
+            </div>
+        </div>
+    );
+};
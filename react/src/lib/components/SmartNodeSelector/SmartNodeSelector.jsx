@@ -7,14 +7,30 @@
 
 import PropTypes from "prop-types";
 import React from "react";
-import SmartNodeSelectorComponent from "./components/SmartNodeSelectorComponent";
+
+// The styles of the lazily loaded component are imported here, such that they
+// are in the main stylesheet instead of a CSS file of the chunk not served by Dash
+import "animate.css";
+import "./components/SmartNodeSelector.css";
+import "./components/Suggestions.css";
+
+// Loaded when first rendered
+const SmartNodeSelectorComponent = React.lazy(() =>
+    import(
+        /* webpackChunkName: "smart-node-selector" */ "./components/SmartNodeSelectorComponent"
+    )
+);
 
 /**
  * SmartNodeSelector is a component that allows to create tags by selecting data from a tree structure.
  * The tree structure can also provide meta data that is displayed as color or icon.
  */
 export const SmartNodeSelector = (props) => {
-    return <SmartNodeSelectorComponent {...props} />;
+    return (
+        <React.Suspense fallback={null}>
+            <SmartNodeSelectorComponent {...props} />
+        </React.Suspense>
+    );
 };
 
 SmartNodeSelector.defaultProps = {
@@ -56,9 +72,42 @@ SmartNodeSelector.propTypes = {
     numMetaNodes: PropTypes.number,
 
     /**
-     * A JSON object holding all tags.
+     * A JSON object holding all tags. Either given as a nested list of nodes,
+     * or on the flattened form created by
+     * `webviz_core_components.smart_node_selector.flatten_tree_data`.
+     * Nodes marked with `lazyChildren` get their children loaded on demand,
+     * see `requestedNodePaths` and `loadedChildren`.
+     */
+    data: PropTypes.oneOfType([
+        PropTypes.array,
+        PropTypes.shape({
+            names: PropTypes.arrayOf(PropTypes.string).isRequired,
+            parents: PropTypes.arrayOf(PropTypes.number).isRequired,
+            metaData: PropTypes.objectOf(PropTypes.object),
+        }),
+    ]).isRequired,
+
+    /**
+     * Paths, joined by the delimiter, of nodes marked with `lazyChildren` whose
+     * children are needed. Set by the component, should be answered by setting
+     * `loadedChildren`.
+     */
+    requestedNodePaths: PropTypes.arrayOf(PropTypes.string),
+
+    /**
+     * Children of nodes marked with `lazyChildren`, keyed by the node path
+     * joined by the delimiter. The children are given on the same nested form
+     * as `data`, and may themselves be marked with `lazyChildren`.
+     */
+    loadedChildren: PropTypes.objectOf(PropTypes.array),
+
+    /**
+     * The complete node paths matched by tags, keyed by the tag, as resolved
+     * on the server by
+     * `webviz_core_components.smart_node_selector.TagResolver`. Tags given
+     * here are not matched against the tree data again by the component.
      */
-    data: PropTypes.array.isRequired,
+    resolvedTags: PropTypes.objectOf(PropTypes.arrayOf(PropTypes.string)),
 
     /**
      * A label that will be printed when this component is rendered.
@@ -12,7 +12,7 @@ import _ from "lodash";
 
 import TreeNodeSelection from "../utils/TreeNodeSelection";
 import TreeData from "../utils/TreeData";
-import { TreeDataNode } from "../utils/TreeDataNodeTypes";
+import { FlatTreeData, TreeDataNode } from "../utils/TreeDataNodeTypes";
 import Suggestions from "./Suggestions";
 import Tag from "./Tag";
 
@@ -32,6 +32,7 @@ export type ParentProps = {
     selectedTags: string[];
     selectedNodes: string[];
     selectedIds: string[];
+    requestedNodePaths: string[];
 };
 
 export type SmartNodeSelectorPropsType = {
@@ -39,10 +40,13 @@ export type SmartNodeSelectorPropsType = {
     maxNumSelectedNodes: number;
     delimiter: string;
     numMetaNodes: number;
-    data: TreeDataNode[];
+    data: TreeDataNode[] | FlatTreeData;
     label?: string;
     showSuggestions: boolean;
-    setProps: (props: ParentProps) => void;
+    requestedNodePaths?: string[];
+    loadedChildren?: { [nodePath: string]: TreeDataNode[] };
+    resolvedTags?: { [tag: string]: string[] };
+    setProps: (props: Partial<ParentProps>) => void;
     selectedTags?: string[];
     placeholder?: string;
     numSecondsUntilSuggestionsAreShown: number;
@@ -112,6 +116,7 @@ export default class SmartNodeSelectorComponent extends Component<SmartNodeSelec
     protected blurEnabled: boolean;
     protected updateFromWithin: boolean;
     protected tabbedInFromOutside: boolean;
+    protected pendingNodePaths: Set<string>;
 
     public state: SmartNodeSelectorStateType;
     public static propTypes: Record<string, unknown>;
@@ -156,6 +161,7 @@ export default class SmartNodeSelectorComponent extends Component<SmartNodeSelec
         this.blurEnabled = true;
         this.updateFromWithin = false;
         this.tabbedInFromOutside = false;
+        this.pendingNodePaths = new Set();
 
         let error: string | undefined = undefined;
 
@@ -182,6 +188,7 @@ export default class SmartNodeSelectorComponent extends Component<SmartNodeSelec
             this.treeData = null;
             error = e as string;
         }
+        this.addResolvedTags();
 
         const nodeSelections: TreeNodeSelection[] = [];
         if (props.selectedTags !== undefined) {
@@ -268,18 +275,31 @@ export default class SmartNodeSelectorComponent extends Component<SmartNodeSelec
     }
 
     componentDidUpdate(prevProps: SmartNodeSelectorPropsType): void {
+        if (
+            this.props.loadedChildren &&
+            this.props.loadedChildren !== prevProps.loadedChildren
+        ) {
+            this.addLoadedChildren();
+        }
+        if (
+            this.props.resolvedTags &&
+            this.props.resolvedTags !== prevProps.resolvedTags
+        ) {
+            this.addResolvedTags();
+        }
         if (this.updateFromWithin) {
             this.updateFromWithin = false;
             return;
         }
         if (
             (this.props.data &&
-                JSON.stringify(this.props.data) !==
-                    JSON.stringify(prevProps.data)) ||
+                this.props.data !== prevProps.data &&
+                !_.isEqual(this.props.data, prevProps.data)) ||
             (this.props.delimiter &&
                 this.props.delimiter !== prevProps.delimiter)
         ) {
             let error: string | undefined;
+            this.pendingNodePaths.clear();
             try {
                 this.treeData = new TreeData({
                     treeData: this.props.data,
@@ -290,6 +310,7 @@ export default class SmartNodeSelectorComponent extends Component<SmartNodeSelec
                 this.treeData = null;
                 error = e as string;
             }
+            this.addResolvedTags();
             const nodeSelections: TreeNodeSelection[] = [];
             for (const node of this.state.nodeSelections) {
                 nodeSelections.push(
@@ -1171,6 +1192,60 @@ export default class SmartNodeSelectorComponent extends Component<SmartNodeSelec
             this.selectedNodes = selectedNodes;
         }
         this.numValidSelections = this.countValidSelections();
+        this.requestLazyChildren();
+    }
+
+    requestLazyChildren(): void {
+        if (!this.treeData) {
+            return;
+        }
+        const { setProps, delimiter } = this.props;
+        let hasNewRequests = false;
+        for (const nodeSelection of this.state.nodeSelections) {
+            const nodePath = this.treeData.findUnloadedNodePath(
+                nodeSelection.getNodePath()
+            );
+            if (nodePath === null) {
+                continue;
+            }
+            const nodePathString = nodePath.join(delimiter);
+            if (!this.pendingNodePaths.has(nodePathString)) {
+                this.pendingNodePaths.add(nodePathString);
+                hasNewRequests = true;
+            }
+        }
+        if (hasNewRequests) {
+            setProps({ requestedNodePaths: [...this.pendingNodePaths] });
+        }
+    }
+
+    addLoadedChildren(): void {
+        const { loadedChildren, delimiter } = this.props;
+        if (!this.treeData || !loadedChildren) {
+            return;
+        }
+        let hasNewChildren = false;
+        for (const nodePathString of Object.keys(loadedChildren)) {
+            if (
+                this.treeData.addLoadedChildNodes(
+                    nodePathString.split(delimiter),
+                    loadedChildren[nodePathString]
+                )
+            ) {
+                hasNewChildren = true;
+            }
+            this.pendingNodePaths.delete(nodePathString);
+        }
+        if (hasNewChildren) {
+            this.updateState({ forceUpdate: true });
+        }
+    }
+
+    addResolvedTags(): void {
+        const { resolvedTags } = this.props;
+        if (this.treeData && resolvedTags) {
+            this.treeData.addResolvedTags(resolvedTags);
+        }
     }
 
     debugOutput(): React.ReactNode | null {
@@ -2079,9 +2154,42 @@ SmartNodeSelectorComponent.propTypes = {
     numMetaNodes: PropTypes.number,
 
     /**
-     * A JSON object holding all tags.
+     * A JSON object holding all tags. Either given as a nested list of nodes,
+     * or on the flattened form created by
+     * `webviz_core_components.smart_node_selector.flatten_tree_data`.
+     * Nodes marked with `lazyChildren` get their children loaded on demand,
+     * see `requestedNodePaths` and `loadedChildren`.
+     */
+    data: PropTypes.oneOfType([
+        PropTypes.array,
+        PropTypes.shape({
+            names: PropTypes.arrayOf(PropTypes.string).isRequired,
+            parents: PropTypes.arrayOf(PropTypes.number).isRequired,
+            metaData: PropTypes.objectOf(PropTypes.object),
+        }),
+    ]).isRequired,
+
+    /**
+     * Paths, joined by the delimiter, of nodes marked with `lazyChildren` whose
+     * children are needed. Set by the component, should be answered by setting
+     * `loadedChildren`.
+     */
+    requestedNodePaths: PropTypes.arrayOf(PropTypes.string),
+
+    /**
+     * Children of nodes marked with `lazyChildren`, keyed by the node path
+     * joined by the delimiter. The children are given on the same nested form
+     * as `data`, and may themselves be marked with `lazyChildren`.
+     */
+    loadedChildren: PropTypes.objectOf(PropTypes.array),
+
+    /**
+     * The complete node paths matched by tags, keyed by the tag, as resolved
+     * on the server by
+     * `webviz_core_components.smart_node_selector.TagResolver`. Tags given
+     * here are not matched against the tree data again by the component.
      */
-    data: PropTypes.array.isRequired,
+    resolvedTags: PropTypes.objectOf(PropTypes.arrayOf(PropTypes.string)),
 
     /**
      * A label that will be printed when this component is rendered.
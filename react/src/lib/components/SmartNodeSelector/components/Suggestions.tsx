@@ -11,7 +11,10 @@ import classNames from "classnames";
 import PropTypes from "prop-types";
 
 import TreeNodeSelection from "../utils/TreeNodeSelection";
-import { TreeDataNodeMetaData } from "../utils/TreeDataNodeTypes";
+import TreeData from "../utils/TreeData";
+import SuggestionEngineClient, {
+    Suggestion,
+} from "../utils/SuggestionEngine";
 
 import "./Suggestions.css";
 
@@ -33,7 +36,8 @@ type SuggestionsState = {
     fromIndex: number;
 };
 
-type Option = { nodeName: string; metaData: TreeDataNodeMetaData };
+// Suggestions are loaded from the suggestion engine in pages of this size
+const PAGE_SIZE = 100;
 
 /**
  * A component for showing a list of suggestions.
@@ -48,7 +52,13 @@ class Suggestions extends Component<SuggestionsProps> {
     private currentlySelectedSuggestionIndex: number;
     private rowHeight: number;
     private upperSpacerHeight: number;
-    private allOptions: Option[];
+    private numOptions: number;
+    private optionPages: Map<number, Suggestion[]>;
+    private requestedOptionPages: Set<number>;
+    private loadingOptions: boolean;
+    private queryId: number;
+    private suggestionEngine: SuggestionEngineClient | null;
+    private suggestionEngineTreeData: TreeData | null;
     private currentNodeLevel: number;
     private currentNodeName: string;
     private lastNodeSelection?: TreeNodeSelection;
@@ -67,8 +77,14 @@ class Suggestions extends Component<SuggestionsProps> {
         this.upperSpacerHeight = 0;
         this.currentNodeLevel = -1;
         this.currentNodeName = "";
-        this.lastNodeSelection = props.treeNodeSelection;
-        this.allOptions = [];
+        this.lastNodeSelection = undefined;
+        this.numOptions = 0;
+        this.optionPages = new Map();
+        this.requestedOptionPages = new Set();
+        this.loadingOptions = false;
+        this.queryId = 0;
+        this.suggestionEngine = null;
+        this.suggestionEngineTreeData = null;
         this.positionRef = React.createRef();
         this.popup = null;
         this.popupRoot = null;
@@ -77,11 +93,6 @@ class Suggestions extends Component<SuggestionsProps> {
         this.state = {
             fromIndex: 0,
         };
-
-        if (this.props.treeNodeSelection) {
-            this.allOptions = this.props.treeNodeSelection.getSuggestions();
-            this.currentNodeLevel = this.props.treeNodeSelection.getFocussedLevel();
-        }
     }
 
     componentDidMount(): void {
@@ -120,6 +131,8 @@ class Suggestions extends Component<SuggestionsProps> {
         if (this.popup) {
             document.body.removeChild(this.popup);
         }
+
+        this.suggestionEngine?.terminate();
     }
 
     componentDidUpdate(previousProps: SuggestionsProps): void {
@@ -147,12 +160,20 @@ class Suggestions extends Component<SuggestionsProps> {
         ];
     }
 
+    private getSuggestionEngine(treeData: TreeData): SuggestionEngineClient {
+        if (
+            this.suggestionEngine === null ||
+            this.suggestionEngineTreeData !== treeData
+        ) {
+            this.suggestionEngine?.terminate();
+            this.suggestionEngine = new SuggestionEngineClient(treeData);
+            this.suggestionEngineTreeData = treeData;
+        }
+        return this.suggestionEngine;
+    }
+
     private maybeLoadNewOptions(): void {
-        const {
-            treeNodeSelection,
-            suggestionsRef,
-            showAllSuggestions,
-        } = this.props;
+        const { treeNodeSelection, showAllSuggestions } = this.props;
         if (
             treeNodeSelection !== undefined &&
             (treeNodeSelection.getFocussedLevel() !== this.currentNodeLevel ||
@@ -163,18 +184,72 @@ class Suggestions extends Component<SuggestionsProps> {
                 this.props.showAllSuggestions !== this.showingAllSuggestions)
         ) {
             this.showingAllSuggestions = this.props.showAllSuggestions;
-            this.allOptions = treeNodeSelection.getSuggestions(
-                showAllSuggestions
-            );
             this.currentNodeLevel = treeNodeSelection.getFocussedLevel();
             this.lastNodeSelection = treeNodeSelection;
             this.currentNodeName = treeNodeSelection.getFocussedNodeName();
-            if (suggestionsRef.current) {
-                (suggestionsRef.current as HTMLDivElement).scrollTo(0, 0);
+
+            const nodePath = treeNodeSelection.getNodePath(
+                treeNodeSelection.getFocussedLevel()
+            );
+            if (showAllSuggestions && nodePath.length > 0) {
+                nodePath[nodePath.length - 1] = "";
             }
+
+            // The previous options are shown until the new ones are found
+            const queryId = ++this.queryId;
+            this.loadingOptions = true;
+            this.getSuggestionEngine(treeNodeSelection.getTreeData())
+                .query(nodePath, PAGE_SIZE)
+                .then(({ total, suggestions }) => {
+                    if (queryId !== this.queryId) {
+                        return;
+                    }
+                    this.numOptions = total;
+                    this.optionPages = new Map([[0, suggestions]]);
+                    this.requestedOptionPages = new Set([0]);
+                    this.loadingOptions = false;
+                    const { suggestionsRef } = this.props;
+                    if (suggestionsRef.current) {
+                        (suggestionsRef.current as HTMLDivElement).scrollTo(
+                            0,
+                            0
+                        );
+                    }
+                    this.renderPopup();
+                });
         }
     }
 
+    /**
+     * Returns the options with indices in [from, to), undefined for options not
+     * yet loaded. Loads missing pages of options, rendering them when loaded.
+     */
+    private getOptions(from: number, to: number): (Suggestion | undefined)[] {
+        const options: (Suggestion | undefined)[] = [];
+        for (let i = from; i < Math.min(to, this.numOptions); i++) {
+            const pageIndex = Math.floor(i / PAGE_SIZE);
+            const page = this.optionPages.get(pageIndex);
+            options.push(page ? page[i - pageIndex * PAGE_SIZE] : undefined);
+            if (
+                !page &&
+                !this.requestedOptionPages.has(pageIndex) &&
+                this.suggestionEngine
+            ) {
+                this.requestedOptionPages.add(pageIndex);
+                const queryId = this.queryId;
+                this.suggestionEngine
+                    .page(pageIndex * PAGE_SIZE, PAGE_SIZE)
+                    .then((suggestions) => {
+                        if (queryId === this.queryId) {
+                            this.optionPages.set(pageIndex, suggestions);
+                            this.renderPopup();
+                        }
+                    });
+            }
+        }
+        return options;
+    }
+
     private handleMouseMove(): void {
         this.mouseMoved = true;
     }
@@ -189,21 +264,16 @@ class Suggestions extends Component<SuggestionsProps> {
             } else if (e.key === "ArrowDown") {
                 this.markSuggestionAsHoveredAndMakeVisible(
                     Math.min(
-                        this.allOptions.length - 1,
+                        this.numOptions - 1,
                         this.currentlySelectedSuggestionIndex + 1
                     )
                 );
             }
-            if (
-                e.key == "Enter" &&
-                this.currentlySelectedSuggestion() !== undefined
-            ) {
-                this.useSuggestion(
-                    e,
-                    this.currentlySelectedSuggestion().getAttribute(
-                        "data-use"
-                    ) as string
-                );
+            const suggestion = this.currentlySelectedSuggestion()?.getAttribute(
+                "data-use"
+            );
+            if (e.key == "Enter" && suggestion) {
+                this.useSuggestion(e, suggestion);
             }
         }
     }
@@ -217,14 +287,14 @@ class Suggestions extends Component<SuggestionsProps> {
                 : 200);
         const height = Math.min(
             maxHeight,
-            this.allOptions.length * this.rowHeight
+            this.numOptions * this.rowHeight
         );
         const index = Math.min(
             Math.floor(
                 (suggestionsRef.current as HTMLDivElement).scrollTop /
                     this.rowHeight
             ),
-            this.allOptions.length - Math.floor(height / this.rowHeight)
+            this.numOptions - Math.floor(height / this.rowHeight)
         );
         const remainder =
             (suggestionsRef.current as HTMLDivElement).scrollTop -
@@ -254,7 +324,7 @@ class Suggestions extends Component<SuggestionsProps> {
 
         const maxNumSuggestions = Math.min(
             Math.floor(maxHeight / this.rowHeight),
-            this.allOptions.length - this.state.fromIndex
+            this.numOptions - this.state.fromIndex
         );
 
         const currentRangeStart = this.state.fromIndex;
@@ -331,7 +401,7 @@ class Suggestions extends Component<SuggestionsProps> {
     }
 
     private decorateOption(
-        option: Option,
+        option: Suggestion,
         treeNodeSelection: TreeNodeSelection
     ): React.ReactNode {
         const regexName = RegExp(
@@ -407,55 +477,68 @@ class Suggestions extends Component<SuggestionsProps> {
         } = this.props;
         if (treeNodeSelection === undefined) return "";
         if (!treeNodeSelection.focussedNodeNameContainsWildcard()) {
-            const options = this.allOptions.slice(
+            const options = this.getOptions(
                 this.state.fromIndex,
                 this.state.fromIndex + Math.ceil(maxHeight / this.rowHeight)
             );
             return (
                 <Fragment>
-                    {options.map((option, i) => (
-                        <div
-                            key={option.nodeName}
-                            onMouseEnter={(): void =>
-                                this.maybeMarkSuggestionAsHovered(
-                                    i + this.state.fromIndex
-                                )
-                            }
-                            data-use={option.nodeName}
-                            data-index={i}
-                            className={classNames({
-                                Suggestions__Suggestion: true,
-                                Suggestions__Icon:
-                                    option.metaData.icon !== undefined,
-                                "Suggestions__Suggestion--Selected":
-                                    i ==
-                                    this.currentlySelectedSuggestionIndex -
-                                        this.state.fromIndex,
-                            })}
-                            style={{
-                                color:
-                                    option.metaData.color !== undefined
-                                        ? option.metaData.color
-                                        : "inherit",
-                                backgroundImage:
-                                    option.metaData.icon !== undefined
-                                        ? "url(" + option.metaData.icon + ")"
-                                        : "none",
-                                height: this.rowHeight + "px",
-                            }}
-                            onMouseDown={() => disableInputBlur()}
-                            onMouseUp={() => enableInputBlur()}
-                            onClick={(e): void => {
-                                this.useSuggestion(e, option.nodeName);
-                                e.preventDefault();
-                                e.stopPropagation();
-                            }}
-                            title={`${option.nodeName} - ${option.metaData.description}`}
-                        >
-                            {this.decorateOption(option, treeNodeSelection)}
-                        </div>
-                    ))}
-                    {options.length === 0 && (
+                    {options.map((option, i) =>
+                        option === undefined ? (
+                            <div
+                                key={`loading-${i + this.state.fromIndex}`}
+                                className="Suggestions__Suggestion"
+                                style={{ height: this.rowHeight + "px" }}
+                            />
+                        ) : (
+                            <div
+                                key={option.nodeName}
+                                onMouseEnter={(): void =>
+                                    this.maybeMarkSuggestionAsHovered(
+                                        i + this.state.fromIndex
+                                    )
+                                }
+                                data-use={option.nodeName}
+                                data-index={i}
+                                className={classNames({
+                                    Suggestions__Suggestion: true,
+                                    Suggestions__Icon:
+                                        option.metaData.icon !== undefined,
+                                    "Suggestions__Suggestion--Selected":
+                                        i ==
+                                        this.currentlySelectedSuggestionIndex -
+                                            this.state.fromIndex,
+                                })}
+                                style={{
+                                    color:
+                                        option.metaData.color !== undefined
+                                            ? option.metaData.color
+                                            : "inherit",
+                                    backgroundImage:
+                                        option.metaData.icon !== undefined
+                                            ? "url(" +
+                                              option.metaData.icon +
+                                              ")"
+                                            : "none",
+                                    height: this.rowHeight + "px",
+                                }}
+                                onMouseDown={() => disableInputBlur()}
+                                onMouseUp={() => enableInputBlur()}
+                                onClick={(e): void => {
+                                    this.useSuggestion(e, option.nodeName);
+                                    e.preventDefault();
+                                    e.stopPropagation();
+                                }}
+                                title={`${option.nodeName} - ${option.metaData.description}`}
+                            >
+                                {this.decorateOption(
+                                    option,
+                                    treeNodeSelection
+                                )}
+                            </div>
+                        )
+                    )}
+                    {options.length === 0 && !this.loadingOptions && (
                         <div className="Suggestions__NoSuggestions">
                             No options available...
                         </div>
@@ -483,15 +566,15 @@ class Suggestions extends Component<SuggestionsProps> {
                 : 200);
         const height = Math.min(
             maxHeight,
-            this.allOptions.length * this.rowHeight
+            this.numOptions * this.rowHeight
         );
         let lowerSpacerHeight =
-            this.allOptions.length * this.rowHeight -
+            this.numOptions * this.rowHeight -
             this.upperSpacerHeight -
             Math.floor(height / this.rowHeight) * this.rowHeight;
         if (
             Math.ceil(height / this.rowHeight) ==
-            this.allOptions.length - this.state.fromIndex
+            this.numOptions - this.state.fromIndex
         ) {
             lowerSpacerHeight = 0;
         }
@@ -9,7 +9,11 @@ import TreeData, { MatchType } from "./utils/TreeData";
 import TreeNodeSelection from "./utils/TreeNodeSelection";
 import SmartNodeSelectorComponent from "./components/SmartNodeSelectorComponent";
 
-import type { TreeDataNode, TreeDataNodeMetaData } from "./utils/TreeDataNodeTypes";
+import type {
+    FlatTreeData,
+    TreeDataNode,
+    TreeDataNodeMetaData,
+} from "./utils/TreeDataNodeTypes";
 import type { SmartNodeSelectorPropsType } from "./components/SmartNodeSelectorComponent";
 
 export { SmartNodeSelector } from "./SmartNodeSelector";
@@ -20,4 +24,9 @@ export {
     TreeNodeSelection,
 };
 
-export type { SmartNodeSelectorPropsType, TreeDataNode, TreeDataNodeMetaData };
+export type {
+    SmartNodeSelectorPropsType,
+    FlatTreeData,
+    TreeDataNode,
+    TreeDataNodeMetaData,
+};
@@ -0,0 +1,403 @@
+/**
+ * Copyright (c) 2021- Equinor ASA
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+import TreeData from "./TreeData";
+import { TreeDataNodeMetaData } from "./TreeDataNodeTypes";
+
+/**
+ * The nodes of a tree, as needed for finding suggestions. Nodes are given in
+ * the order they were added to the tree data, `parents` holding the index of
+ * each node's parent (-1 for top level nodes).
+ */
+export type SuggestionNodes = {
+    names: string[];
+    parents: number[];
+    descriptions: (string | undefined)[];
+};
+
+export type Suggestion = { nodeName: string; metaData: TreeDataNodeMetaData };
+
+type EngineSuggestion = { index: number; nodeName: string };
+
+/**
+ * Creates the engine finding the suggestions for a node path, using the same
+ * matching as `TreeData.findSuggestions`.
+ *
+ * The results for each search term typed for the same parent node path are
+ * cached, such that a longer search term only has to be matched against the
+ * results of the previous, shorter one, instead of against all nodes.
+ *
+ * NOTE: This function runs in a web worker, created from its source code. It
+ * must not refer to anything outside of itself.
+ */
+export const createSuggestionEngine = (
+    delimiter: string,
+    allowOrOperator: boolean
+) => {
+    const MAX_CACHED_SEARCH_TERMS = 64;
+
+    const names: string[] = [];
+    const descriptions: (string | undefined)[] = [];
+    const children: Map<number, number[]> = new Map();
+
+    let parentPathKey: string | null = null;
+    let candidates: number[] = [];
+    const searchTermMatches: Map<string, number[]> = new Map();
+    let result: number[] = [];
+
+    const escapeRegExp = (string: string): string =>
+        string.replace(/[-[\]{}()+.,\\^$|#]/g, "\\$&");
+
+    const replaceAll = (str: string, find: string, replace: string): string =>
+        str.split(find).join(replace);
+
+    const orStatements = RegExp(
+        `^(([^${delimiter}\\|]+\\|)+([^${delimiter}\\|]+){1})$`
+    );
+
+    const adjustNodeName = (nodeName: string): string => {
+        const adjusted = replaceAll(
+            replaceAll(
+                replaceAll(escapeRegExp(nodeName), ":", ""),
+                "*",
+                '[^:"]*'
+            ),
+            "?",
+            "."
+        );
+        if (allowOrOperator) {
+            const match = adjusted.match(orStatements);
+            if (match && match[1] !== "") {
+                return `(${replaceAll(match[1], "\\|", "|")})`;
+            }
+        }
+        return adjusted;
+    };
+
+    const makeRegExp = (pattern: string, flags?: string): RegExp | null => {
+        try {
+            return RegExp(pattern, flags);
+        } catch {
+            return null;
+        }
+    };
+
+    const findCandidates = (parentPath: string[]): number[] => {
+        let level = [-1];
+        for (const nodeName of parentPath) {
+            const re = /[*?|]/.test(nodeName)
+                ? makeRegExp(`^${adjustNodeName(nodeName)}$`)
+                : null;
+            const nextLevel: number[] = [];
+            for (const parent of level) {
+                for (const child of children.get(parent) || []) {
+                    if (
+                        re ? re.test(names[child]) : names[child] === nodeName
+                    ) {
+                        nextLevel.push(child);
+                    }
+                }
+            }
+            level = nextLevel;
+        }
+        const nodes: number[] = [];
+        for (const parent of level) {
+            for (const child of children.get(parent) || []) {
+                nodes.push(child);
+            }
+        }
+        // Children of different parents matched by wildcards, in tree order
+        return level.length > 1 ? nodes.sort((a, b) => a - b) : nodes;
+    };
+
+    const findMatches = (searchTerm: string): number[] => {
+        const cached = searchTermMatches.get(searchTerm);
+        if (cached) {
+            return cached;
+        }
+
+        // A node matching a search term also matches all prefixes of it, except
+        // when OR statements are involved
+        let nodes = candidates;
+        if (!searchTerm.includes("|")) {
+            let longestPrefix = "";
+            searchTermMatches.forEach((matches, prefix) => {
+                if (
+                    !prefix.includes("|") &&
+                    searchTerm.startsWith(prefix) &&
+                    prefix.length >= longestPrefix.length
+                ) {
+                    longestPrefix = prefix;
+                    nodes = matches;
+                }
+            });
+        }
+
+        let matches = nodes;
+        if (searchTerm !== "") {
+            const re = makeRegExp(adjustNodeName(searchTerm), "i");
+            matches = nodes.filter((node) => {
+                const description = descriptions[node];
+                return (
+                    re !== null &&
+                    (re.test(names[node]) ||
+                        (description !== undefined && re.test(description)))
+                );
+            });
+        }
+
+        if (searchTermMatches.size >= MAX_CACHED_SEARCH_TERMS) {
+            searchTermMatches.delete(
+                searchTermMatches.keys().next().value as string
+            );
+        }
+        searchTermMatches.set(searchTerm, matches);
+        return matches;
+    };
+
+    const page = (from: number, count: number): EngineSuggestion[] =>
+        result.slice(from, from + count).map((node) => ({
+            index: node,
+            nodeName: names[node],
+        }));
+
+    return {
+        addNodes: (nodes: SuggestionNodes): void => {
+            for (let i = 0; i < nodes.names.length; i++) {
+                const node = names.length;
+                names.push(nodes.names[i]);
+                descriptions.push(nodes.descriptions[i]);
+                const siblings = children.get(nodes.parents[i]);
+                if (siblings) {
+                    siblings.push(node);
+                } else {
+                    children.set(nodes.parents[i], [node]);
+                }
+            }
+            parentPathKey = null;
+            searchTermMatches.clear();
+        },
+
+        /**
+         * Finds the suggestions for the last node name in the node path, and
+         * returns their number and the first `count` of them. Suggestions with
+         * the same node name are only included once.
+         */
+        query: (
+            nodePath: string[],
+            count: number
+        ): { total: number; suggestions: EngineSuggestion[] } => {
+            if (nodePath.length === 0) {
+                result = [];
+                return { total: 0, suggestions: [] };
+            }
+            const parentPath = nodePath.slice(0, -1);
+            const key = parentPath.join(delimiter);
+            if (key !== parentPathKey) {
+                parentPathKey = key;
+                candidates = findCandidates(parentPath);
+                searchTermMatches.clear();
+            }
+
+            const nodeNames: Set<string> = new Set();
+            result = [];
+            for (const node of findMatches(nodePath[nodePath.length - 1])) {
+                if (!nodeNames.has(names[node])) {
+                    nodeNames.add(names[node]);
+                    result.push(node);
+                }
+            }
+            return { total: result.length, suggestions: page(0, count) };
+        },
+
+        /**
+         * Returns `count` suggestions of the last query, starting at `from`.
+         */
+        page: page,
+    };
+};
+
+type SuggestionEngine = ReturnType<typeof createSuggestionEngine>;
+type SuggestionEngineMethod = keyof SuggestionEngine;
+
+type Request = {
+    method: SuggestionEngineMethod;
+    args: unknown[];
+    resolve: (result: unknown) => void;
+};
+
+const WORKER_SOURCE = `
+let engine = null;
+self.onmessage = (event) => {
+    const { id, method, args } = event.data;
+    if (method === "init") {
+        engine = (${createSuggestionEngine.toString()})(...args);
+        return;
+    }
+    const result = engine[method](...args);
+    if (id !== null) {
+        self.postMessage({ id: id, result: result });
+    }
+};
+`;
+
+let workerUrl: string | null = null;
+
+/**
+ * Finds suggestions for the nodes in the given tree data in a web worker,
+ * such that typing is not blocked by matching the nodes of large trees.
+ * Falls back to finding them on the main thread if workers are not available,
+ * e.g. when workers from blob URLs are not allowed by the content security
+ * policy.
+ *
+ * Nodes added to the tree data after creating the client, e.g. loaded lazy
+ * children, are sent to the worker with the next query.
+ */
+export default class SuggestionEngineClient {
+    private treeData: TreeData;
+    private delimiter: string;
+    private allowOrOperator: boolean;
+    private worker: Worker | null;
+    private engine: SuggestionEngine | null;
+    private numSentNodes: number;
+    private nextRequestId: number;
+    private requests: Map<number, Request>;
+
+    constructor(treeData: TreeData) {
+        this.treeData = treeData;
+        this.delimiter = treeData.getDelimiter();
+        this.allowOrOperator = treeData.allowsOrOperator();
+        this.worker = null;
+        this.engine = null;
+        this.numSentNodes = 0;
+        this.nextRequestId = 0;
+        this.requests = new Map();
+
+        try {
+            if (workerUrl === null) {
+                workerUrl = URL.createObjectURL(
+                    new Blob([WORKER_SOURCE], {
+                        type: "application/javascript",
+                    })
+                );
+            }
+            this.worker = new Worker(workerUrl);
+            this.worker.onmessage = (
+                event: MessageEvent<{ id: number; result: unknown }>
+            ) => {
+                const request = this.requests.get(event.data.id);
+                this.requests.delete(event.data.id);
+                request?.resolve(event.data.result);
+            };
+            this.worker.onerror = () => this.fallBackToMainThread();
+            this.worker.postMessage({
+                id: null,
+                method: "init",
+                args: [this.delimiter, this.allowOrOperator],
+            });
+        } catch {
+            this.fallBackToMainThread();
+        }
+    }
+
+    query(
+        nodePath: string[],
+        count: number
+    ): Promise<{ total: number; suggestions: Suggestion[] }> {
+        return this.call("query", [nodePath, count]).then((result) => {
+            const { total, suggestions } = result as {
+                total: number;
+                suggestions: EngineSuggestion[];
+            };
+            return {
+                total: total,
+                suggestions: this.withMetaData(suggestions),
+            };
+        });
+    }
+
+    page(from: number, count: number): Promise<Suggestion[]> {
+        return this.call("page", [from, count]).then((suggestions) =>
+            this.withMetaData(suggestions as EngineSuggestion[])
+        );
+    }
+
+    terminate(): void {
+        this.worker?.terminate();
+        this.worker = null;
+        this.requests.clear();
+    }
+
+    private withMetaData(suggestions: EngineSuggestion[]): Suggestion[] {
+        return suggestions.map((suggestion) => ({
+            nodeName: suggestion.nodeName,
+            metaData: this.treeData.getNodeMetaData(suggestion.index),
+        }));
+    }
+
+    private call(
+        method: SuggestionEngineMethod,
+        args: unknown[]
+    ): Promise<unknown> {
+        const numNodes = this.treeData.getNumNodes();
+        if (numNodes > this.numSentNodes) {
+            this.send(null, "addNodes", [
+                this.treeData.getSuggestionNodes(this.numSentNodes),
+            ]);
+            this.numSentNodes = numNodes;
+        }
+
+        if (this.engine) {
+            return Promise.resolve(this.callEngine(method, args));
+        }
+        const id = this.nextRequestId++;
+        return new Promise((resolve) => {
+            this.requests.set(id, { method: method, args: args, resolve });
+            this.send(id, method, args);
+        });
+    }
+
+    private send(
+        id: number | null,
+        method: SuggestionEngineMethod,
+        args: unknown[]
+    ): void {
+        if (this.worker) {
+            this.worker.postMessage({ id: id, method: method, args: args });
+        } else {
+            this.callEngine(method, args);
+        }
+    }
+
+    private callEngine(
+        method: SuggestionEngineMethod,
+        args: unknown[]
+    ): unknown {
+        const engineMethod = (this.engine as SuggestionEngine)[method] as (
+            ...args: unknown[]
+        ) => unknown;
+        return engineMethod(...args);
+    }
+
+    private fallBackToMainThread(): void {
+        this.worker?.terminate();
+        this.worker = null;
+        this.engine = createSuggestionEngine(
+            this.delimiter,
+            this.allowOrOperator
+        );
+        this.engine.addNodes(this.treeData.getSuggestionNodes(0));
+        this.numSentNodes = this.treeData.getNumNodes();
+
+        // Requests not yet answered by the worker
+        const requests = Array.from(this.requests.values());
+        this.requests.clear();
+        requests.forEach((request) =>
+            request.resolve(this.callEngine(request.method, request.args))
+        );
+    }
+}
@@ -5,7 +5,13 @@
  * LICENSE file in the root directory of this source tree.
  */
 
-import { TreeDataNode, TreeDataNodeMetaData } from "./TreeDataNodeTypes";
+import {
+    FlatTreeData,
+    TreeDataNode,
+    TreeDataNodeInputMetaData,
+    TreeDataNodeMetaData,
+} from "./TreeDataNodeTypes";
+import { SuggestionNodes } from "./SuggestionEngine";
 
 export enum MatchType {
     openMatch = 0,
@@ -13,96 +19,372 @@ export enum MatchType {
     partialMatch,
 }
 
+/**
+ * Node in the prefix tree (trie) index over all node paths,
+ * used for fast lookup of paths without wildcards or OR statements.
+ */
+type TreeIndexNode = {
+    index: number;
+    children: Map<string, TreeIndexNode>;
+};
+
+type NodeMatches = {
+    nodePaths: string[];
+    metaData: TreeDataNodeMetaData[][];
+};
+
+const MAX_CACHED_FULL_MATCHES = 1000;
+
 export default class TreeData {
-    private treeData: TreeDataNode[];
     private delimiter: string;
     private stringifiedData: string;
+    private stringifiedDataIsOutdated: boolean;
+    private leafNodePaths: Map<number, string>;
+    private innerNodePaths: Map<number, string>;
     private nodeData: TreeDataNodeMetaData[];
+    private nodeNames: string[];
+    private nodeParents: number[];
+    private treeIndex: TreeIndexNode;
+    private hasDuplicateSiblings: boolean;
+    private lazyNodes: Set<number>;
     private allowOrOperator: boolean;
+    private fullMatches: Map<string, NodeMatches>;
 
     constructor({
         treeData,
         delimiter,
         allowOrOperator,
     }: {
-        treeData: TreeDataNode[];
+        treeData: TreeDataNode[] | FlatTreeData;
         delimiter: string;
         allowOrOperator: boolean;
     }) {
-        this.treeData = treeData;
         this.delimiter = delimiter;
         this.nodeData = [];
+        this.nodeNames = [];
+        this.nodeParents = [];
         this.stringifiedData = "";
+        this.stringifiedDataIsOutdated = false;
+        this.leafNodePaths = new Map();
+        this.innerNodePaths = new Map();
+        this.treeIndex = { index: -1, children: new Map() };
+        this.hasDuplicateSiblings = false;
+        this.lazyNodes = new Set();
         this.allowOrOperator = allowOrOperator;
+        this.fullMatches = new Map();
 
-        this.populateNodes();
+        if (Array.isArray(treeData)) {
+            this.populateNodes(treeData, this.treeIndex);
+        } else {
+            this.populateNodesFromFlatData(treeData);
+        }
     }
 
-    private populateNodes(): void {
-        let indexCount = 0;
-        let stringifiedData = "";
-        const nodeData: TreeDataNodeMetaData[] = [];
-        const delimiter = this.delimiter;
-        const populateNode = (
-            indices: number[] = [],
-            nodePath: string
-        ): void => {
-            if (indices.length == 0) {
-                throw "Indices array must at least have one element";
+    private populateNodes(
+        treeData: TreeDataNode[],
+        parent: TreeIndexNode
+    ): void {
+        // Iterative depth-first traversal, adding the nodes in pre-order
+        const stack: { node: TreeDataNode; parent: TreeIndexNode }[] = [];
+        for (let i = treeData.length - 1; i >= 0; i--) {
+            stack.push({ node: treeData[i], parent: parent });
+        }
+        let item: { node: TreeDataNode; parent: TreeIndexNode } | undefined;
+        while ((item = stack.pop()) !== undefined) {
+            const indexNode = this.addNode(item.parent, item.node);
+            const children = item.node.children;
+            if (children) {
+                for (let i = children.length - 1; i >= 0; i--) {
+                    stack.push({ node: children[i], parent: indexNode });
+                }
             }
-            let node: TreeDataNode = this.treeData[indices[0]];
-            for (let i = 1; i < indices.length; i++) {
-                if (node.children) node = node.children[indices[i]];
-                else throw "Implementation error";
+        }
+    }
+
+    private populateNodesFromFlatData(flatData: FlatTreeData): void {
+        const indexNodes: TreeIndexNode[] = [];
+        for (let i = 0; i < flatData.names.length; i++) {
+            const parentIndex = flatData.parents[i];
+            if (parentIndex >= i) {
+                throw "Flat tree data must be given in pre-order.";
             }
-            if (
-                node.name === "" ||
-                node.name === undefined ||
-                node.name === null
-            ) {
-                const path =
-                    nodePath.replace(/\{[0-9]+\}/g, "") +
-                    (nodePath !== "" ? delimiter : "") +
-                    node.name;
-                throw `
+            const metaData =
+                flatData.metaData && flatData.metaData[i.toString()];
+            indexNodes.push(
+                this.addNode(
+                    parentIndex < 0 ? this.treeIndex : indexNodes[parentIndex],
+                    { ...metaData, name: flatData.names[i] }
+                )
+            );
+        }
+    }
+
+    /**
+     * Adds a node as the last child of the given parent node.
+     * Nodes can be added at any time, which allows the tree to be built incrementally.
+     */
+    private addNode(
+        parent: TreeIndexNode,
+        node: TreeDataNodeInputMetaData & { name: string }
+    ): TreeIndexNode {
+        if (node.name === "" || node.name === undefined || node.name === null) {
+            const parentPath = this.getNodePath(parent.index);
+            const path =
+                this.cleanNodeName(parentPath) +
+                (parentPath !== "" ? this.delimiter : "") +
+                node.name;
+            throw `
                     Empty/invalid strings are not allowed as names of nodes:
                     "${path}"
                     ${Array(path.length + 2).join("\u00A0")}^`;
+        }
+
+        let parentPath = "";
+        if (parent.index !== -1) {
+            const parentData = this.nodeData[parent.index];
+            parentPath = this.getNodePath(parent.index);
+            if (parentData.numChildren === 0) {
+                this.leafNodePaths.delete(parent.index);
+                this.innerNodePaths.set(parent.index, parentPath);
             }
-            nodeData.push({
-                id: node.id,
-                description: node.description,
-                color: node.color,
-                icon: node.icon,
-                numChildren: node.children ? node.children.length : 0,
+            parentData.numChildren++;
+            parentPath += this.delimiter;
+        }
+
+        const index = this.nodeData.length;
+        this.nodeData.push({
+            id: node.id,
+            description: node.description,
+            color: node.color,
+            icon: node.icon,
+            numChildren: 0,
+        });
+        this.nodeNames.push(node.name);
+        this.nodeParents.push(parent.index);
+        this.leafNodePaths.set(index, `${parentPath}{${index}}${node.name}`);
+        this.stringifiedDataIsOutdated = true;
+        this.fullMatches.clear();
+        if (node.lazyChildren) {
+            this.lazyNodes.add(index);
+        }
+
+        const indexNode: TreeIndexNode = { index: index, children: new Map() };
+        if (parent.children.has(node.name)) {
+            this.hasDuplicateSiblings = true;
+        } else {
+            parent.children.set(node.name, indexNode);
+        }
+        return indexNode;
+    }
+
+    private getNodePath(index: number): string {
+        if (index === -1) {
+            return "";
+        }
+        const leafNodePath = this.leafNodePaths.get(index);
+        return leafNodePath !== undefined
+            ? leafNodePath
+            : (this.innerNodePaths.get(index) as string);
+    }
+
+    /**
+     * All leaf node paths, each on the form "{index}name:{index}name",
+     * separated by spaces. Used for regular expression based matching.
+     */
+    private getStringifiedData(): string {
+        if (this.stringifiedDataIsOutdated) {
+            let stringifiedData = "";
+            this.leafNodePaths.forEach((path, index) => {
+                // Nodes with children not yet loaded are not complete node paths
+                stringifiedData += this.lazyNodes.has(index)
+                    ? `"${path}${this.delimiter}" `
+                    : `"${path}" `;
             });
-            const index = indexCount++;
-            if (node.children && node.children.length > 0) {
-                for (let i = 0; i < node.children.length; i++) {
-                    populateNode(
-                        [...indices, i],
-                        `${nodePath}${
-                            nodePath != "" ? delimiter : ""
-                        }{${index}}${node.name}`
-                    );
-                }
-            } else {
-                stringifiedData += `"${nodePath}${
-                    nodePath !== "" ? delimiter : ""
-                }{${index}}${node.name}" `;
+            this.stringifiedData = stringifiedData;
+            this.stringifiedDataIsOutdated = false;
+        }
+        return this.stringifiedData;
+    }
+
+    /**
+     * Looks up the nodes along the given node path in the trie index.
+     * Returns undefined if the lookup can not be done using the index, i.e. if
+     * the node path contains wildcards or OR statements, or if the tree has
+     * siblings with identical names. In these cases, regular expression based
+     * matching has to be used instead.
+     */
+    private findIndexNodes(nodePath: string[]): TreeIndexNode[] | null | undefined {
+        if (
+            this.hasDuplicateSiblings ||
+            nodePath.some((nodeName) => /[*?:|]/.test(nodeName))
+        ) {
+            return undefined;
+        }
+        const indexNodes: TreeIndexNode[] = [];
+        let indexNode: TreeIndexNode | undefined = this.treeIndex;
+        for (const nodeName of nodePath) {
+            indexNode = indexNode.children.get(nodeName);
+            if (indexNode === undefined) {
+                return null;
             }
+            indexNodes.push(indexNode);
+        }
+        return indexNodes;
+    }
+
+    /**
+     * Looks up the given node path in the trie index, requiring it to end in a leaf node.
+     * See `findIndexNodes` for return values.
+     */
+    private findLeafIndexNodes(
+        nodePath: string[]
+    ): TreeIndexNode[] | null | undefined {
+        const indexNodes = this.findIndexNodes(nodePath);
+        if (
+            indexNodes &&
+            (indexNodes.length === 0 ||
+                this.nodeData[indexNodes[indexNodes.length - 1].index]
+                    .numChildren > 0 ||
+                this.lazyNodes.has(indexNodes[indexNodes.length - 1].index))
+        ) {
+            return null;
+        }
+        return indexNodes;
+    }
+
+    /**
+     * Looks up the node with the given exact node path in the trie index,
+     * using the first one of any siblings with identical names.
+     */
+    private findIndexNode(nodePath: string[]): TreeIndexNode | null {
+        let indexNode = this.treeIndex;
+        for (const nodeName of nodePath) {
+            const childIndexNode = indexNode.children.get(nodeName);
+            if (childIndexNode === undefined) {
+                return null;
+            }
+            indexNode = childIndexNode;
+        }
+        return indexNode;
+    }
+
+    getDelimiter(): string {
+        return this.delimiter;
+    }
+
+    allowsOrOperator(): boolean {
+        return this.allowOrOperator;
+    }
+
+    getNumNodes(): number {
+        return this.nodeData.length;
+    }
+
+    getNodeMetaData(index: number): TreeDataNodeMetaData {
+        return this.nodeData[index];
+    }
+
+    /**
+     * The nodes added from the given node index on, as used by the
+     * suggestion engine.
+     */
+    getSuggestionNodes(fromIndex = 0): SuggestionNodes {
+        return {
+            names: this.nodeNames.slice(fromIndex),
+            parents: this.nodeParents.slice(fromIndex),
+            descriptions: this.nodeData
+                .slice(fromIndex)
+                .map((metaData) => metaData.description),
         };
-        for (let i = 0; i < this.treeData.length; i++) {
-            populateNode([i], "");
+    }
+
+    /**
+     * Adds the complete node paths matched by tags, as resolved on the server
+     * by `webviz_core_components.smart_node_selector.TagResolver`, such that
+     * the tags are not matched again. Tags with node paths not found in the
+     * tree data are ignored.
+     */
+    addResolvedTags(resolvedTags: { [tag: string]: string[] }): void {
+        if (this.hasDuplicateSiblings) {
+            return;
+        }
+        tags: for (const tag of Object.keys(resolvedTags)) {
+            const metaData: TreeDataNodeMetaData[][] = [];
+            for (const nodePath of resolvedTags[tag]) {
+                const indexNodes = this.findLeafIndexNodes(
+                    nodePath.split(this.delimiter)
+                );
+                if (!indexNodes) {
+                    continue tags;
+                }
+                metaData.push(indexNodes.map((el) => this.nodeData[el.index]));
+            }
+            this.cacheFullMatches(tag, {
+                nodePaths: resolvedTags[tag],
+                metaData: metaData,
+            });
+        }
+    }
+
+    private cacheFullMatches(key: string, matches: NodeMatches): void {
+        if (this.fullMatches.size >= MAX_CACHED_FULL_MATCHES) {
+            this.fullMatches.clear();
         }
-        this.stringifiedData = stringifiedData;
-        this.nodeData = nodeData;
-        if (nodeData.length != indexCount) {
-            throw "implementation error";
+        this.fullMatches.set(key, matches);
+    }
+
+    hasUnloadedChildNodes(nodePath: string[]): boolean {
+        const indexNode = this.findIndexNode(nodePath);
+        return indexNode !== null && this.lazyNodes.has(indexNode.index);
+    }
+
+    /**
+     * Returns the path of the first node along the given node path which has
+     * children not yet loaded, if the node path continues below it.
+     */
+    findUnloadedNodePath(nodePath: string[]): string[] | null {
+        let indexNode = this.treeIndex;
+        for (let i = 0; i < nodePath.length - 1; i++) {
+            const childIndexNode = indexNode.children.get(nodePath[i]);
+            if (childIndexNode === undefined) {
+                return null;
+            }
+            if (this.lazyNodes.has(childIndexNode.index)) {
+                return nodePath.slice(0, i + 1);
+            }
+            indexNode = childIndexNode;
         }
+        return null;
+    }
+
+    /**
+     * Adds the loaded children of a node marked with `lazyChildren`.
+     * Returns false if no such node with children not yet loaded exists.
+     */
+    addLoadedChildNodes(nodePath: string[], children: TreeDataNode[]): boolean {
+        const indexNode = this.findIndexNode(nodePath);
+        if (indexNode === null || !this.lazyNodes.has(indexNode.index)) {
+            return false;
+        }
+        this.lazyNodes.delete(indexNode.index);
+        this.stringifiedDataIsOutdated = true;
+        this.fullMatches.clear();
+        this.populateNodes(children, indexNode);
+        return true;
     }
 
     countMatchedNodes(nodePath: string[], exactMatch = false): number {
+        if (exactMatch) {
+            const matches = this.fullMatches.get(nodePath.join(this.delimiter));
+            if (matches !== undefined) {
+                return matches.nodePaths.length;
+            }
+            const indexNodes = this.findLeafIndexNodes(nodePath);
+            if (indexNodes !== undefined) {
+                return indexNodes === null ? 0 : 1;
+            }
+        }
+
         let nodePathString = "";
         const lastNode = this.adjustNodeName(nodePath[nodePath.length - 1]);
         for (let i = 0; i < nodePath.length - 1; i++) {
@@ -121,7 +403,7 @@ export default class TreeData {
 
         // Can be replaced with matchAll as soon as ECMAScript 2021 is declared standard in this project.
         // see: https://tc39.es/ecma262/#sec-string.prototype.matchall
-        while (re.exec(this.stringifiedData) !== null) {
+        while (re.exec(this.getStringifiedData()) !== null) {
             count++;
         }
         return count;
@@ -170,6 +452,19 @@ export default class TreeData {
         nodePath: string[],
         completeNodePath = true
     ): TreeDataNodeMetaData[] | null {
+        if (completeNodePath) {
+            const matches = this.fullMatches.get(nodePath.join(this.delimiter));
+            if (matches !== undefined) {
+                return matches.metaData.length > 0 ? matches.metaData[0] : null;
+            }
+            const indexNodes = this.findLeafIndexNodes(nodePath);
+            if (indexNodes !== undefined) {
+                return indexNodes === null
+                    ? null
+                    : indexNodes.map((el) => this.nodeData[el.index]);
+            }
+        }
+
         let nodePathString = "";
         for (let i = 0; i < nodePath.length; i++) {
             if (i > 0) {
@@ -178,7 +473,7 @@ export default class TreeData {
             nodePathString += `\\{(\\d+)\\}${this.adjustNodeName(nodePath[i])}`;
         }
         const re = RegExp(`"${nodePathString}${completeNodePath ? `"` : ``}`);
-        const match = this.stringifiedData.match(re);
+        const match = this.getStringifiedData().match(re);
         if (match === null) {
             return null;
         }
@@ -223,7 +518,7 @@ export default class TreeData {
         // Can be replaced with matchAll as soon as ECMAScript 2021 is declared standard in this project.
         // see: https://tc39.es/ecma262/#sec-string.prototype.matchall
         let match: RegExpExecArray | null;
-        while ((match = re.exec(this.stringifiedData)) !== null) {
+        while ((match = re.exec(this.getStringifiedData())) !== null) {
             const metaData = this.nodeData[parseInt(match[match.length - 2])];
             const searchTermRe = RegExp(
                 `.*?(${this.adjustNodeName(searchTerm)}).*?`,
@@ -253,6 +548,24 @@ export default class TreeData {
     findChildNodes(
         nodePath: string[]
     ): { nodeName: string; metaData: TreeDataNodeMetaData }[] {
+        const indexNodes = this.findIndexNodes(nodePath);
+        if (indexNodes !== undefined) {
+            if (indexNodes === null) {
+                return [];
+            }
+            const parent =
+                indexNodes.length === 0
+                    ? this.treeIndex
+                    : indexNodes[indexNodes.length - 1];
+            return Array.from(
+                parent.children,
+                ([nodeName, indexNode]) => ({
+                    nodeName: nodeName,
+                    metaData: this.nodeData[indexNode.index],
+                })
+            );
+        }
+
         let nodePathString = "";
         for (let i = 0; i < nodePath.length; i++) {
             nodePathString += `\\{(\\d+)\\}${this.adjustNodeName(nodePath[i])}${
@@ -274,7 +587,7 @@ export default class TreeData {
         // Can be replaced with matchAll as soon as ECMAScript 2021 is declared standard in this project.
         // see: https://tc39.es/ecma262/#sec-string.prototype.matchall
         let match: RegExpExecArray | null;
-        while ((match = re.exec(this.stringifiedData)) !== null) {
+        while ((match = re.exec(this.getStringifiedData())) !== null) {
             const count = nodeNames.size;
             nodeNames.add(match[nodePath.length + 1]);
             if (count == nodeNames.size) {
@@ -310,7 +623,7 @@ export default class TreeData {
 
         // Can be replaced with matchAll as soon as ECMAScript 2021 is declared standard in this project.
         // see: https://tc39.es/ecma262/#sec-string.prototype.matchall
-        const match = re.exec(this.stringifiedData);
+        const match = re.exec(this.getStringifiedData());
         if (match) {
             return match[match.length - 2];
         }
@@ -331,10 +644,45 @@ export default class TreeData {
         return indices;
     }
 
+    /**
+     * Finds the node paths matching the given node path. Complete node paths
+     * (`MatchType.fullMatch`) are cached, as they are looked up repeatedly for
+     * the selected tags.
+     */
     findNodes(
         nodePath: string[],
         matchType = MatchType.openMatch
-    ): { nodePaths: string[]; metaData: TreeDataNodeMetaData[][] } {
+    ): NodeMatches {
+        if (matchType !== MatchType.fullMatch) {
+            return this.matchNodes(nodePath, matchType);
+        }
+        const key = nodePath.join(this.delimiter);
+        let matches = this.fullMatches.get(key);
+        if (matches === undefined) {
+            matches = this.matchNodes(nodePath, matchType);
+            this.cacheFullMatches(key, matches);
+        }
+        return matches;
+    }
+
+    private matchNodes(
+        nodePath: string[],
+        matchType: MatchType
+    ): NodeMatches {
+        if (matchType === MatchType.fullMatch) {
+            const indexNodes = this.findLeafIndexNodes(nodePath);
+            if (indexNodes !== undefined) {
+                return indexNodes === null
+                    ? { nodePaths: [], metaData: [] }
+                    : {
+                          nodePaths: [nodePath.join(this.delimiter)],
+                          metaData: [
+                              indexNodes.map((el) => this.nodeData[el.index]),
+                          ],
+                      };
+            }
+        }
+
         let nodePathString = "";
         for (let i = 0; i < nodePath.length; i++) {
             if (i > 0) {
@@ -361,7 +709,7 @@ export default class TreeData {
         // Can be replaced with matchAll as soon as ECMAScript 2021 is declared standard in this project.
         // see: https://tc39.es/ecma262/#sec-string.prototype.matchall
         let match: RegExpExecArray | null;
-        while ((match = re.exec(this.stringifiedData)) !== null) {
+        while ((match = re.exec(this.getStringifiedData())) !== null) {
             const nodesInPath: TreeDataNodeMetaData[] = [];
             for (let i = 0; i < idGroupIndices.length; i++) {
                 const index = idGroupIndices[i] + 2;
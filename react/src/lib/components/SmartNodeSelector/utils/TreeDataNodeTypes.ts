@@ -12,6 +12,11 @@ export interface TreeDataNode {
     color?: string;
     icon?: string;
     children?: Array<TreeDataNode>;
+    /**
+     * Set if the node has children which are not included,
+     * but loaded on demand by the SmartNodeSelector.
+     */
+    lazyChildren?: boolean;
 }
 
 export interface TreeDataNodeMetaData {
@@ -21,3 +26,21 @@ export interface TreeDataNodeMetaData {
     icon?: string;
     numChildren: number;
 }
+
+export type TreeDataNodeInputMetaData = Omit<
+    TreeDataNodeMetaData,
+    "numChildren"
+> & { lazyChildren?: boolean };
+
+/**
+ * Tree data on flattened form, as e.g. created by the Python helper
+ * `webviz_core_components.smart_node_selector.flatten_tree_data`.
+ * Nodes are given in pre-order, `parents` holding the index of each node's
+ * parent (-1 for top level nodes). `metaData` is keyed by node index and only
+ * holds entries for nodes having meta data.
+ */
+export interface FlatTreeData {
+    names: string[];
+    parents: number[];
+    metaData?: { [index: string]: TreeDataNodeInputMetaData };
+}
@@ -62,6 +62,10 @@ export default class TreeNodeSelection {
         return this.delimiter;
     }
 
+    getTreeData(): TreeData {
+        return this.treeData;
+    }
+
     getNodePath(untilLevel?: number): Array<string> {
         if (untilLevel === undefined) {
             return this.nodePath;
@@ -350,6 +354,9 @@ export default class TreeNodeSelection {
 
     hasAvailableChildNodesOnNextLevel(): boolean {
         const adjustedNodePath = this.getNodePath(this.focussedLevel);
+        if (this.treeData.hasUnloadedChildNodes(adjustedNodePath)) {
+            return true;
+        }
         adjustedNodePath.push("");
         return this.treeData.findSuggestions(adjustedNodePath).length > 0;
     }
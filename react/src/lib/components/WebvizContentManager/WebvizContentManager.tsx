@@ -67,6 +67,7 @@ export enum StoreActions {
     AddOpenViewElementSettingsDialogId = "add_open_view_element_settings_dialog_id",
     RemoveOpenViewElementSettingsDialogId = "remove_open_view_element_settings_dialog_id",
     RemoveAllOpenViewElementSettingsDialogIds = "remove_all_open_view_element_settings_dialog_ids",
+    ActivateLazyView = "activate_lazy_view",
 }
 
 export type StoreState = {
@@ -84,6 +85,8 @@ export type StoreState = {
     activeViewDownloadCallback: () => void;
     fullScreenActions: FullScreenAction[];
     viewUpdates: number;
+    lazyViewIds: string[];
+    lazyViewBudget: number;
 };
 
 type StoredLocalState = {
@@ -161,11 +164,14 @@ type Payload = {
         settingsDialogId: string;
     };
     [StoreActions.RemoveAllOpenViewElementSettingsDialogIds]: undefined;
+    [StoreActions.ActivateLazyView]: {
+        id: string;
+    };
 };
 
 export type Actions = ActionMap<Payload>[keyof ActionMap<Payload>];
 
-const setInitialState = (): StoreState => {
+const setInitialState = (lazyViewBudget: number): StoreState => {
     return {
         activePluginId: "",
         pluginsData: [],
@@ -185,6 +191,8 @@ const setInitialState = (): StoreState => {
         },
         viewUpdates: 0,
         externalTrigger: false,
+        lazyViewIds: [],
+        lazyViewBudget: lazyViewBudget,
     };
 };
 
@@ -233,6 +241,12 @@ const readStoredGlobalState = (): StoredGlobalState | null => {
     return null;
 };
 
+const writeToLocalStorage = (key: string, value: string): void => {
+    if (localStorage.getItem(key) !== value) {
+        localStorage.setItem(key, value);
+    }
+};
+
 const storeLocalState = (
     activePluginId: string,
     openSettingsGroupIds: string[],
@@ -243,14 +257,14 @@ const storeLocalState = (
         openSettingsGroupIds: openSettingsGroupIds,
         activeViewId: activeViewId,
     };
-    localStorage.setItem(makeLocalStoreId(), JSON.stringify(data));
+    writeToLocalStorage(makeLocalStoreId(), JSON.stringify(data));
 };
 
 const storeGlobalState = (settingsDrawerOpen: boolean): void => {
     const data = {
         settingsDrawerOpen: settingsDrawerOpen,
     };
-    localStorage.setItem(makeGlobalStoreId(), JSON.stringify(data));
+    writeToLocalStorage(makeGlobalStoreId(), JSON.stringify(data));
 };
 
 export const StoreReducer = (
@@ -428,6 +442,15 @@ export const StoreReducer = (
             openViewElementSettingsDialogIds: [],
         };
     }
+    if (action.type === StoreActions.ActivateLazyView) {
+        return {
+            ...state,
+            lazyViewIds: [
+                ...state.lazyViewIds.filter((id) => id !== action.payload.id),
+                action.payload.id,
+            ],
+        };
+    }
     return state;
 };
 
@@ -449,6 +472,8 @@ type WebvizContentManagerProps = {
     activeViewId?: string;
     initiallyActivePluginId?: string;
     initiallyActiveViewId?: string;
+    lazyViewBudget?: number;
+    debounce_time_ms?: number;
     children?: React.ReactNode;
     setProps?: (props: WebvizContentManagerParentProps) => void;
 };
@@ -458,12 +483,56 @@ export const WebvizContentManager: React.FC<WebvizContentManagerProps> = (
 ) => {
     const [state, dispatch] = React.useReducer(
         StoreReducer,
-        null,
+        props.lazyViewBudget ?? -1,
         setInitialState
     );
     const [lastLocation, setLastLocation] =
         React.useState<Location | null>(null);
 
+    const reportedProps =
+        React.useRef<WebvizContentManagerParentProps | null>(null);
+    const debounceTimer =
+        React.useRef<ReturnType<typeof setTimeout> | null>(null);
+
+    React.useEffect(() => {
+        return () => {
+            if (debounceTimer.current) {
+                clearTimeout(debounceTimer.current);
+            }
+        };
+    }, []);
+
+    // Reports the active ids to Dash if they changed since last reported,
+    // coalescing changes within the debounce time into one update.
+    const reportActiveIds = React.useCallback(
+        (activePluginId: string, activeViewId: string) => {
+            if (debounceTimer.current) {
+                clearTimeout(debounceTimer.current);
+                debounceTimer.current = null;
+            }
+            const report = () => {
+                if (
+                    !props.setProps ||
+                    (reportedProps.current?.activePluginId === activePluginId &&
+                        reportedProps.current?.activeViewId === activeViewId)
+                ) {
+                    return;
+                }
+                reportedProps.current = { activePluginId, activeViewId };
+                props.setProps({ activePluginId, activeViewId });
+            };
+            if (props.debounce_time_ms) {
+                debounceTimer.current = setTimeout(
+                    report,
+                    props.debounce_time_ms
+                );
+            } else {
+                report();
+            }
+        },
+        [props.setProps, props.debounce_time_ms]
+    );
+
     React.useEffect(() => {
         const activePluginId = state.activePluginId;
         const activeViewId = state.pluginsData.find(
@@ -514,12 +583,7 @@ export const WebvizContentManager: React.FC<WebvizContentManagerProps> = (
                 },
             });
 
-            if (props.setProps) {
-                props.setProps({
-                    activeViewId: checkedActiveViewId,
-                    activePluginId: checkedActivePluginId,
-                });
-            }
+            reportActiveIds(checkedActivePluginId, checkedActiveViewId);
         } else {
             if (activePluginId && activeViewId) {
                 storeLocalState(
@@ -527,15 +591,7 @@ export const WebvizContentManager: React.FC<WebvizContentManagerProps> = (
                     state.openSettingsGroupIds,
                     activeViewId
                 );
-                if (props.setProps) {
-                    props.setProps({
-                        activeViewId:
-                            state.pluginsData.find(
-                                (plugin) => plugin.id === state.activePluginId
-                            )?.activeViewId || "",
-                        activePluginId: state.activePluginId,
-                    });
-                }
+                reportActiveIds(activePluginId, activeViewId);
             }
         }
         setLastLocation(location);
@@ -560,6 +616,18 @@ WebvizContentManager.propTypes = {
     id: PropTypes.string.isRequired,
     activePluginId: PropTypes.string,
     activeViewId: PropTypes.string,
+    /**
+     * The number of inactive `WebvizLazyView`s kept mounted. The children of
+     * the least recently active views beyond this are dropped, and loaded again
+     * when the view is activated. -1 keeps all of them.
+     */
+    lazyViewBudget: PropTypes.number,
+    /**
+     * Debounce time for reporting changes of `activePluginId` and
+     * `activeViewId`. Changes within the configured number of milliseconds
+     * are reported to Dash as one update.
+     */
+    debounce_time_ms: PropTypes.number,
     children: PropTypes.node,
     setProps: PropTypes.func,
 };
@@ -0,0 +1,69 @@
+import React from "react";
+import PropTypes from "prop-types";
+
+import { Figure, resolveFigureTemplate } from "../../utils/graphTemplates";
+
+/**
+ * The default config of `wcc.Graph` (`_DEFAULT_CONFIG` in
+ * webviz_core_components/wrapped_components/graph.py), which graphs created
+ * with `browser_config_defaults=True` are sent without.
+ */
+export const defaultGraphConfig: Record<string, unknown> = {
+    modeBarButtonsToRemove: ["sendDataToCloud"],
+    displaylogo: false,
+    responsive: true,
+};
+
+export type WebvizGraphProps = {
+    id?: string;
+    figure?: Figure;
+    config?: Record<string, unknown>;
+    setProps?: (props: Record<string, unknown>) => void;
+    [prop: string]: unknown;
+};
+
+/**
+ * Renders a `dcc.Graph`, with a template name given as `layout.template` in the
+ * figure replaced by the template registered by `WebvizGraphTemplates`, and the
+ * default config values not given in `config` added. Used by `wcc.Graph` when
+ * given a `template` or `browser_config_defaults=True`, with all other props
+ * passed on to `dcc.Graph`.
+ */
+export const WebvizGraph: React.FC<WebvizGraphProps> = (props) => {
+    const figure = React.useMemo(
+        () => resolveFigureTemplate(props.figure),
+        [props.figure]
+    );
+    const config = React.useMemo(
+        () => ({ ...defaultGraphConfig, ...props.config }),
+        [props.config]
+    );
+
+    const Graph = window.dash_core_components.Graph;
+    return <Graph {...props} figure={figure} config={config} />;
+};
+
+WebvizGraph.propTypes = {
+    /**
+     * The ID used to identify this component in Dash callbacks.
+     */
+    id: PropTypes.string,
+
+    /**
+     * The plotly figure, which can refer to a registered template by giving its
+     * name as `layout.template`.
+     */
+    figure: PropTypes.object,
+
+    /**
+     * The plotly config, to which the default config values of `wcc.Graph` not
+     * given are added.
+     */
+    config: PropTypes.object,
+
+    /**
+     * Dash-assigned callback that should be called to report property changes
+     * to Dash, to make them available for callbacks.
+     */
+    setProps: PropTypes.func,
+};
@@ -0,0 +1 @@
+export { WebvizGraph } from "./WebvizGraph";
@@ -0,0 +1,40 @@
+import React from "react";
+import PropTypes from "prop-types";
+
+import { registerGraphTemplates } from "../../utils/graphTemplates";
+
+export type WebvizGraphTemplatesProps = {
+    id?: string;
+    templates: Record<string, Record<string, unknown>>;
+};
+
+/**
+ * Sends named plotly templates to the browser once, such that graph figures can
+ * refer to them by name (`layout.template`) instead of each figure holding the
+ * whole template. Place it before the graphs in the layout.
+ */
+export const WebvizGraphTemplates: React.FC<WebvizGraphTemplatesProps> = (
+    props
+) => {
+    // Registered while rendering, such that the templates are available when
+    // graphs later in the layout are plotted
+    React.useMemo(
+        () => registerGraphTemplates(props.templates),
+        [props.templates]
+    );
+
+    return <div id={props.id} style={{ display: "none" }} />;
+};
+
+WebvizGraphTemplates.propTypes = {
+    /**
+     * The ID used to identify this component in Dash callbacks.
+     */
+    id: PropTypes.string,
+
+    /**
+     * Plotly templates (`{"layout": {...}, "data": {...}}`) by name. Figures refer
+     * to a template by giving its name as `layout.template`.
+     */
+    templates: PropTypes.objectOf(PropTypes.object.isRequired).isRequired,
+};
@@ -0,0 +1 @@
+export { WebvizGraphTemplates } from "./WebvizGraphTemplates";
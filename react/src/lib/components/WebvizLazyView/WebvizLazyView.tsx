@@ -0,0 +1,130 @@
+import React from "react";
+import PropTypes from "prop-types";
+
+import {
+    useStore,
+    StoreActions,
+} from "../WebvizContentManager/WebvizContentManager";
+
+export type ParentProps = {
+    requested: number;
+    children: null;
+};
+
+export type WebvizLazyViewProps = {
+    id: string | Record<string, string>;
+    pluginId: string;
+    viewId: string;
+    requested?: number;
+    children?: React.ReactNode;
+    setProps?: (props: Partial<ParentProps>) => void;
+};
+
+const hasChildren = (children: React.ReactNode): boolean =>
+    children !== null &&
+    children !== undefined &&
+    !(Array.isArray(children) && children.length === 0);
+
+/**
+ * The key of a view in `lazyViewIds` of the store. Plugin and view ids can hold
+ * any characters, so they are not joined by a separator.
+ */
+export const lazyViewKey = (pluginId: string, viewId: string): string =>
+    JSON.stringify([pluginId, viewId]);
+
+/**
+ * Whether the content of the view with the given key is dropped, having more
+ * than `lazyViewBudget` other views activated after it (in `lazyViewIds`, in
+ * order of activation). A negative budget keeps all views.
+ */
+export const isLazyViewEvicted = (
+    lazyViewIds: string[],
+    key: string,
+    lazyViewBudget: number
+): boolean =>
+    lazyViewBudget >= 0 &&
+    lazyViewIds.includes(key) &&
+    lazyViewIds.length - 1 - lazyViewIds.lastIndexOf(key) > lazyViewBudget;
+
+/**
+ * Holds the content of a view, which is only shown when the view is active.
+ * The content can be loaded when the view is first activated, and dropped again
+ * when other views have been activated (see `lazyViewBudget` of
+ * `WebvizContentManager`).
+ */
+export const WebvizLazyView: React.FC<WebvizLazyViewProps> = (props) => {
+    const store = useStore();
+
+    const lazyViewId = lazyViewKey(props.pluginId, props.viewId);
+    const activeViewId = store.state.pluginsData.find(
+        (plugin) => plugin.id === props.pluginId
+    )?.activeViewId;
+    const active =
+        store.state.activePluginId === props.pluginId &&
+        activeViewId === props.viewId;
+    const evicted =
+        !active &&
+        isLazyViewEvicted(
+            store.state.lazyViewIds,
+            lazyViewId,
+            store.state.lazyViewBudget
+        );
+
+    React.useEffect(() => {
+        if (!active) {
+            return;
+        }
+        store.dispatch({
+            type: StoreActions.ActivateLazyView,
+            payload: { id: lazyViewId },
+        });
+        if (!hasChildren(props.children) && props.setProps) {
+            props.setProps({ requested: (props.requested || 0) + 1 });
+        }
+    }, [active, lazyViewId]);
+
+    React.useEffect(() => {
+        if (evicted && hasChildren(props.children) && props.setProps) {
+            props.setProps({ children: null });
+        }
+    }, [evicted]);
+
+    return (
+        <div
+            className="WebvizLazyView"
+            style={{ display: active ? "block" : "none" }}
+        >
+            {props.children}
+        </div>
+    );
+};
+
+WebvizLazyView.propTypes = {
+    /**
+     * The ID used to identify this component in Dash callbacks.
+     */
+    id: PropTypes.oneOfType([PropTypes.string, PropTypes.object]).isRequired,
+    /**
+     * The ID of the plugin the view belongs to.
+     */
+    pluginId: PropTypes.string.isRequired,
+    /**
+     * The ID of the view, as given in the `views` of the plugin wrapper.
+     */
+    viewId: PropTypes.string.isRequired,
+    /**
+     * Incremented when the view is activated without having its children
+     * loaded. Should be answered by setting `children`.
+     */
+    requested: PropTypes.number,
+    /**
+     * The content of the view. Can be left empty initially, in which case it
+     * is requested when the view is activated.
+     */
+    children: PropTypes.node,
+    /**
+     * Dash-assigned callback that should be called to report property changes
+     * to Dash, to make them available for callbacks.
+     */
+    setProps: PropTypes.func,
+};
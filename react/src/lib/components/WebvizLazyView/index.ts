@@ -0,0 +1 @@
+export { WebvizLazyView } from "./WebvizLazyView";
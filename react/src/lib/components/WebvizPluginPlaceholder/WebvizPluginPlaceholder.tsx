@@ -7,8 +7,6 @@
 
 import React, { useState, useEffect, useRef } from "react";
 import PropTypes, { InferProps } from "prop-types";
-import html2canvas from "html2canvas";
-import Tour from "reactour";
 import { SnackbarProvider, useSnackbar } from "notistack";
 
 import {
@@ -30,9 +28,15 @@ import {
 import WebvizToolbarButton from "./components/WebvizToolbarButton";
 import WebvizContentOverlay from "./components/WebvizContentOverlay";
 import downloadFile from "../../utils/downloadFile";
+import { takeScreenshot } from "../../utils/screenshot";
 
 import "./webviz_plugin_component.css";
 
+// Loaded when the tour is first opened
+const Tour = React.lazy(
+    () => import(/* webpackChunkName: "reactour" */ "reactour")
+);
+
 const propTypes = {
     /**
      * The ID used to identify this component in Dash callbacks
@@ -64,11 +68,17 @@ const propTypes = {
      * A dictionary with information regarding the resource file the plugin requested.
      * Dictionary keys are 'filename', 'content' and 'mime_type'.
      * The 'content' value should be a base64 encoded ASCII string.
+     * For large files, give instead an 'url' the file is downloaded from,
+     * e.g. as created by `webviz_core_components.download.StreamedDownloads`,
+     * or compress the content, setting 'content_encoding' to 'gzip',
+     * e.g. using `webviz_core_components.download.compressed_download`.
      */
     download: PropTypes.shape({
         filename: PropTypes.string.isRequired,
-        content: PropTypes.string.isRequired,
+        content: PropTypes.string,
+        url: PropTypes.string,
         mime_type: PropTypes.string.isRequired,
+        content_encoding: PropTypes.oneOf(["gzip"]),
     }),
 
     /**
@@ -152,6 +162,8 @@ const InnerWebvizPluginPlaceholder: React.FC<InferProps<typeof propTypes>> = (
     const [expanded, setExpanded] = useState(false);
     const [showOverlay, setShowOverlay] = useState(false);
     const [tourIsOpen, setTourIsOpen] = useState(false);
+    const tourWasOpened = useRef(false);
+    tourWasOpened.current = tourWasOpened.current || tourIsOpen;
     const { enqueueSnackbar } = useSnackbar();
 
     const prevExpandedRef = useRef(false);
@@ -181,7 +193,9 @@ const InnerWebvizPluginPlaceholder: React.FC<InferProps<typeof propTypes>> = (
                 downloadFile({
                     filename: download.filename,
                     data: download.content,
+                    url: download.url,
                     mimeType: download.mime_type,
+                    contentEncoding: download.content_encoding,
                 });
                 setProps({ download: null });
             }
@@ -245,19 +259,11 @@ const InnerWebvizPluginPlaceholder: React.FC<InferProps<typeof propTypes>> = (
                             tooltip="Take screenshot"
                             onClick={() => {
                                 if (ref.current) {
-                                    html2canvas(ref.current, {
-                                        scrollX: -window.scrollX,
-                                        scrollY: -window.scrollY,
-                                    }).then((canvas) =>
-                                        canvas.toBlob((blob) => {
-                                            if (blob !== null) {
-                                                downloadFile({
-                                                    filename:
-                                                        screenshot_filename,
-                                                    data: blob,
-                                                    mimeType: "image/png",
-                                                });
-                                            }
+                                    takeScreenshot(ref.current).then((blob) =>
+                                        downloadFile({
+                                            filename: screenshot_filename,
+                                            data: blob,
+                                            mimeType: "image/png",
                                         })
                                     );
                                 }
@@ -327,15 +333,17 @@ const InnerWebvizPluginPlaceholder: React.FC<InferProps<typeof propTypes>> = (
                     )}
                 </div>
             </div>
-            {showTour && (
-                <Tour
-                    steps={tour_steps}
-                    isOpen={tourIsOpen}
-                    onRequestClose={() => setTourIsOpen(false)}
-                    showNumber={false}
-                    rounded={5}
-                    accentColor="red"
-                />
+            {showTour && tourWasOpened.current && (
+                <React.Suspense fallback={null}>
+                    <Tour
+                        steps={tour_steps}
+                        isOpen={tourIsOpen}
+                        onRequestClose={() => setTourIsOpen(false)}
+                        showNumber={false}
+                        rounded={5}
+                        accentColor="red"
+                    />
+                </React.Suspense>
             )}
         </>
     );
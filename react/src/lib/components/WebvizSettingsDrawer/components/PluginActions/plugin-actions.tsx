@@ -31,8 +31,12 @@ import { StoreActions, useStore } from "../../../WebvizContentManager";
 import { AuthorDialog } from "../AuthorDialog/author-dialog";
 
 import { useSnackbar } from "notistack";
-import html2canvas from "html2canvas";
 import downloadFile from "../../../../utils/downloadFile";
+import {
+    loadScreenshotRenderer,
+    takeScreenshot,
+    waitForElementToSettle,
+} from "../../../../utils/screenshot";
 
 import "./plugin-actions.css";
 import { WebvizPluginTour } from "../../../../components/WebvizPluginTour/WebvizPluginTour";
@@ -58,6 +62,70 @@ type FlashAnimationParameters = {
     opacity: number;
 };
 
+/**
+ * Hides the view element actions and full screen menus, and flattens the view
+ * elements, for a screenshot. Returns a function restoring them.
+ */
+const hideScreenshotDecorations = (
+    pluginWrapper: HTMLElement,
+    fullScreenContainer: HTMLElement
+): (() => void) => {
+    const viewElements = Array.from(
+        pluginWrapper.getElementsByClassName("WebvizViewElement__Content")
+    );
+    const viewElementActions = Array.from(
+        pluginWrapper.getElementsByClassName("WebvizViewElement__Actions")
+    );
+    const actions = Array.from(
+        fullScreenContainer.getElementsByClassName("WebvizFullScreenMenu")
+    );
+    viewElements.forEach((el) =>
+        el.classList.replace(
+            "WebvizViewElement__Content",
+            "WebvizViewElement__Content__flat"
+        )
+    );
+    viewElementActions.forEach((el) =>
+        el.classList.replace(
+            "WebvizViewElement__Actions",
+            "WebvizViewElement__Actions__hidden"
+        )
+    );
+    actions.forEach(
+        (action) => ((action as HTMLDivElement).style.display = "none")
+    );
+
+    return () => {
+        viewElements.forEach((el) =>
+            el.classList.replace(
+                "WebvizViewElement__Content__flat",
+                "WebvizViewElement__Content"
+            )
+        );
+        viewElementActions.forEach((el) =>
+            el.classList.replace(
+                "WebvizViewElement__Actions__hidden",
+                "WebvizViewElement__Actions"
+            )
+        );
+        actions.forEach(
+            (action) => ((action as HTMLDivElement).style.display = "block")
+        );
+    };
+};
+
+/**
+ * Inserts a suffix in a file name, before its extension.
+ */
+const addFilenameSuffix = (filename: string, suffix: string): string => {
+    const extensionIndex = filename.lastIndexOf(".");
+    return extensionIndex > 0
+        ? `${filename.slice(0, extensionIndex)}-${suffix}${filename.slice(
+              extensionIndex
+          )}`
+        : `${filename}-${suffix}`;
+};
+
 export const PluginActions: React.FC<PluginActionsProps> = (
     props: PluginActionsProps
 ) => {
@@ -66,6 +134,8 @@ export const PluginActions: React.FC<PluginActionsProps> = (
     const [openAuthorDialog, setOpenAuthorDialog] =
         React.useState<boolean>(false);
     const [tourIsOpen, setTourIsOpen] = React.useState<boolean>(false);
+    const [allViewsScreenShotInProgress, setAllViewsScreenShotInProgress] =
+        React.useState<boolean>(false);
 
     const { enqueueSnackbar } = useSnackbar();
 
@@ -89,7 +159,7 @@ export const PluginActions: React.FC<PluginActionsProps> = (
         (view) => view.id === pluginData?.activeViewId
     )?.showDownload;
 
-    const closedHeight = 7 * (12 * 2 + 24);
+    const closedHeight = 8 * (12 * 2 + 24);
 
     React.useLayoutEffect(() => {
         if (props.open === open) {
@@ -171,70 +241,23 @@ export const PluginActions: React.FC<PluginActionsProps> = (
                         fullScreenContainer
                     ) {
                         if (t === 0.5) {
-                            const viewElements = Array.from(
-                                store.state.activePluginWrapperRef.current.getElementsByClassName(
-                                    "WebvizViewElement__Content"
-                                )
-                            );
-                            const viewElementActions = Array.from(
-                                store.state.activePluginWrapperRef.current.getElementsByClassName(
-                                    "WebvizViewElement__Actions"
-                                )
-                            );
-                            viewElements.forEach((el) =>
-                                el.classList.replace(
-                                    "WebvizViewElement__Content",
-                                    "WebvizViewElement__Content__flat"
-                                )
-                            );
-                            viewElementActions.forEach((el) =>
-                                el.classList.replace(
-                                    "WebvizViewElement__Actions",
-                                    "WebvizViewElement__Actions__hidden"
-                                )
-                            );
-                            const actions =
-                                fullScreenContainer.getElementsByClassName(
-                                    "WebvizFullScreenMenu"
-                                );
-                            for (const action of actions) {
-                                (action as HTMLDivElement).style.display =
-                                    "none";
-                            }
                             flash.style.opacity = "0";
-                            html2canvas(fullScreenContainer, {
-                                scrollX: -window.scrollX,
-                                scrollY: -window.scrollY,
-                            }).then((canvas) =>
-                                canvas.toBlob((blob) => {
-                                    if (blob !== null) {
-                                        downloadFile({
-                                            filename:
-                                                pluginData?.screenshotFilename ||
-                                                "webviz_screenshot.png",
-                                            data: blob,
-                                            mimeType: "image/png",
-                                        });
-                                    }
+                            const restoreDecorations =
+                                hideScreenshotDecorations(
+                                    store.state.activePluginWrapperRef.current,
+                                    fullScreenContainer
+                                );
+                            takeScreenshot(fullScreenContainer).then((blob) =>
+                                downloadFile({
+                                    filename:
+                                        pluginData?.screenshotFilename ||
+                                        "webviz_screenshot.png",
+                                    data: blob,
+                                    mimeType: "image/png",
                                 })
                             );
+                            restoreDecorations();
                             flash.style.opacity = "1";
-                            viewElements.forEach((el) =>
-                                el.classList.replace(
-                                    "WebvizViewElement__Content__flat",
-                                    "WebvizViewElement__Content"
-                                )
-                            );
-                            viewElementActions.forEach((el) =>
-                                el.classList.replace(
-                                    "WebvizViewElement__Actions__hidden",
-                                    "WebvizViewElement__Actions"
-                                )
-                            );
-                            for (const action of actions) {
-                                (action as HTMLDivElement).style.display =
-                                    "block";
-                            }
                         }
                         if (t === 1) {
                             document.body.removeChild(flash);
@@ -244,10 +267,71 @@ export const PluginActions: React.FC<PluginActionsProps> = (
                     }
                 }
             );
-            flashAnimation.current.start();
+            // The screenshot is taken during the flash, which therefore waits
+            // for the screenshot renderer to be loaded
+            const animation = flashAnimation.current;
+            loadScreenshotRenderer().then(
+                () => animation.start(),
+                () => document.body.removeChild(flash)
+            );
         }
     }, [store.state.activePluginWrapperRef, pluginData]);
 
+    const handleScreenShotAllViewsClick = React.useCallback(async () => {
+        const pluginWrapper = store.state.activePluginWrapperRef?.current;
+        if (!pluginWrapper || !pluginData || allViewsScreenShotInProgress) {
+            return;
+        }
+        const fullScreenContainer = pluginWrapper.getElementsByClassName(
+            "WebvizPluginWrapper__FullScreenContainer"
+        )[0] as HTMLDivElement | undefined;
+        if (!fullScreenContainer) {
+            return;
+        }
+
+        setAllViewsScreenShotInProgress(true);
+        const filename =
+            pluginData.screenshotFilename || "webviz_screenshot.png";
+        const initialViewId = pluginData.activeViewId;
+        let activeViewId = initialViewId;
+        try {
+            await loadScreenshotRenderer();
+            for (const view of pluginData.views) {
+                if (view.id !== activeViewId) {
+                    store.dispatch({
+                        type: StoreActions.SetActiveView,
+                        payload: { viewId: view.id },
+                    });
+                    activeViewId = view.id;
+                    await waitForElementToSettle(fullScreenContainer);
+                }
+                const restoreDecorations = hideScreenshotDecorations(
+                    pluginWrapper,
+                    fullScreenContainer
+                );
+                const screenshot = takeScreenshot(fullScreenContainer);
+                restoreDecorations();
+                downloadFile({
+                    filename: addFilenameSuffix(filename, view.id),
+                    data: await screenshot,
+                    mimeType: "image/png",
+                });
+            }
+        } finally {
+            if (activeViewId !== initialViewId) {
+                store.dispatch({
+                    type: StoreActions.SetActiveView,
+                    payload: { viewId: initialViewId },
+                });
+            }
+            setAllViewsScreenShotInProgress(false);
+        }
+    }, [
+        store.state.activePluginWrapperRef,
+        pluginData,
+        allViewsScreenShotInProgress,
+    ]);
+
     const handleFullScreenClick = React.useCallback(() => {
         if (fullScreenAnimation.current) {
             fullScreenAnimation.current.reset();
@@ -574,6 +658,16 @@ export const PluginActions: React.FC<PluginActionsProps> = (
                     <Icon name="camera" />
                 </Tooltip>
             </div>
+            {pluginData && pluginData.views.length > 1 && (
+                <div
+                    className="WebvizPluginActions__Button"
+                    onClick={() => handleScreenShotAllViewsClick()}
+                >
+                    <Tooltip title="Take screenshots of all views of active plugin">
+                        <Icon name="view_carousel" />
+                    </Tooltip>
+                </div>
+            )}
             {showDownload && (
                 <div
                     className="WebvizPluginActions__Button"
@@ -35,7 +35,9 @@ export const WebvizView: React.FC<WebvizViewProps> = (props) => {
             downloadFile({
                 filename: props.download.filename,
                 data: props.download.content,
+                url: props.download.url,
                 mimeType: props.download.mime_type,
+                contentEncoding: props.download.content_encoding,
             });
             if (props.setProps) {
                 props.setProps({ data_requested: null });
@@ -70,8 +72,10 @@ WebvizView.propTypes = {
     children: PropTypes.node,
     download: PropTypes.shape({
         filename: PropTypes.string.isRequired,
-        content: PropTypes.string.isRequired,
+        content: PropTypes.string,
+        url: PropTypes.string,
         mime_type: PropTypes.string.isRequired,
+        content_encoding: PropTypes.oneOf(["gzip"]),
     }),
     setProps: PropTypes.func,
 };
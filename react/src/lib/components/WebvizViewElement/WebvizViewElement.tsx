@@ -15,8 +15,8 @@ import PropTypes from "prop-types";
 import {
     DownloadData,
 } from "../../shared-types/webviz-content/download-data";
-import html2canvas from "html2canvas";
 import downloadFile from "../../utils/downloadFile";
+import { loadScreenshotRenderer, takeScreenshot } from "../../utils/screenshot";
 
 import "./webviz-view-element.css";
 import {
@@ -86,7 +86,9 @@ export const WebvizViewElement: React.FC<WebvizViewElementProps> = (props) => {
             downloadFile({
                 filename: props.download.filename,
                 data: props.download.content,
+                url: props.download.url,
                 mimeType: props.download.mime_type,
+                contentEncoding: props.download.content_encoding,
             });
             if (props.setProps) {
                 props.setProps({ data_requested: null });
@@ -405,21 +407,15 @@ export const WebvizViewElement: React.FC<WebvizViewElementProps> = (props) => {
                                 );
                             }
                             flash.style.opacity = "0";
-                            html2canvas(fullScreenContainerRef.current, {
-                                scrollX: -window.scrollX,
-                                scrollY: -window.scrollY,
-                            }).then((canvas) =>
-                                canvas.toBlob((blob) => {
-                                    if (blob !== null) {
-                                        downloadFile({
-                                            filename:
-                                                props.screenshotFilename ||
-                                                "webviz_screenshot.png",
-                                            data: blob,
-                                            mimeType: "image/png",
-                                        });
-                                    }
-                                })
+                            takeScreenshot(fullScreenContainerRef.current).then(
+                                (blob) =>
+                                    downloadFile({
+                                        filename:
+                                            props.screenshotFilename ||
+                                            "webviz_screenshot.png",
+                                        data: blob,
+                                        mimeType: "image/png",
+                                    })
                             );
                             if (isFullScreen) {
                                 actions.forEach(
@@ -439,7 +435,13 @@ export const WebvizViewElement: React.FC<WebvizViewElementProps> = (props) => {
                     }
                 }
             );
-            flashAnimation.current.start();
+            // The screenshot is taken during the flash, which therefore waits
+            // for the screenshot renderer to be loaded
+            const animation = flashAnimation.current;
+            loadScreenshotRenderer().then(
+                () => animation.start(),
+                () => document.body.removeChild(flash)
+            );
         }
     };
 
@@ -614,8 +616,10 @@ WebvizViewElement.propTypes = {
     screenshotFilename: PropTypes.string,
     download: PropTypes.shape({
         filename: PropTypes.string.isRequired,
-        content: PropTypes.string.isRequired,
+        content: PropTypes.string,
+        url: PropTypes.string,
         mime_type: PropTypes.string.isRequired,
+        content_encoding: PropTypes.oneOf(["gzip"]),
     }),
     setProps: PropTypes.func,
     children: PropTypes.node,
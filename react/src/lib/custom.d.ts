@@ -2,6 +2,9 @@ interface Window {
     dash_clientside: {
         set_props: (componentPath: Array<string | number>, props: Record<string, unknown>) => void;
     };
+    dash_core_components: {
+        Graph: React.ComponentType<Record<string, unknown>>;
+    };
 }
 
 declare module "*.svg" {
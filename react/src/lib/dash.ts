@@ -0,0 +1,66 @@
+/**
+ * Copyright (c) 2021- Equinor ASA
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+/**
+ * Entry of the bundle loaded by Dash, exporting the Dash components only.
+ * Parts of some components (e.g. the SmartNodeSelector) are split into chunks
+ * loaded on first use, which is not possible for code also exported here, as
+ * is done in `index.ts` for users of the npm package.
+ */
+
+import { WebvizPluginPlaceholder } from "./components/WebvizPluginPlaceholder";
+import { Select } from "./components/Select";
+import { SmartNodeSelector } from "./components/SmartNodeSelector/SmartNodeSelector";
+import { Menu } from "./components/Menu";
+import { Overlay } from "./components/Overlay";
+import { ScrollArea } from "./components/ScrollArea";
+import { Dialog } from "./components/Dialog";
+import { WebvizContentManager } from "./components/WebvizContentManager";
+import { WebvizDialog } from "./components/WebvizDialog";
+import { WebvizPluginsWrapper } from "./components/WebvizPluginsWrapper";
+import { WebvizPluginWrapper } from "./components/WebvizPluginWrapper";
+import { WebvizSettingsDrawer } from "./components/WebvizSettingsDrawer";
+import { WebvizView } from "./components/WebvizView";
+import { WebvizViewElement } from "./components/WebvizViewElement";
+import { WebvizLazyView } from "./components/WebvizLazyView";
+import { WebvizGraph } from "./components/WebvizGraph";
+import { WebvizGraphTemplates } from "./components/WebvizGraphTemplates";
+import { ViewVisibilityContainer } from "./components/ViewVisibilityContainer";
+import { WebvizSettingsGroup } from "./components/WebvizSettingsGroup";
+import { WebvizPluginLayoutColumn } from "./components/WebvizPluginLayoutColumn";
+import { WebvizPluginLayoutRow } from "./components/WebvizPluginLayoutRow";
+import { WebvizPluginLoadingIndicator } from "./components/WebvizPluginLoadingIndicator";
+import { EdsIcon } from "./components/EdsIcon";
+
+import "./components/FlexBox/flexbox.css";
+import "./components/Layout";
+
+export {
+    WebvizContentManager,
+    WebvizDialog,
+    WebvizPluginWrapper,
+    WebvizPluginsWrapper,
+    WebvizSettingsDrawer,
+    WebvizView,
+    WebvizViewElement,
+    WebvizLazyView,
+    WebvizGraph,
+    WebvizGraphTemplates,
+    ViewVisibilityContainer,
+    WebvizPluginPlaceholder,
+    WebvizSettingsGroup,
+    WebvizPluginLayoutColumn,
+    WebvizPluginLayoutRow,
+    WebvizPluginLoadingIndicator,
+    Select,
+    SmartNodeSelector,
+    Menu,
+    Overlay,
+    ScrollArea,
+    Dialog,
+    EdsIcon,
+};
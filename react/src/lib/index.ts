@@ -27,6 +27,9 @@ import { WebvizPluginWrapper } from "./components/WebvizPluginWrapper";
 import { WebvizSettingsDrawer } from "./components/WebvizSettingsDrawer";
 import { WebvizView } from "./components/WebvizView";
 import { WebvizViewElement } from "./components/WebvizViewElement";
+import { WebvizLazyView } from "./components/WebvizLazyView";
+import { WebvizGraph } from "./components/WebvizGraph";
+import { WebvizGraphTemplates } from "./components/WebvizGraphTemplates";
 import { ViewVisibilityContainer } from "./components/ViewVisibilityContainer";
 import { WebvizSettingsGroup } from "./components/WebvizSettingsGroup";
 import { WebvizPluginLayoutColumn } from "./components/WebvizPluginLayoutColumn";
@@ -45,6 +48,9 @@ export {
     WebvizSettingsDrawer,
     WebvizView,
     WebvizViewElement,
+    WebvizLazyView,
+    WebvizGraph,
+    WebvizGraphTemplates,
     ViewVisibilityContainer,
     WebvizPluginPlaceholder,
     WebvizSettingsGroup,
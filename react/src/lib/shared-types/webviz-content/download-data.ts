@@ -2,12 +2,16 @@ import PropTypes from "prop-types";
 
 export type DownloadData = {
     filename: string;
-    content: string;
+    content?: string;
+    url?: string;
     mime_type: string;
+    content_encoding?: "gzip";
 };
 
 export const DownloadDataPropTypes = {
     filename: PropTypes.string.isRequired,
-    content: PropTypes.string.isRequired,
+    content: PropTypes.string,
+    url: PropTypes.string,
     mime_type: PropTypes.string.isRequired,
+    content_encoding: PropTypes.oneOf(["gzip"]),
 };
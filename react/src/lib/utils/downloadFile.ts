@@ -5,18 +5,69 @@
  * LICENSE file in the root directory of this source tree.
  */
 
+type DecompressionStreamConstructor = new (
+    format: string
+) => TransformStream<Uint8Array, Uint8Array>;
+
+/**
+ * Decompresses base64 encoded, compressed data using the streaming
+ * decompression built into the browser.
+ */
+function decompressBase64(
+    data: string,
+    format: string,
+    mimeType: string
+): Promise<Blob> {
+    const DecompressionStream = (
+        window as unknown as {
+            DecompressionStream?: DecompressionStreamConstructor;
+        }
+    ).DecompressionStream;
+    if (DecompressionStream === undefined) {
+        return Promise.reject(
+            new Error("This browser does not support decompressing downloads.")
+        );
+    }
+
+    const binary = atob(data);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+    const stream = new Blob([bytes])
+        .stream()
+        .pipeThrough(new DecompressionStream(format));
+    return new Response(stream)
+        .blob()
+        .then((blob) => new Blob([blob], { type: mimeType }));
+}
+
 export default function downloadFile({
     filename,
     data,
+    url,
     mimeType,
+    contentEncoding,
 }: {
     filename: string;
-    data: Blob | string;
+    data?: Blob | string;
+    url?: string;
     mimeType: string;
+    contentEncoding?: string;
 }): void {
+    if (contentEncoding && typeof data === "string") {
+        decompressBase64(data, contentEncoding, mimeType)
+            .then((blob) => downloadFile({ filename, data: blob, mimeType }))
+            .catch((error) => console.error(error));
+        return;
+    }
+
     let src: string | undefined = undefined;
     const link = document.createElement("a");
-    if (data instanceof Blob) {
+    if (url !== undefined && url !== null) {
+        // Served by the Dash server, the browser streams it directly to disk
+        link.setAttribute("href", url);
+    } else if (data instanceof Blob) {
         src = URL.createObjectURL(data);
         link.setAttribute("href", src);
     } else {
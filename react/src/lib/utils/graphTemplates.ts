@@ -0,0 +1,41 @@
+/**
+ * Copyright (c) 2021- Equinor ASA
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+export type Figure = Record<string, unknown> & {
+    layout?: Record<string, unknown> & { template?: unknown };
+};
+
+const templates = new Map<string, Record<string, unknown>>();
+
+/**
+ * Registers named plotly templates, which figures can refer to by giving the
+ * name as `layout.template`.
+ */
+export const registerGraphTemplates = (
+    newTemplates: Record<string, Record<string, unknown>>
+): void => {
+    Object.entries(newTemplates).forEach(([name, template]) =>
+        templates.set(name, template)
+    );
+};
+
+/**
+ * Returns the figure with a template name given as `layout.template` replaced by
+ * the registered template. Figures without a template name are returned as they
+ * are.
+ */
+export const resolveFigureTemplate = (figure?: Figure): Figure | undefined => {
+    const layout = figure?.layout;
+    if (!figure || !layout || typeof layout.template !== "string") {
+        return figure;
+    }
+    const template = templates.get(layout.template);
+    if (template === undefined) {
+        console.warn(`Unknown graph template "${layout.template}".`);
+    }
+    return { ...figure, layout: { ...layout, template: template } };
+};
@@ -0,0 +1,286 @@
+/**
+ * Copyright (c) 2021- Equinor ASA
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */
+
+type Html2Canvas = typeof import("html2canvas").default;
+
+type PlotlyToImage = (
+    graph: HTMLElement,
+    options: { format: "png"; width: number; height: number; scale: number }
+) => Promise<string>;
+
+type GraphImage = {
+    bitmap: ImageBitmap;
+    left: number;
+    top: number;
+    width: number;
+    height: number;
+};
+
+// Marks the graphs in the DOM, such that they can be found in the clone of the
+// DOM made by html2canvas
+const GRAPH_ATTRIBUTE = "data-webviz-screenshot-graph";
+
+// Draws the graph images onto the base image and encodes the result as PNG
+const COMPOSITE_WORKER_SOURCE = `
+self.onmessage = async (event) => {
+    const { base, graphs } = event.data;
+    const canvas = new OffscreenCanvas(base.width, base.height);
+    const context = canvas.getContext("2d");
+    context.drawImage(base, 0, 0);
+    base.close();
+    graphs.forEach((graph) => {
+        context.drawImage(
+            graph.bitmap, graph.left, graph.top, graph.width, graph.height
+        );
+        graph.bitmap.close();
+    });
+    self.postMessage(await canvas.convertToBlob({ type: "image/png" }));
+};
+`;
+
+let compositeWorkerUrl: string | null = null;
+
+let html2canvas: Html2Canvas | null = null;
+let html2canvasPromise: Promise<Html2Canvas> | null = null;
+
+/**
+ * Loads html2canvas, which is split into a separate chunk loaded on first use.
+ * Call this before changing the DOM for a screenshot, such that
+ * `takeScreenshot` copies the DOM before it returns.
+ */
+export const loadScreenshotRenderer = (): Promise<Html2Canvas> => {
+    if (html2canvasPromise === null) {
+        html2canvasPromise = import(
+            /* webpackChunkName: "html2canvas" */ "html2canvas"
+        ).then(
+            (module) => (html2canvas = module.default),
+            (error) => {
+                html2canvasPromise = null;
+                throw error;
+            }
+        );
+    }
+    return html2canvasPromise;
+};
+
+const getPlotlyToImage = (): PlotlyToImage | null => {
+    const plotly = (window as unknown as { Plotly?: { toImage?: PlotlyToImage } })
+        .Plotly;
+    return plotly && plotly.toImage ? plotly.toImage : null;
+};
+
+const renderGraph = async (
+    toImage: PlotlyToImage,
+    graph: HTMLElement,
+    rect: DOMRect,
+    elementRect: DOMRect,
+    scale: number
+): Promise<GraphImage> => {
+    const url = await toImage(graph, {
+        format: "png",
+        width: rect.width,
+        height: rect.height,
+        scale: scale,
+    });
+    const blob = await (await fetch(url)).blob();
+    return {
+        bitmap: await createImageBitmap(blob),
+        left: (rect.left - elementRect.left) * scale,
+        top: (rect.top - elementRect.top) * scale,
+        width: rect.width * scale,
+        height: rect.height * scale,
+    };
+};
+
+const compositeInWorker = (
+    base: ImageBitmap,
+    graphs: GraphImage[]
+): Promise<Blob> => {
+    if (compositeWorkerUrl === null) {
+        compositeWorkerUrl = URL.createObjectURL(
+            new Blob([COMPOSITE_WORKER_SOURCE], {
+                type: "application/javascript",
+            })
+        );
+    }
+    const worker = new Worker(compositeWorkerUrl);
+    return new Promise<Blob>((resolve, reject) => {
+        worker.onmessage = (event: MessageEvent<Blob>) => {
+            worker.terminate();
+            resolve(event.data);
+        };
+        worker.onerror = (event: ErrorEvent) => {
+            worker.terminate();
+            reject(new Error(event.message));
+        };
+        worker.postMessage({ base: base, graphs: graphs }, [
+            base,
+            ...graphs.map((graph) => graph.bitmap),
+        ]);
+    });
+};
+
+const compositeOnMainThread = (
+    base: HTMLCanvasElement,
+    graphs: GraphImage[]
+): Promise<Blob> => {
+    const context = base.getContext("2d");
+    graphs.forEach((graph) => {
+        context?.drawImage(
+            graph.bitmap,
+            graph.left,
+            graph.top,
+            graph.width,
+            graph.height
+        );
+        graph.bitmap.close();
+    });
+    return new Promise<Blob>((resolve, reject) =>
+        base.toBlob((blob) =>
+            blob !== null
+                ? resolve(blob)
+                : reject(new Error("Could not encode screenshot."))
+        )
+    );
+};
+
+/**
+ * Takes a PNG screenshot of the given element.
+ *
+ * Plotly graphs are rendered by plotly itself and drawn on top of a screenshot of
+ * the rest of the element, as rendering large graphs with html2canvas is slow and
+ * memory intensive. The images are composited and encoded in a worker, when the
+ * browser supports OffscreenCanvas.
+ *
+ * When `loadScreenshotRenderer` has resolved, the DOM is copied before this
+ * function returns, so changes made to the DOM for the screenshot can be
+ * reverted right after calling it.
+ */
+export const takeScreenshot = async (element: HTMLElement): Promise<Blob> => {
+    const renderElement = html2canvas || (await loadScreenshotRenderer());
+    const scale = window.devicePixelRatio || 1;
+    const elementRect = element.getBoundingClientRect();
+    const toImage = getPlotlyToImage();
+
+    const graphs = toImage
+        ? (Array.from(
+              element.getElementsByClassName("js-plotly-plot")
+          ) as HTMLElement[]).filter(
+              (graph) => graph.offsetWidth > 0 && graph.offsetHeight > 0
+          )
+        : [];
+    const graphRects = graphs.map((graph) => graph.getBoundingClientRect());
+    graphs.forEach((graph, index) =>
+        graph.setAttribute(GRAPH_ATTRIBUTE, index.toString())
+    );
+
+    // html2canvas copies the DOM synchronously, before returning its promise
+    const baseCanvas = renderElement(element, {
+        scrollX: -window.scrollX,
+        scrollY: -window.scrollY,
+        scale: scale,
+        onclone: (clonedDocument) => {
+            Array.from(
+                clonedDocument.querySelectorAll(`[${GRAPH_ATTRIBUTE}]`)
+            ).forEach((clonedGraph) => {
+                const rect =
+                    graphRects[
+                        parseInt(clonedGraph.getAttribute(GRAPH_ATTRIBUTE) || "0")
+                    ];
+                (clonedGraph as HTMLElement).style.width = `${rect.width}px`;
+                (clonedGraph as HTMLElement).style.height = `${rect.height}px`;
+                clonedGraph.innerHTML = "";
+            });
+        },
+    });
+    graphs.forEach((graph) => graph.removeAttribute(GRAPH_ATTRIBUTE));
+
+    const graphImages = await Promise.all(
+        graphs.map((graph, index) =>
+            renderGraph(
+                toImage as PlotlyToImage,
+                graph,
+                graphRects[index],
+                elementRect,
+                scale
+            )
+        )
+    );
+    const base = await baseCanvas;
+
+    if (
+        typeof OffscreenCanvas !== "undefined" &&
+        typeof Worker !== "undefined"
+    ) {
+        try {
+            return await compositeInWorker(
+                await createImageBitmap(base),
+                graphImages
+            );
+        } catch {
+            // E.g. workers from blob URLs not allowed by the content security
+            // policy. The graph bitmaps have been transferred, so render them again.
+            const retriedGraphImages = await Promise.all(
+                graphs.map((graph, index) =>
+                    renderGraph(
+                        toImage as PlotlyToImage,
+                        graph,
+                        graphRects[index],
+                        elementRect,
+                        scale
+                    )
+                )
+            );
+            return compositeOnMainThread(base, retriedGraphImages);
+        }
+    }
+    return compositeOnMainThread(base, graphImages);
+};
+
+/**
+ * Resolves when the element has not changed for `quietTimeMs`, and no Dash
+ * component within it is loading, or after at most `maxWaitTimeMs`.
+ */
+export const waitForElementToSettle = (
+    element: HTMLElement,
+    quietTimeMs = 1000,
+    maxWaitTimeMs = 15000
+): Promise<void> =>
+    new Promise<void>((resolve) => {
+        let quietTimeout: ReturnType<typeof setTimeout> | null = null;
+
+        const finish = () => {
+            observer.disconnect();
+            if (quietTimeout) {
+                clearTimeout(quietTimeout);
+            }
+            clearTimeout(maxTimeout);
+            resolve();
+        };
+        const restartQuietTimeout = () => {
+            if (quietTimeout) {
+                clearTimeout(quietTimeout);
+            }
+            quietTimeout = setTimeout(() => {
+                if (element.querySelector("[data-dash-is-loading='true']")) {
+                    restartQuietTimeout();
+                    return;
+                }
+                finish();
+            }, quietTimeMs);
+        };
+
+        const observer = new MutationObserver(restartQuietTimeout);
+        const maxTimeout = setTimeout(finish, maxWaitTimeMs);
+        observer.observe(element, {
+            attributes: true,
+            childList: true,
+            characterData: true,
+            subtree: true,
+        });
+        restartQuietTimeout();
+    });
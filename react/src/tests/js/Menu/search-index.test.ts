@@ -0,0 +1,29 @@
+import fs from "fs";
+import path from "path";
+
+import { makeSearchIndex } from "../../../lib/components/Menu/utils/search-index";
+import { NavigationType } from "../../../lib/components/Menu/types/navigation";
+
+// Shared with the Python tests of `menu_search_index`, which has to normalize the
+// page titles the same way
+const fixture = JSON.parse(
+    fs.readFileSync(path.join(__dirname, "search-index.json"), "utf8")
+) as { navigationItems: NavigationType; searchIndex: string[] };
+
+describe("makeSearchIndex", () => {
+    it("normalizes titles as menu_search_index in Python", () => {
+        expect(makeSearchIndex(fixture.navigationItems).titles).toEqual(
+            fixture.searchIndex
+        );
+    });
+
+    it("uses titles given for all pages", () => {
+        const titles = fixture.searchIndex.map((title) => `${title}!`);
+        expect(makeSearchIndex(fixture.navigationItems, titles).titles).toEqual(
+            titles
+        );
+        expect(
+            makeSearchIndex(fixture.navigationItems, titles.slice(1)).titles
+        ).toEqual(fixture.searchIndex);
+    });
+});
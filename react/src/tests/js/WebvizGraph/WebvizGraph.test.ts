@@ -0,0 +1,16 @@
+import fs from "fs";
+import path from "path";
+
+import { defaultGraphConfig } from "../../../lib/components/WebvizGraph/WebvizGraph";
+
+// Shared with the Python tests of the default config of wcc.Graph, which graphs
+// created with `browser_config_defaults=True` are sent without
+const fixture = JSON.parse(
+    fs.readFileSync(path.join(__dirname, "default-config.json"), "utf8")
+);
+
+describe("WebvizGraph", () => {
+    it("applies the default config of wcc.Graph", () => {
+        expect(defaultGraphConfig).toEqual(fixture);
+    });
+});
@@ -0,0 +1,41 @@
+import {
+    StoreActions,
+    StoreReducer,
+    StoreState,
+} from "../../../lib/components/WebvizContentManager/WebvizContentManager";
+import {
+    isLazyViewEvicted,
+    lazyViewKey,
+} from "../../../lib/components/WebvizLazyView/WebvizLazyView";
+
+const activate = (state: StoreState, id: string): StoreState =>
+    StoreReducer(state, {
+        type: StoreActions.ActivateLazyView,
+        payload: { id: id },
+    });
+
+describe("WebvizLazyView", () => {
+    // Identical when joined by "-"
+    const first = lazyViewKey("a-b", "c");
+    const second = lazyViewKey("a", "b-c");
+
+    it("keys views by plugin id and view id", () => {
+        expect(first).not.toEqual(second);
+        expect(lazyViewKey("a-b", "c")).toEqual(first);
+    });
+
+    it("evicts views by their own recency", () => {
+        let state = { lazyViewIds: [] as string[] } as StoreState;
+        state = activate(activate(state, first), second);
+        expect(state.lazyViewIds).toEqual([first, second]);
+
+        expect(isLazyViewEvicted(state.lazyViewIds, first, 0)).toBe(true);
+        expect(isLazyViewEvicted(state.lazyViewIds, second, 0)).toBe(false);
+        expect(isLazyViewEvicted(state.lazyViewIds, first, 1)).toBe(false);
+        expect(isLazyViewEvicted(state.lazyViewIds, first, -1)).toBe(false);
+
+        state = activate(state, first);
+        expect(state.lazyViewIds).toEqual([second, first]);
+        expect(isLazyViewEvicted(state.lazyViewIds, second, 0)).toBe(true);
+    });
+});
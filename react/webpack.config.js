@@ -1,4 +1,7 @@
+const crypto = require("crypto");
+const fs = require("fs");
 const path = require("path");
+const zlib = require("zlib");
 const MiniCssExtractPlugin = require("mini-css-extract-plugin");
 const CssMinimizerPlugin = require("css-minimizer-webpack-plugin");
 
@@ -8,6 +11,75 @@ const dashLibraryName = packagejson.name
     .replace(/[-/]/g, "_")
     .replace(/@/g, "");
 
+// Name of the manifest listing the precompressed assets, read by
+// webviz_core_components.static_assets.PrecompressedAssets
+const precompressedManifest = "precompressed-assets.json";
+
+/**
+ * Writes gzip and brotli compressed variants (`<asset>.gz`, `<asset>.br`) of
+ * the emitted JavaScript and CSS files, and a manifest with the content hash of
+ * each asset and its available encodings, such that the Dash server can serve
+ * the compressed files as they are.
+ */
+class PrecompressPlugin {
+    apply(compiler) {
+        compiler.hooks.afterEmit.tapPromise(
+            "PrecompressPlugin",
+            async (compilation) => {
+                const outputPath = compilation.outputOptions.path;
+                const manifest = {};
+                const assets = Object.keys(compilation.assets)
+                    .filter((name) => /\.(js|css)$/.test(name))
+                    .sort();
+                for (const name of assets) {
+                    const content = await fs.promises.readFile(
+                        path.join(outputPath, name)
+                    );
+                    const variants = {
+                        br: zlib.brotliCompressSync(content, {
+                            params: {
+                                [zlib.constants.BROTLI_PARAM_QUALITY]:
+                                    zlib.constants.BROTLI_MAX_QUALITY,
+                                [zlib.constants.BROTLI_PARAM_SIZE_HINT]:
+                                    content.length,
+                            },
+                        }),
+                        gzip: zlib.gzipSync(content, { level: 9 }),
+                    };
+                    const encodings = [];
+                    for (const [encoding, compressed] of Object.entries(
+                        variants
+                    )) {
+                        const extension = encoding === "gzip" ? "gz" : "br";
+                        const file = path.join(
+                            outputPath,
+                            `${name}.${extension}`
+                        );
+                        if (compressed.length < content.length) {
+                            await fs.promises.writeFile(file, compressed);
+                            encodings.push(encoding);
+                        } else {
+                            await fs.promises.rm(file, { force: true });
+                        }
+                    }
+                    manifest[name] = {
+                        hash: crypto
+                            .createHash("sha256")
+                            .update(content)
+                            .digest("hex")
+                            .slice(0, 20),
+                        encodings: encodings,
+                    };
+                }
+                await fs.promises.writeFile(
+                    path.join(outputPath, precompressedManifest),
+                    JSON.stringify(manifest, null, 4) + "\n"
+                );
+            }
+        );
+    }
+}
+
 module.exports = (env, argv) => {
     const overrides = module.exports || {};
 
@@ -31,12 +103,20 @@ module.exports = (env, argv) => {
 
     // Output
 
-    const demo = entry !== "./dist/index.js";
+    const demo = entry !== "./dist/dash.js";
 
     const filenameJs = demo
         ? "output.js"
         : `${dashLibraryName}.${mode === "development" ? "dev" : "min"}.js`;
 
+    // Chunks loaded on first use, named by the webpackChunkName of the dynamic
+    // import. The chunks have to be registered in _js_dist in __init__.py.
+    const chunkFilenameJs = demo
+        ? "[name].js"
+        : `${dashLibraryName}-[name].${
+              mode === "development" ? "dev" : "min"
+          }.js`;
+
     const filenameCss = demo ? "output.css" : `${dashLibraryName}.css`;
 
     // Devtool
@@ -67,6 +147,9 @@ module.exports = (env, argv) => {
                 ? __dirname
                 : path.resolve(__dirname, "..", dashLibraryName),
             filename: filenameJs,
+            chunkFilename: chunkFilenameJs,
+            // Chunks are loaded from where the bundle was loaded from
+            publicPath: "auto",
             library: dashLibraryName,
             libraryTarget: "umd",
         },
@@ -113,8 +196,20 @@ module.exports = (env, argv) => {
             new MiniCssExtractPlugin({
                 filename: filenameCss,
             }),
+            // Only the production bundle is served precompressed
+            ...(!demo && mode === "production"
+                ? [new PrecompressPlugin()]
+                : []),
         ],
         optimization: {
+            // Each dynamic import makes one chunk, holding the modules not in
+            // the main bundle, such that the chunks are known up front
+            splitChunks: {
+                cacheGroups: {
+                    default: false,
+                    defaultVendors: false,
+                },
+            },
             minimizer: [
                 () => {
                     return () => {
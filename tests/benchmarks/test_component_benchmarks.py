@@ -0,0 +1,259 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+"""Construction and serialization benchmarks of the Python components.
+
+Each component is constructed and serialized (with `to_json`, calling
+`to_plotly_json` on all components in the tree) at a realistic size, and
+compared to the baseline in `component_baseline.json`:
+
+* The construction and serialization time per component, relative to the time
+  of constructing and serializing a plain `html.Div`, such that the baseline
+  does not depend on the speed of the machine.
+* The memory allocated per constructed component.
+* The size of the serialized component.
+
+The run fails if a component uses more memory or bytes than the baseline
+allows. Timings depend on the load of the machine, and are only printed, unless
+checked against the baseline with
+
+    WCC_CHECK_BENCHMARK_TIMINGS=1 pytest tests/benchmarks/test_component_benchmarks.py
+
+After intended changes, update the baseline with
+
+    WCC_UPDATE_BENCHMARK_BASELINE=1 pytest tests/benchmarks/test_component_benchmarks.py
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from dash import html
+from dash._utils import to_json
+
+import webviz_core_components as wcc
+from webviz_core_components import wrapped_components
+
+BASELINE_PATH = Path(__file__).parent / "component_baseline.json"
+UPDATE_BASELINE = bool(os.environ.get("WCC_UPDATE_BENCHMARK_BASELINE"))
+CHECK_TIMINGS = bool(os.environ.get("WCC_CHECK_BENCHMARK_TIMINGS"))
+
+# Allowed increase relative to the baseline. Timings are noisy, so only
+# substantial slowdowns fail the run.
+TIME_TOLERANCE = 1.0
+MEMORY_TOLERANCE = 0.2
+PAYLOAD_TOLERANCE = 0.05
+
+N_COMPONENTS = 200
+N_REFERENCE_COMPONENTS = 2000
+N_REPEATS = 5
+
+OPTIONS = [{"label": f"Realization {i}", "value": i} for i in range(50)]
+MARKS = {i: str(i) for i in range(0, 101, 5)}
+ENSEMBLES = [f"iter-{i}" for i in range(200)]
+ENSEMBLE_OPTIONS = [{"label": name, "value": name} for name in ENSEMBLES]
+FIGURE = {
+    "data": [
+        {
+            "type": "scatter",
+            "name": f"Realization {trace}",
+            "x": list(range(1000)),
+            "y": [0.5 * trace + 0.001 * i for i in range(1000)],
+        }
+        for trace in range(3)
+    ],
+    "layout": {"title": "Field oil production rate", "height": 400},
+}
+TREE_DATA = [
+    {
+        "name": f"VECTOR_{i}",
+        "description": f"Vector number {i}",
+        "children": [{"name": f"WELL_{j}"} for j in range(50)],
+    }
+    for i in range(100)
+]
+CONTENT = [html.Div(f"Content {i}", id=f"content-{i}") for i in range(10)]
+SELECTORS = [
+    wcc.Dropdown(label="Ensemble", id="ensemble", options=OPTIONS),
+    wcc.Checklist(label="Realizations", id="realizations", options=OPTIONS),
+]
+TABS = [wcc.Tab(label=f"Tab {i}", value=f"tab-{i}", children=CONTENT) for i in range(5)]
+
+# Maps component name -> function creating the i-th instance.
+CASES = {
+    "Checklist": lambda i: wcc.Checklist(
+        label="Realizations", id=f"checklist-{i}", options=OPTIONS, value=[0]
+    ),
+    "CollapsiveHeader": lambda i: wcc.CollapsiveHeader(
+        children=list(SELECTORS), label=f"Header {i}"
+    ),
+    "Dropdown": lambda i: wcc.Dropdown(
+        label="Realization", id=f"dropdown-{i}", options=OPTIONS, value=0
+    ),
+    "FlexBox": lambda i: wcc.FlexBox(id=f"flexbox-{i}", children=CONTENT),
+    "FlexColumn": lambda i: wcc.FlexColumn(children=CONTENT, flex=2),
+    "Frame": lambda i: wcc.Frame(children=CONTENT, id=f"frame-{i}"),
+    "Graph": lambda i: wcc.Graph(id=f"graph-{i}", figure=FIGURE),
+    "Header": lambda i: wcc.Header(f"Header {i}"),
+    "Label": lambda i: wcc.Label(f"Label {i}"),
+    "LabeledContainer": lambda i: wcc.LabeledContainer(
+        children=CONTENT, label=f"Container {i}"
+    ),
+    "RangeSlider": lambda i: wcc.RangeSlider(
+        label="Depth", id=f"range-slider-{i}", min=0, max=100, marks=MARKS
+    ),
+    "RadioItems": lambda i: wcc.RadioItems(
+        label="Realization", id=f"radioitems-{i}", options=OPTIONS, value=0
+    ),
+    "SelectWithLabel": lambda i: wcc.SelectWithLabel(
+        label="Ensembles",
+        id=f"select-with-label-{i}",
+        options=ENSEMBLE_OPTIONS,
+        value=[ENSEMBLES[0]],
+        size=10,
+    ),
+    "Selectors": lambda i: wcc.Selectors(children=list(SELECTORS), label=f"Filter {i}"),
+    "Slider": lambda i: wcc.Slider(
+        label="Time step", id=f"slider-{i}", min=0, max=100, marks=MARKS
+    ),
+    "Tab": lambda i: wcc.Tab(label=f"Tab {i}", value=f"tab-{i}", children=CONTENT),
+    "Tabs": lambda i: wcc.Tabs(id=f"tabs-{i}", value="tab-0", children=TABS),
+    "Select": lambda i: wcc.Select(
+        id=f"select-{i}",
+        options=ENSEMBLE_OPTIONS,
+        value=[ENSEMBLES[0]],
+        size=10,
+    ),
+    "SmartNodeSelector": lambda i: wcc.SmartNodeSelector(
+        id=f"smart-node-selector-{i}",
+        label="Vectors",
+        data=TREE_DATA,
+        selectedTags=["VECTOR_0:WELL_0"],
+        numMetaNodes=0,
+        delimiter=":",
+    ),
+    "WebvizPluginPlaceholder": lambda i: wcc.WebvizPluginPlaceholder(
+        id=f"plugin-{i}",
+        children=CONTENT,
+        buttons=["screenshot", "expand", "download", "guided_tour", "contact_person"],
+        contact_person={"name": "Ola Nordmann", "email": "ola@example.com"},
+        screenshot_filename=f"plugin-{i}.png",
+        tour_steps=[{"id": f"content-{j}", "content": f"Step {j}"} for j in range(5)],
+    ),
+}
+
+
+def _best_time(function, *args):
+    best = float("inf")
+    for _ in range(N_REPEATS):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _construct(factory, n_components=N_COMPONENTS):
+    return [factory(i) for i in range(n_components)]
+
+
+def _time_per_component(factory, n_components=N_COMPONENTS):
+    components = _construct(factory, n_components)
+    return (
+        _best_time(_construct, factory, n_components) / n_components,
+        _best_time(to_json, components) / n_components,
+    )
+
+
+def _reference_times():
+    """The construction and serialization time of a plain `html.Div`, measured
+    right before each benchmark such that both see the same machine load.
+    """
+    return _time_per_component(
+        lambda i: html.Div(f"Content {i}", id=f"div-{i}"), N_REFERENCE_COMPONENTS
+    )
+
+
+def _memory_per_component(factory):
+    tracemalloc.start()
+    try:
+        components = _construct(factory)
+        memory = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del components
+    return memory / N_COMPONENTS
+
+
+@pytest.fixture(name="baseline", scope="module")
+def fixture_baseline():
+    baseline = (
+        json.loads(BASELINE_PATH.read_text(encoding="utf8"))
+        if BASELINE_PATH.exists()
+        else {}
+    )
+    yield baseline
+    if UPDATE_BASELINE:
+        BASELINE_PATH.write_text(
+            json.dumps(dict(sorted(baseline.items())), indent=4) + "\n",
+            encoding="utf8",
+        )
+
+
+def test_all_wrapped_components_are_benchmarked():
+    assert set(wrapped_components.__all__) <= set(CASES)
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_component_benchmark(name, baseline):
+    factory = CASES[name]
+    reference_times = _reference_times()
+    construction_time, serialization_time = _time_per_component(factory)
+    result = {
+        "construction": round(construction_time / reference_times[0], 2),
+        "serialization": round(serialization_time / reference_times[1], 2),
+        "memory_bytes": round(_memory_per_component(factory)),
+        "payload_bytes": len(to_json(factory(0))),
+    }
+
+    print(
+        f"\n{name}: "
+        f"{1 / construction_time:.0f} constructions/s "
+        f"({result['construction']} x html.Div), "
+        f"{1 / serialization_time:.0f} serializations/s "
+        f"({result['serialization']} x html.Div), "
+        f"{result['memory_bytes']} bytes of memory, "
+        f"{result['payload_bytes']} bytes serialized"
+    )
+
+    if UPDATE_BASELINE:
+        baseline[name] = result
+        return
+
+    if name not in baseline:
+        pytest.fail(
+            f"No baseline for {name}. Run with WCC_UPDATE_BENCHMARK_BASELINE=1."
+        )
+
+    expected = baseline[name]
+    limits = {
+        "memory_bytes": expected["memory_bytes"] * (1 + MEMORY_TOLERANCE),
+        "payload_bytes": expected["payload_bytes"] * (1 + PAYLOAD_TOLERANCE),
+    }
+    if CHECK_TIMINGS:
+        limits["construction"] = expected["construction"] * (1 + TIME_TOLERANCE)
+        limits["serialization"] = expected["serialization"] * (1 + TIME_TOLERANCE)
+    regressions = [
+        f"{key}: {result[key]} > {limit:.2f} (baseline {expected[key]})"
+        for key, limit in limits.items()
+        if result[key] > limit
+    ]
+    assert not regressions, f"{name} regressed:\n" + "\n".join(regressions)
@@ -0,0 +1,61 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import base64
+import gzip
+import random
+import time
+
+import pytest
+
+from webviz_core_components.download import compressed_download
+
+
+def _ensemble_csv(n_rows: int) -> str:
+    rng = random.Random(0)
+    lines = ["ENSEMBLE,REAL,DATE,FOPT,FGPT,FWPT"]
+    for i in range(n_rows):
+        lines.append(
+            f"iter-0,{i % 100},2020-{i % 12 + 1:02d}-01,"
+            f"{rng.uniform(0, 1e7):.2f},{rng.uniform(0, 1e9):.2f},"
+            f"{rng.uniform(0, 1e6):.2f}"
+        )
+    return "\n".join(lines)
+
+
+@pytest.mark.parametrize("content", ["a,b\n1,2\n", "æøå;\n", "", b"\x00\xff" * 100])
+def test_compressed_download_round_trip(content):
+    download = compressed_download(content, filename="data.csv")
+
+    assert download["filename"] == "data.csv"
+    assert download["mime_type"] == "text/csv"
+    assert download["content_encoding"] == "gzip"
+    decompressed = gzip.decompress(base64.b64decode(download["content"]))
+    expected = content.encode("utf-8") if isinstance(content, str) else content
+    assert decompressed == expected
+
+
+@pytest.mark.parametrize("n_rows", [10_000, 100_000])
+def test_compressed_download_size(n_rows):
+    csv = _ensemble_csv(n_rows)
+
+    start = time.perf_counter()
+    plain_bytes = len(base64.b64encode(csv.encode("utf-8")))
+    plain_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compressed_bytes = len(compressed_download(csv, filename="data.csv")["content"])
+    compressed_time = time.perf_counter() - start
+
+    print(
+        f"\n{n_rows} rows: base64 {plain_bytes} B ({plain_time * 1000:.1f} ms), "
+        f"gzip + base64 {compressed_bytes} B ({compressed_time * 1000:.1f} ms), "
+        f"{plain_bytes / compressed_bytes:.1f}x smaller"
+    )
+    assert compressed_bytes < plain_bytes / 2
@@ -0,0 +1,90 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import time
+
+from dash._utils import to_json
+
+import webviz_core_components as wcc
+from webviz_core_components.dropdown_options import SearchableOptions
+
+N_OPTIONS = 200_000
+
+
+def _options():
+    return [
+        {"label": f"Well {i % 7}-OP_{i}", "value": f"OP_{i}"} for i in range(N_OPTIONS)
+    ]
+
+
+class _CountedText(str):
+    """The labels of the options joined in one string, counting the searches in
+    it.
+    """
+
+    searches = 0
+
+    def find(self, *args):
+        self.searches += 1
+        return super().find(*args)
+
+
+def _search_by_scanning(options, search_value):
+    query = search_value.lower()
+    return [option for option in options if query in option["label"].lower()]
+
+
+def test_dropdown_search_latency():
+    options = _options()
+    searchable_options = SearchableOptions(options, max_results=100)
+    # pylint: disable=protected-access
+    searchable_options._text = _CountedText(searchable_options._text)
+
+    # Typing a well name, and a search value matching no option
+    search_values = ["w", "we", "well 3", "op_1", "op_1999", "op_199999", "gas"]
+    search_time = scan_time = 0.0
+    for search_value in search_values:
+        searchable_options._text.searches = 0
+        start = time.perf_counter()
+        result = searchable_options.search(search_value)
+        search_time = max(search_time, time.perf_counter() - start)
+        # Independent of the number of options: each search in the labels finds
+        # one of the at most 100 options returned (possibly one already found as
+        # starting with the search value), or nothing, ending the search
+        assert searchable_options._text.searches <= 100 + 1
+
+        start = time.perf_counter()
+        expected = _search_by_scanning(options, search_value)
+        scan_time = max(scan_time, time.perf_counter() - start)
+
+        assert len(result) == min(len(expected), 100)
+        assert {option["value"] for option in result} <= {
+            option["value"] for option in expected
+        }
+
+    print(
+        f"\n{N_OPTIONS} options, slowest keystroke: {scan_time * 1e3:.0f} ms scanning"
+        f" -> {search_time * 1e3:.1f} ms searching the index"
+    )
+
+
+def test_dropdown_layout_payload():
+    options = _options()
+    full_bytes = len(to_json(wcc.Dropdown(id="well", options=options, value="OP_1")))
+    searchable_bytes = len(
+        to_json(
+            wcc.Dropdown(
+                id="well",
+                searchable_options=SearchableOptions(options),
+                value="OP_1",
+            )
+        )
+    )
+    print(f"\n{N_OPTIONS} options: {full_bytes} B -> {searchable_bytes} B in layout")
+    assert searchable_bytes < 1000
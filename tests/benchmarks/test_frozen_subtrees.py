@@ -0,0 +1,130 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import json
+import time
+
+import plotly.io.json
+import pytest
+from dash import Dash, html
+from dash._utils import to_json
+
+import webviz_core_components as wcc
+from webviz_core_components.frozen import FrozenComponent, frozen
+
+N_PANELS = 100
+N_REQUESTS = 10
+
+OPTIONS = [{"label": f"Realization {i}", "value": i} for i in range(50)]
+
+
+def _settings_panel(panel):
+    return wcc.Frame(
+        id=f"frame-{panel}",
+        children=[
+            wcc.Header(f"Settings {panel}"),
+            wcc.Selectors(
+                label="Filters",
+                children=[
+                    wcc.Dropdown(
+                        label=f"Filter {i}", id=f"filter-{panel}-{i}", options=OPTIONS
+                    )
+                    for i in range(5)
+                ],
+            ),
+            wcc.LabeledContainer(
+                label="Info", children=[html.Div(f"Panel {panel}", className="info")]
+            ),
+        ],
+    )
+
+
+_frozen_settings_panel = frozen(_settings_panel)
+
+
+def _layout(panel_function):
+    return html.Div([panel_function(panel) for panel in range(N_PANELS)])
+
+
+def _serve_layouts(panel_function):
+    start = time.perf_counter()
+    for _ in range(N_REQUESTS):
+        payload = to_json(_layout(panel_function))
+    return (time.perf_counter() - start) / N_REQUESTS, payload
+
+
+def test_frozen_layout_throughput():
+    calls = []
+
+    @frozen
+    def frozen_settings_panel(panel):
+        calls.append(panel)
+        return _settings_panel(panel)
+
+    plain_time, plain_payload = _serve_layouts(_settings_panel)
+    frozen_time, frozen_payload = _serve_layouts(frozen_settings_panel)
+
+    print(
+        f"\nLayout with {N_PANELS} settings panels: "
+        f"{plain_time * 1e3:.1f} ms -> {frozen_time * 1e3:.1f} ms per request "
+        f"({len(plain_payload)} bytes)"
+    )
+
+    assert json.loads(frozen_payload) == json.loads(plain_payload)
+    # Each panel is built once, and reused by all later requests
+    assert calls == list(range(N_PANELS))
+
+
+def test_frozen_cache():
+    calls = []
+
+    @frozen
+    def panel(panel, options):
+        calls.append(panel)
+        return html.Div(id=f"panel-{panel}", children=str(options))
+
+    first = panel(1, options=[1, 2])
+    assert isinstance(first, FrozenComponent)
+    assert panel(1, options=[1, 2]) is first
+    assert panel(1, options=[1, 3]) is not first
+    assert calls == [1, 1]
+
+    panel.cache_clear()
+    assert panel(1, options=[1, 2]) is not first
+
+
+def test_frozen_cache_eviction():
+    calls = []
+
+    @frozen(max_cache_bytes=1000)
+    def panel(panel):
+        calls.append(panel)
+        return html.Div(id=f"panel-{panel}", children="x" * 400)
+
+    panel(1)
+    panel(2)
+    panel(1)
+    # Evicts panel 2, being used least recently
+    panel(3)
+    panel(1)
+    panel(2)
+    assert calls == [1, 2, 3, 2]
+
+
+# Frozen subtrees are inserted differently by the two JSON engines used by plotly
+@pytest.mark.parametrize("engine", ["json", "auto"])
+def test_frozen_layout_served_by_dash(engine, monkeypatch):
+    monkeypatch.setattr(plotly.io.json.config, "default_engine", engine)
+    app = Dash(__name__)
+    app.layout = lambda: _layout(_frozen_settings_panel)
+
+    response = app.server.test_client().get("/_dash-layout")
+
+    assert response.status_code == 200
+    assert json.loads(response.data) == json.loads(to_json(_layout(_settings_panel)))
@@ -0,0 +1,115 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import json
+import time
+from pathlib import Path
+
+from dash import dcc, html
+from dash._utils import to_json
+
+import webviz_core_components
+
+N_GRAPHS = 2000
+
+# Shared with the tests of WebvizGraph, applying the default config in the browser
+DEFAULT_CONFIG_FIXTURE = (
+    Path(__file__).parents[2] / "react/src/tests/js/WebvizGraph/default-config.json"
+)
+
+FIGURE = {"data": [{"x": [1, 2, 3], "y": [4, 1, 2], "type": "bar"}]}
+
+
+def _build_layout(graph_factory):
+    start = time.perf_counter()
+    layout = html.Div([graph_factory(i) for i in range(N_GRAPHS)])
+    construction_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    payload = to_json(layout)
+    serialization_time = time.perf_counter() - start
+
+    return layout, construction_time, serialization_time, len(payload.encode())
+
+
+def test_graph_default_config_payload():
+    # As sent before the default config was shared: a new config for each graph
+    _, baseline_time, baseline_serialization_time, baseline_bytes = _build_layout(
+        lambda i: dcc.Graph(
+            id=f"graph-{i}",
+            figure=FIGURE,
+            config=webviz_core_components.Graph.populate_config(),
+        )
+    )
+    layout, construction_time, serialization_time, payload_bytes = _build_layout(
+        lambda i: webviz_core_components.Graph(id=f"graph-{i}", figure=FIGURE)
+    )
+    _, browser_time, browser_serialization_time, browser_bytes = _build_layout(
+        lambda i: webviz_core_components.Graph(
+            id=f"graph-{i}", figure=FIGURE, browser_config_defaults=True
+        )
+    )
+
+    print(
+        f"\n{N_GRAPHS} graphs with a config each: "
+        f"{baseline_time * 1e3:.1f} ms construction, "
+        f"{baseline_serialization_time * 1e3:.1f} ms serialization, "
+        f"{baseline_bytes} bytes"
+        f"\n{N_GRAPHS} wcc.Graph with shared default config: "
+        f"{construction_time * 1e3:.1f} ms construction, "
+        f"{serialization_time * 1e3:.1f} ms serialization, {payload_bytes} bytes"
+        f"\n{N_GRAPHS} wcc.Graph with default config in the browser: "
+        f"{browser_time * 1e3:.1f} ms construction, "
+        f"{browser_serialization_time * 1e3:.1f} ms serialization, "
+        f"{browser_bytes} bytes"
+    )
+
+    # The shared default config is only shared in memory, and still serialized
+    # with each graph
+    assert len({id(graph.config) for graph in layout.children}) == 1
+    assert payload_bytes == baseline_bytes
+
+    # Without the config, while the type and namespace of the component, now
+    # WebvizGraph of this package, are longer
+    config_bytes = len(
+        f',"config":{to_json(webviz_core_components.Graph.populate_config())}'
+    )
+    type_bytes = len("WebvizGraph" + "webviz_core_components") - len(
+        "Graph" + "dash_core_components"
+    )
+    assert browser_bytes == baseline_bytes - N_GRAPHS * (config_bytes - type_bytes)
+
+
+def test_browser_config_defaults():
+    config = webviz_core_components.Graph.populate_config()
+    assert config == json.loads(DEFAULT_CONFIG_FIXTURE.read_text(encoding="utf8"))
+
+    graph = webviz_core_components.Graph(browser_config_defaults=True)
+    assert not hasattr(graph, "config")
+    assert graph.to_plotly_json()["type"] == "WebvizGraph"
+
+    graph = webviz_core_components.Graph(
+        config={**config, "scrollZoom": False}, browser_config_defaults=True
+    )
+    assert graph.to_plotly_json()["props"]["config"] == {"scrollZoom": False}
+
+
+def test_populate_config_returns_new_config():
+    config = webviz_core_components.Graph.populate_config()
+    config["modeBarButtonsToRemove"].append("toImage")
+    config["scrollZoom"] = False
+
+    assert webviz_core_components.Graph.populate_config() == {
+        "modeBarButtonsToRemove": ["sendDataToCloud"],
+        "displaylogo": False,
+        "responsive": True,
+    }
+    assert (
+        webviz_core_components.Graph().config is webviz_core_components.Graph().config
+    )
@@ -0,0 +1,47 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import time
+
+import webviz_core_components
+from webviz_core_components.wrapped_components import _argument_modifier
+
+N_GRAPHS = 5000
+
+
+def _constructions_per_second(clear_cache: bool) -> float:
+    figure = {"data": [{"x": [1, 2, 3], "y": [4, 1, 2], "type": "bar"}]}
+
+    start = time.perf_counter()
+    for i in range(N_GRAPHS):
+        if clear_cache:
+            # pylint: disable=protected-access, no-value-for-parameter
+            _argument_modifier._argument_index.cache_clear()
+        webviz_core_components.Graph(
+            id=f"graph-{i}", figure=figure, config={"displaylogo": True}
+        )
+    return N_GRAPHS / (time.perf_counter() - start)
+
+
+def test_graph_construction_throughput():
+    uncached = _constructions_per_second(clear_cache=True)
+    cached = _constructions_per_second(clear_cache=False)
+
+    print(
+        f"\nwcc.Graph constructions per second: "
+        f"{uncached:.0f} (uncached argspec) -> {cached:.0f} (cached argspec)"
+    )
+
+    # The argspec is resolved once per (class, argument) pair, not per graph
+    # pylint: disable=protected-access, no-value-for-parameter
+    _argument_modifier._argument_index.cache_clear()
+    _constructions_per_second(clear_cache=False)
+    cache_info = _argument_modifier._argument_index.cache_info()
+    assert cache_info.misses == cache_info.currsize
+    assert cache_info.hits >= N_GRAPHS - 1
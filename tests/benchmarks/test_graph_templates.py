@@ -0,0 +1,83 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import time
+
+import plotly.io as pio
+import pytest
+from dash import html
+from dash._utils import to_json
+
+import webviz_core_components as wcc
+from webviz_core_components.graph_templates import (
+    register_graph_template,
+    use_graph_template,
+)
+
+N_GRAPHS = 500
+
+
+def _figure(index: int) -> dict:
+    return {"data": [{"x": [1, 2, 3], "y": [index, 1, 2], "type": "bar"}]}
+
+
+def _encode(layout):
+    start = time.perf_counter()
+    payload = to_json(layout)
+    return time.perf_counter() - start, len(payload.encode())
+
+
+def test_graph_templates_payload():
+    template = pio.templates["plotly_white"].to_plotly_json()
+    register_graph_template("webviz", template)
+
+    inline_time, inline_bytes = _encode(
+        html.Div(
+            [
+                wcc.Graph(
+                    figure={**_figure(i), "layout": {"template": template}},
+                )
+                for i in range(N_GRAPHS)
+            ]
+        )
+    )
+    # The templates are sent once, to the component holding them
+    shared_time, shared_bytes = _encode(
+        html.Div(
+            [html.Div(id="templates", title=to_json({"webviz": template}))]
+            + [wcc.Graph(figure=_figure(i), template="webviz") for i in range(N_GRAPHS)]
+        )
+    )
+
+    print(
+        f"\n{N_GRAPHS} graphs with inline templates: "
+        f"{inline_time * 1e3:.1f} ms, {inline_bytes} bytes"
+        f"\n{N_GRAPHS} graphs with shared template: "
+        f"{shared_time * 1e3:.1f} ms, {shared_bytes} bytes"
+    )
+    assert shared_bytes < 0.05 * inline_bytes
+
+
+def test_use_graph_template():
+    register_graph_template("small", {"layout": {"font": {"size": 10}}})
+
+    figure = {"data": [], "layout": {"title": "Title"}}
+    assert use_graph_template(figure, "small") == {
+        "data": [],
+        "layout": {"title": "Title", "template": "small"},
+    }
+    assert figure["layout"] == {"title": "Title"}
+    graph = wcc.Graph(template="small")
+    assert graph.figure == {"layout": {"template": "small"}}
+    assert graph.to_plotly_json()["type"] == "WebvizGraph"
+    assert graph.to_plotly_json()["namespace"] == "webviz_core_components"
+    assert wcc.Graph().to_plotly_json()["type"] == "Graph"
+
+    with pytest.raises(ValueError, match="has not been registered"):
+        wcc.Graph(figure=figure, template="unknown")
@@ -0,0 +1,153 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import base64
+import time
+
+import plotly.graph_objects as go
+import pytest
+from dash._utils import to_json
+
+import webviz_core_components as wcc
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+N_POINTS = 1_000_000
+
+
+def _figure():
+    rng = np.random.default_rng(0)
+    return {
+        "data": [
+            {
+                "type": "scattergl",
+                "x": np.arange(N_POINTS),
+                "y": rng.normal(size=N_POINTS).cumsum(),
+                "marker": {"color": pd.Series(rng.random(N_POINTS))},
+                "text": np.array(["a", "b"]),
+            }
+        ],
+        "layout": {"title": "Random walk"},
+    }
+
+
+def _encode(**kwargs):
+    figure = _figure()
+    start = time.perf_counter()
+    payload = to_json(wcc.Graph(id="graph", figure=figure, **kwargs))
+    return time.perf_counter() - start, len(payload.encode())
+
+
+def test_typed_arrays():
+    figure = _figure()
+    encoded = wcc.Graph.encode_figure_arrays(figure, float32_tolerance=1e-5)
+    trace = encoded["data"][0]
+
+    assert trace["x"]["dtype"] == "i4"
+    assert np.array_equal(
+        np.frombuffer(base64.b64decode(trace["x"]["bdata"]), dtype="<i4"),
+        figure["data"][0]["x"],
+    )
+    assert trace["y"]["dtype"] == "f4"
+    assert trace["marker"]["color"]["dtype"] == "f4"
+    assert trace["text"] is figure["data"][0]["text"]
+    assert encoded["layout"] is figure["layout"]
+    assert isinstance(figure["data"][0]["y"], np.ndarray)
+
+    exact = wcc.Graph.encode_figure_arrays(figure)
+    assert exact["data"][0]["y"]["dtype"] == "f8"
+    assert np.array_equal(
+        np.frombuffer(base64.b64decode(exact["data"][0]["y"]["bdata"]), dtype="<f8"),
+        figure["data"][0]["y"],
+    )
+    # Not within the tolerance
+    assert (
+        wcc.Graph.encode_figure_arrays(figure, float32_tolerance=1e-12)["data"][0]["y"][
+            "dtype"
+        ]
+        == "f8"
+    )
+
+    graph = wcc.Graph(
+        figure={"data": [{"y": np.arange(3, dtype="int64")}]}, typed_arrays=True
+    )
+    assert graph.figure["data"][0]["y"]["dtype"] == "i1"
+
+
+def _decode(typed_array, dtype):
+    return np.frombuffer(base64.b64decode(typed_array["bdata"]), dtype=dtype)
+
+
+def test_typed_arrays_plotly_figure():
+    figure = _figure()
+    # plotly encodes the arrays itself, as float64 typed arrays
+    encoded = wcc.Graph.encode_figure_arrays(go.Figure(figure), float32_tolerance=1e-5)
+    trace = encoded["data"][0]
+
+    assert trace["x"]["dtype"] == "i4"
+    assert trace["y"]["dtype"] == "f4"
+    assert np.allclose(_decode(trace["y"], "<f4"), figure["data"][0]["y"], rtol=1e-5)
+    assert trace["marker"]["color"]["dtype"] == "f4"
+
+    exact = wcc.Graph.encode_figure_arrays(go.Figure(figure))
+    assert exact["data"][0]["y"]["dtype"] == "f8"
+
+    heatmap = wcc.Graph.encode_figure_arrays(
+        go.Figure(go.Heatmap(z=np.arange(6.0).reshape(2, 3))), float32_tolerance=1e-5
+    )["data"][0]
+    assert heatmap["z"]["dtype"] == "f4"
+    assert heatmap["z"]["shape"] == "2, 3"
+
+
+def test_typed_arrays_in_lists():
+    figure = {
+        "data": [
+            {
+                "type": "splom",
+                "dimensions": [
+                    {"label": "a", "values": np.arange(3.0)},
+                    {"label": "b", "values": [1, 2, 3]},
+                ],
+            }
+        ]
+    }
+    for encoded in [
+        wcc.Graph.encode_figure_arrays(figure, float32_tolerance=1e-5),
+        wcc.Graph.encode_figure_arrays(go.Figure(figure), float32_tolerance=1e-5),
+    ]:
+        dimensions = encoded["data"][0]["dimensions"]
+        assert dimensions[0]["values"]["dtype"] == "f4"
+        assert dimensions[1] == {"label": "b", "values": [1, 2, 3]}
+
+
+def test_typed_arrays_float_widths():
+    for dtype, expected in [("float16", "f4"), (np.longdouble, "f8")]:
+        values = np.array([0.1, 1 / 3], dtype=dtype)
+        encoded = wcc.Graph.encode_figure_arrays({"data": [{"y": values}]})
+        typed_array = encoded["data"][0]["y"]
+        assert typed_array["dtype"] == expected
+        assert np.array_equal(
+            _decode(typed_array, "<" + expected), values.astype(expected)
+        )
+
+
+def test_typed_arrays_payload():
+    list_time, list_bytes = _encode()
+    f8_time, f8_bytes = _encode(typed_arrays=True)
+    f4_time, f4_bytes = _encode(typed_arrays=True, float32_tolerance=1e-5)
+
+    print(
+        f"\n{N_POINTS} points as JSON lists: {list_time:.2f} s, {list_bytes} bytes"
+        f"\n{N_POINTS} points as typed arrays: {f8_time:.2f} s, {f8_bytes} bytes"
+        f"\n{N_POINTS} points as float32 typed arrays: "
+        f"{f4_time:.2f} s, {f4_bytes} bytes"
+    )
+    assert f8_bytes < 0.75 * list_bytes
+    assert f4_bytes < 0.6 * f8_bytes
@@ -0,0 +1,92 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import subprocess  # nosec
+import sys
+
+
+def _import_times(statement: str) -> dict:
+    """Returns cumulative import time in microseconds per module,
+    as reported by `python -X importtime`.
+    """
+    result = subprocess.run(  # nosec
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_import_time():
+    times = _import_times("import webviz_core_components")
+
+    dash_time = times["dash"]
+    package_time = times["webviz_core_components"] - dash_time
+    print(
+        f"\nimport webviz_core_components: {package_time / 1e3:.1f} ms "
+        f"(excluding {dash_time / 1e3:.1f} ms importing dash)"
+    )
+
+    # Component classes should only be imported on first access
+    assert [
+        module
+        for module in times
+        if module.startswith("webviz_core_components.")
+        and module != "webviz_core_components.wrapped_components"
+    ] == []
+
+
+def test_component_access_imports_only_accessed_components():
+    result = subprocess.run(  # nosec
+        [
+            sys.executable,
+            "-c",
+            "import sys; import webviz_core_components as wcc; "
+            "wcc.Graph; wcc.SmartNodeSelector; print(*sys.modules)",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    modules = result.stdout.split()
+
+    assert "webviz_core_components.wrapped_components.graph" in modules
+    assert "webviz_core_components.SmartNodeSelector" in modules
+    assert "webviz_core_components.Select" not in modules
+
+
+def test_submodule_import_keeps_component_class():
+    result = subprocess.run(  # nosec
+        [
+            sys.executable,
+            "-c",
+            "import webviz_core_components.Select; "
+            "from webviz_core_components.WebvizPluginPlaceholder import "
+            "WebvizPluginPlaceholder; "
+            "import webviz_core_components as wcc; "
+            "print(wcc.Select.__module__, wcc.Select.__name__); "
+            "print(wcc.WebvizPluginPlaceholder.__name__)",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.splitlines() == [
+        "webviz_core_components.Select Select",
+        "WebvizPluginPlaceholderWrapper",
+    ]
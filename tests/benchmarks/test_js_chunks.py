@@ -0,0 +1,83 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+"""Checks of the JavaScript bundle and the chunks split from it by webpack,
+which are loaded when the features using them are first used.
+
+The checks of the built files are skipped if the bundle is not built.
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+import webviz_core_components as wcc
+
+SOURCE_PATH = Path(__file__).parents[2] / "react" / "src" / "lib"
+PACKAGE_PATH = Path(wcc.__file__).parent
+
+# The single bundle holding everything was 2.98 MB
+MAIN_BUNDLE_BUDGET = 2_800_000
+
+CHUNK_NAME = re.compile(r'webpackChunkName:\s*"([^"]+)"')
+
+
+def _registered_chunks():
+    # pylint: disable=protected-access
+    return [resource for resource in wcc._js_dist if resource.get("async")]
+
+
+def test_registered_chunks():
+    chunk_names = {
+        name
+        for path in SOURCE_PATH.rglob("*")
+        if path.suffix in (".ts", ".tsx", ".js", ".jsx")
+        for name in CHUNK_NAME.findall(path.read_text(encoding="utf8"))
+    }
+
+    assert sorted(
+        resource["relative_package_path"] for resource in _registered_chunks()
+    ) == [f"webviz_core_components-{name}.min.js" for name in sorted(chunk_names)]
+    assert sorted(
+        resource["dev_package_path"] for resource in _registered_chunks()
+    ) == [f"webviz_core_components-{name}.dev.js" for name in sorted(chunk_names)]
+
+
+def test_main_bundle_size_budget():
+    main_bundle = PACKAGE_PATH / "webviz_core_components.min.js"
+    if not main_bundle.exists():
+        pytest.skip("The JavaScript bundle is not built.")
+
+    chunks = [
+        PACKAGE_PATH / resource["relative_package_path"]
+        for resource in _registered_chunks()
+    ]
+    assert [chunk.name for chunk in chunks if not chunk.exists()] == []
+
+    print(
+        f"\n{main_bundle.name}: {main_bundle.stat().st_size} bytes, "
+        + ", ".join(f"{chunk.name}: {chunk.stat().st_size} bytes" for chunk in chunks)
+    )
+    assert main_bundle.stat().st_size <= MAIN_BUNDLE_BUDGET
+
+
+def test_single_stylesheet():
+    if not (PACKAGE_PATH / "webviz_core_components.min.js").exists():
+        pytest.skip("The JavaScript bundle is not built.")
+
+    # Styles imported only by a chunk would be extracted to a CSS file of its own,
+    # which is not registered in _css_dist
+    assert [path.name for path in PACKAGE_PATH.glob("*.css")] == [
+        "webviz_core_components.css"
+    ]
+    # pylint: disable=protected-access
+    assert [resource["relative_package_path"] for resource in wcc._css_dist] == [
+        "webviz_core_components.css"
+    ]
@@ -0,0 +1,135 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import time
+import tracemalloc
+
+import pytest
+from dash import dcc, html
+from dash._utils import to_json
+
+import webviz_core_components as wcc
+from webviz_core_components.layout_profiler import (
+    LayoutBudgetExceeded,
+    _layout_profiler,
+    profile_layout,
+)
+
+
+def _plugin(index: int) -> html.Div:
+    return html.Div(
+        id=f"plugin-{index}",
+        children=[
+            wcc.Dropdown(
+                label="Wells",
+                id=f"wells-{index}",
+                options=[{"label": f"OP_{i}", "value": f"OP_{i}"} for i in range(500)],
+            ),
+            dcc.Graph(
+                id=f"graph-{index}",
+                figure={"data": [{"x": list(range(2000)), "y": list(range(2000))}]},
+            ),
+            # Identical in all plugins
+            html.Div([html.P("Some help text " * 100) for _ in range(5)]),
+        ],
+    )
+
+
+def test_layout_profiler():
+    layout = html.Div([_plugin(i) for i in range(10)])
+    profile = profile_layout(layout)
+
+    # Within a few bytes of separators per component
+    serialized_size = len(to_json(layout))
+    assert abs(profile.total_size - serialized_size) < 0.01 * serialized_size
+
+    assert profile.largest_subtrees[0].path == "Div[0]"
+    assert profile.largest_subtrees[0].size == profile.total_size
+    assert max(profile.size_by_prop, key=profile.size_by_prop.get) in [
+        "dash.Dropdown.options",
+        "dash.Graph.figure",
+    ]
+    assert (
+        profile.size_by_type["dash.Graph"] > profile.size_by_prop["dash.Graph.figure"]
+    )
+
+    (duplicate,) = [
+        duplicate
+        for duplicate in profile.duplicated_subtrees
+        if duplicate.component_type == "dash.Div"
+    ]
+    assert duplicate.count == 10
+    assert duplicate.paths[0] == "Div[0] > Div#plugin-0 > Div[2]"
+
+    profile.check_budgets(max_total_size=profile.total_size)
+    with pytest.raises(LayoutBudgetExceeded, match="dash.Graph.figure"):
+        profile.check_budgets(
+            max_total_size=profile.total_size,
+            max_size_by_prop={"dash.Graph.figure": 1000},
+        )
+    with pytest.raises(LayoutBudgetExceeded, match="duplicated subtrees"):
+        profile.check_budgets(max_duplicated_size=1000)
+
+    print("\n" + profile.report(top=5))
+
+
+def test_layout_profiler_nested_layout(monkeypatch):
+    depth = 2000
+    layout = html.Div(id="leaf", children="Some text")
+    for level in reversed(range(depth)):
+        layout = html.Div(id=f"level-{level}", children=layout)
+
+    serializations = []
+
+    def _count_serializations(value):
+        serializations.append(value)
+        return to_json_plotly(value)
+
+    to_json_plotly = _layout_profiler.to_json_plotly
+    monkeypatch.setattr(_layout_profiler, "to_json_plotly", _count_serializations)
+    profile = profile_layout(layout, num_largest_subtrees=3)
+
+    # Each prop value is serialized once, the subtree sizes are summed bottom-up
+    assert len(serializations) == depth + 2
+    sizes = [subtree.size for subtree in profile.largest_subtrees]
+    assert sizes[0] == profile.total_size
+    assert sizes[0] - sizes[1] == sizes[1] - sizes[2]
+    assert profile.largest_subtrees[2].path == (
+        "Div#level-0 > Div#level-1 > Div#level-2"
+    )
+
+    # The size of a subtree is the size of the subtree profiled on its own
+    subtree = layout.children.children
+    monkeypatch.undo()
+    assert profile_layout(subtree).total_size == sizes[2]
+
+
+def test_layout_profiler_memory():
+    layout = html.Div([_plugin(i) for i in range(200)])
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    serialized_size = len(to_json(layout))
+    serialize_time = time.perf_counter() - start
+    serialize_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+
+    start = time.perf_counter()
+    profile = profile_layout(layout)
+    profile_time = time.perf_counter() - start
+    profile_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(
+        f"\nlayout {serialized_size / 1e6:.1f} MB: serializing "
+        f"{serialize_time:.2f} s, peak {serialize_peak / 1e6:.1f} MB; "
+        f"profiling {profile_time:.2f} s, peak {profile_peak / 1e6:.1f} MB"
+    )
+    assert profile.total_size > 0.99 * serialized_size
+    assert profile_peak < serialize_peak / 2
@@ -0,0 +1,99 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import json
+import time
+from pathlib import Path
+
+from dash import Dash, html
+
+import webviz_core_components as wcc
+from webviz_core_components.menu import menu_search_index
+
+N_SECTIONS = 10
+N_GROUPS = 10
+N_PAGES = 100
+
+# Shared with the tests of the search index built in the browser
+SEARCH_INDEX_FIXTURE = (
+    Path(__file__).parents[2] / "react/src/tests/js/Menu/search-index.json"
+)
+
+
+def _navigation_items():
+    return [
+        {
+            "type": "section",
+            "title": f"Section {section}",
+            "content": [
+                {
+                    "type": "group",
+                    "title": f"Group {section}-{group}",
+                    "content": [
+                        {
+                            "type": "page",
+                            "title": f"Well OP {section}-{group}-{page}",
+                            "href": f"/{section}/{group}/{page}",
+                        }
+                        for page in range(N_PAGES)
+                    ],
+                }
+                for group in range(N_GROUPS)
+            ],
+        }
+        for section in range(N_SECTIONS)
+    ]
+
+
+def test_menu_search_index():
+    navigation_items = _navigation_items()
+
+    start = time.perf_counter()
+    search_index = menu_search_index(navigation_items)
+    index_time = time.perf_counter() - start
+
+    print(f"\n{len(search_index)} pages indexed in {index_time * 1000:.1f} ms")
+    assert len(search_index) == N_SECTIONS * N_GROUPS * N_PAGES
+    assert search_index[0] == "wellop0-0-0"
+    assert search_index[-1] == "wellop9-9-99"
+
+
+def test_menu_search_index_as_in_browser():
+    fixture = json.loads(SEARCH_INDEX_FIXTURE.read_text(encoding="utf8"))
+    assert menu_search_index(fixture["navigationItems"]) == fixture["searchIndex"]
+
+
+def test_menu_filter(dash_duo):
+    navigation_items = _navigation_items()
+    app = Dash(__name__)
+    app.layout = html.Div(
+        [
+            wcc.Menu(
+                id="menu",
+                navigationItems=navigation_items,
+                searchIndex=menu_search_index(navigation_items),
+                initiallyPinned=True,
+            )
+        ]
+    )
+
+    dash_duo.start_server(app)
+    dash_duo.wait_for_element("#menu-filter")
+
+    start = time.perf_counter()
+    dash_duo.find_element("#menu-filter").send_keys("well op 3-4-99")
+    dash_duo.wait_for_text_to_equal(".Menu__Page", "Well OP 3-4-99", timeout=10)
+    filter_time = time.perf_counter() - start
+
+    print(f"\n{N_SECTIONS * N_GROUPS * N_PAGES} pages filtered in {filter_time:.2f} s")
+    assert len(dash_duo.find_elements(".Menu__Page")) == 1
+
+    assert (
+        dash_duo.get_logs() is None or dash_duo.get_logs() == []
+    ), f"browser console should contain no error: {dash_duo.get_logs()}"
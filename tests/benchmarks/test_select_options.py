@@ -0,0 +1,68 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import time
+
+from dash import Dash
+from dash._utils import to_json
+
+import webviz_core_components as wcc
+
+N_OPTIONS = 200_000
+
+
+def _labels_and_values():
+    labels = [f"Well OP_{i}" for i in range(N_OPTIONS)]
+    values = [f"OP_{i}" for i in range(N_OPTIONS)]
+    return labels, values
+
+
+def _payload_bytes(component) -> int:
+    return len(to_json(component))
+
+
+def test_select_options_payload():
+    labels, values = _labels_and_values()
+    options = [{"label": label, "value": value} for label, value in zip(labels, values)]
+    compact_options = {"labels": labels, "values": values}
+
+    list_bytes = _payload_bytes(wcc.SelectWithLabel(id="select", options=options))
+    compact_bytes = _payload_bytes(
+        wcc.SelectWithLabel(id="select", options=compact_options)
+    )
+    print(
+        f"\n{N_OPTIONS} options: list of dicts {list_bytes} B, "
+        f"compact {compact_bytes} B ({compact_bytes / list_bytes:.0%})"
+    )
+    assert compact_bytes < 0.75 * list_bytes
+
+
+def test_select_virtualized_render(dash_duo):
+    labels, values = _labels_and_values()
+    app = Dash(__name__)
+    app.layout = wcc.Select(
+        id="select",
+        options={"labels": labels, "values": values},
+        value=[values[0]],
+        size=10,
+        virtualized=True,
+    )
+
+    dash_duo.start_server(app)
+    start = time.perf_counter()
+    dash_duo.wait_for_element(".webviz-config-select-virtualized-option")
+    render_time = time.perf_counter() - start
+
+    n_rendered = len(dash_duo.find_elements(".webviz-config-select-virtualized-option"))
+    print(f"\n{N_OPTIONS} options: {n_rendered} rendered in {render_time:.2f} s")
+    assert n_rendered < 100
+
+    assert (
+        dash_duo.get_logs() is None or dash_duo.get_logs() == []
+    ), f"browser console should contain no error: {dash_duo.get_logs()}"
@@ -0,0 +1,110 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import time
+
+from dash import html, dcc
+from dash._utils import to_json
+
+import webviz_core_components as wcc
+
+N_WIDGETS_PER_TYPE = 120
+
+OPTIONS = [{"label": f"Option {i}", "value": i} for i in range(10)]
+
+
+def _wcc_widgets(i):
+    return [
+        wcc.Checklist(label=f"Checklist {i}", id=f"checklist-{i}", options=OPTIONS),
+        wcc.RadioItems(label=f"Radio {i}", id=f"radio-{i}", options=OPTIONS),
+        wcc.Slider(label=f"Slider {i}", id=f"slider-{i}", min=0, max=10),
+        wcc.RangeSlider(label=f"Range {i}", id=f"range-{i}", min=0, max=10),
+        wcc.Dropdown(label=f"Dropdown {i}", id=f"dropdown-{i}", options=OPTIONS),
+    ]
+
+
+def _plain_dash_widgets(i):
+    """The same component trees as given by _wcc_widgets,
+    built using the standard Dash component constructors.
+    """
+
+    def wrap(label, component):
+        wrapper = html.Div()
+        wrapper.children = html.Div(
+            style={"fontSize": "15px"}, children=[html.Label(label), component]
+        )
+        return wrapper
+
+    persistence = {"persistence": True, "persistence_type": "session"}
+    return [
+        wrap(
+            f"Checklist {i}",
+            dcc.Checklist(
+                id=f"checklist-{i}",
+                options=OPTIONS,
+                className=" webviz-block-options",
+                **persistence,
+            ),
+        ),
+        wrap(
+            f"Radio {i}",
+            dcc.RadioItems(
+                id=f"radio-{i}",
+                options=OPTIONS,
+                className=" webviz-block-options",
+                **persistence,
+            ),
+        ),
+        wrap(
+            f"Slider {i}",
+            html.Div(
+                className="webviz-slider",
+                children=dcc.Slider(id=f"slider-{i}", min=0, max=10, **persistence),
+            ),
+        ),
+        wrap(
+            f"Range {i}",
+            html.Div(
+                className="webviz-slider",
+                children=dcc.RangeSlider(id=f"range-{i}", min=0, max=10, **persistence),
+            ),
+        ),
+        wrap(
+            f"Dropdown {i}",
+            html.Div(
+                className="webviz-dropdown",
+                children=dcc.Dropdown(
+                    id=f"dropdown-{i}", options=OPTIONS, **persistence
+                ),
+            ),
+        ),
+    ]
+
+
+def _build_panel(widget_factory):
+    start = time.perf_counter()
+    panel = html.Div(
+        [widget for i in range(N_WIDGETS_PER_TYPE) for widget in widget_factory(i)]
+    )
+    return panel, time.perf_counter() - start
+
+
+def test_settings_panel_construction():
+    panel, wcc_time = _build_panel(_wcc_widgets)
+    reference_panel, reference_time = _build_panel(_plain_dash_widgets)
+
+    n_widgets = len(panel.children)
+    print(
+        f"\nSettings panel with {n_widgets} widgets: "
+        f"{wcc_time * 1e3:.1f} ms using wcc widgets, "
+        f"{reference_time * 1e3:.1f} ms using plain Dash components"
+    )
+
+    assert n_widgets >= 500
+    assert to_json(panel) == to_json(reference_panel)
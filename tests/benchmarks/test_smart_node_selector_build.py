@@ -0,0 +1,74 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import time
+
+import pytest
+
+from webviz_core_components.smart_node_selector import build_tree_data
+
+
+def _vector_paths(n_paths: int) -> list:
+    n_wells = 1000
+    return [f"iter-0:FOPT_{i // n_wells}:WELL:OP_{i % n_wells}" for i in range(n_paths)]
+
+
+@pytest.mark.parametrize("n_paths", [10_000, 100_000, 1_000_000])
+def test_build_tree_data_throughput(n_paths):
+    paths = _vector_paths(n_paths)
+
+    start = time.perf_counter()
+    tree_data = build_tree_data(paths, num_meta_nodes=1)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert build_tree_data(paths, num_meta_nodes=1) is tree_data
+    memoized_time = time.perf_counter() - start
+
+    print(
+        f"\n{n_paths} paths: {n_paths / build_time / 1e6:.2f} M paths/s "
+        f"({build_time * 1000:.0f} ms), memoized {memoized_time * 1e6:.0f} µs"
+    )
+    assert len(tree_data) == 1
+    assert len(tree_data[0]["children"]) == -(-n_paths // 1000)
+
+
+def test_build_tree_data_structure():
+    meta_data = {"iter-0": {"color": "#FF0000"}, "iter-0:FOPT": {"description": "D"}}
+    tree_data = build_tree_data(
+        iter(["iter-0:FOPT", "iter-0:WOPT:OP_1", "iter-0:WOPT:OP_2", "iter-0:FOPT"]),
+        num_meta_nodes=1,
+        meta_data=meta_data,
+    )
+    assert tree_data == [
+        {
+            "name": "iter-0",
+            "color": "#FF0000",
+            "children": [
+                {"name": "FOPT", "description": "D"},
+                {"name": "WOPT", "children": [{"name": "OP_1"}, {"name": "OP_2"}]},
+            ],
+        }
+    ]
+
+    # A leaf becoming an inner node
+    assert build_tree_data(iter(["A:B", "A:B:C"])) == [
+        {"name": "A", "children": [{"name": "B", "children": [{"name": "C"}]}]}
+    ]
+
+
+@pytest.mark.parametrize("path", ["", "A::B", ":A", "A:"])
+def test_build_tree_data_invalid_paths(path):
+    with pytest.raises(ValueError):
+        build_tree_data([path])
+
+
+def test_build_tree_data_meta_nodes():
+    with pytest.raises(ValueError):
+        build_tree_data(["iter-0"], num_meta_nodes=1)
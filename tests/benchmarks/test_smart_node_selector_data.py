@@ -0,0 +1,93 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import json
+import time
+
+import pytest
+
+from webviz_core_components.smart_node_selector import LazyTreeData, flatten_tree_data
+
+
+def _ensemble_tree(n_leaves: int) -> list:
+    n_vectors = 100
+    return [
+        {
+            "name": f"VECTOR_{i}",
+            "description": f"Vector number {i}",
+            "children": [{"name": f"WELL_{j}"} for j in range(n_leaves // n_vectors)],
+        }
+        for i in range(n_vectors)
+    ]
+
+
+@pytest.mark.parametrize("n_leaves", [10_000, 100_000, 1_000_000])
+def test_flatten_tree_data(n_leaves):
+    tree = _ensemble_tree(n_leaves)
+
+    start = time.perf_counter()
+    flat_data = flatten_tree_data(tree)
+    flatten_time = time.perf_counter() - start
+
+    nested_bytes = len(json.dumps(tree, separators=(",", ":")))
+    flat_bytes = len(json.dumps(flat_data, separators=(",", ":")))
+    print(
+        f"\n{n_leaves} leaves: flattened in {flatten_time * 1e3:.0f} ms, "
+        f"{nested_bytes} bytes nested -> {flat_bytes} bytes flattened"
+    )
+
+    assert len(flat_data["names"]) == n_leaves + 100
+    assert flat_bytes < nested_bytes
+
+
+def test_flatten_tree_data_order_and_meta_data():
+    flat_data = flatten_tree_data(
+        [
+            {"name": "a", "color": "red", "children": [{"name": "b"}, {"name": "c"}]},
+            {"name": "d", "children": [{"name": "e", "description": "E"}]},
+        ]
+    )
+
+    assert flat_data == {
+        "names": ["a", "b", "c", "d", "e"],
+        "parents": [-1, 0, 0, -1, 3],
+        "metaData": {"0": {"color": "red"}, "4": {"description": "E"}},
+    }
+
+
+def test_flatten_tree_data_invalid_name():
+    with pytest.raises(ValueError, match='"a"'):
+        flatten_tree_data([{"name": "a", "children": [{"name": ""}]}])
+
+
+def test_lazy_tree_data():
+    tree = _ensemble_tree(100_000)
+    lazy_tree = LazyTreeData(tree)
+
+    start = time.perf_counter()
+    initial_data = lazy_tree.initial_data()
+    initial_time = time.perf_counter() - start
+
+    full_bytes = len(json.dumps(tree, separators=(",", ":")))
+    initial_bytes = len(json.dumps(initial_data, separators=(",", ":")))
+    print(
+        f"\nfull payload {full_bytes} B, initial lazy payload {initial_bytes} B "
+        f"({initial_time * 1000:.1f} ms)"
+    )
+
+    assert initial_bytes < full_bytes / 100
+    assert initial_data[0] == {
+        "name": "VECTOR_0",
+        "description": "Vector number 0",
+        "lazyChildren": True,
+    }
+    assert lazy_tree.children("VECTOR_1") == tree[1]["children"]
+    assert lazy_tree.children("VECTOR_1:WELL_0") is None
+    assert lazy_tree.children("UNKNOWN") is None
+    assert flatten_tree_data(initial_data)["metaData"]["0"]["lazyChildren"]
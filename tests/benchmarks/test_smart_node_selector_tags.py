@@ -0,0 +1,143 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import re
+import time
+
+from webviz_core_components.smart_node_selector import (
+    TagResolver,
+    build_tree_data,
+    flatten_tree_data,
+)
+
+N_VECTORS = 1000
+N_WELLS = 100
+
+
+def _vector_paths():
+    return [f"VECTOR_{i}:WELL_{j}" for i in range(N_VECTORS) for j in range(N_WELLS)]
+
+
+def _persisted_tags():
+    return (
+        [f"VECTOR_{i}:WELL_{i % N_WELLS}" for i in range(0, N_VECTORS, 2)]
+        + [f"VECTOR_{i}:WELL_?" for i in range(1, N_VECTORS, 10)]
+        + [f"VECTOR_{i}*:WELL_1" for i in range(1, 10)]
+        + [f"STALE_{i}:WELL_0" for i in range(100)]
+    )
+
+
+def _resolve_by_scanning(paths, tags):
+    """Resolves each tag by matching it against all node paths, as done by the
+    SmartNodeSelector in the browser.
+    """
+    stringified_paths = "".join(f'"{path}"' for path in paths)
+    resolved = {}
+    for tag in tags:
+        pattern = re.escape(tag).replace(r"\*", '[^:"]*').replace(r"\?", ".")
+        matches = re.findall(f'"({pattern})"', stringified_paths)
+        if matches:
+            resolved[tag] = matches
+    return resolved
+
+
+def test_resolve_persisted_tags(monkeypatch):
+    paths = _vector_paths()
+    tags = _persisted_tags()
+    resolver = TagResolver(build_tree_data(paths))
+
+    # The children of each visited node matched against each name in the tags
+    matched = []
+    # pylint: disable=protected-access
+    match_children = resolver._match_children
+
+    def counted_match_children(node, name):
+        matched.append((node, name))
+        return match_children(node, name)
+
+    monkeypatch.setattr(resolver, "_match_children", counted_match_children)
+
+    start = time.perf_counter()
+    resolved = resolver.resolve_tags(tags)
+    resolve_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = _resolve_by_scanning(paths, tags)
+    scan_time = time.perf_counter() - start
+
+    print(
+        f"\n{len(tags)} tags against {len(paths)} node paths: "
+        f"{scan_time * 1e3:.0f} ms scanning -> {resolve_time * 1e3:.1f} ms resolved"
+    )
+
+    assert resolved.resolved_tags == expected
+    assert resolved.invalid_tags == [f"STALE_{i}:WELL_0" for i in range(100)]
+
+    # Only the vectors matched by the tags are visited, each of them once for
+    # each distinct well name in the tags matching it
+    visited_vectors = {resolver._paths[node] for node, _ in matched if node != -1}
+    assert visited_vectors == {
+        path.split(":")[0] for matches in expected.values() for path in matches
+    }
+    assert len(matched) == len(set(matched))
+
+
+def test_resolve_tags_wildcards_and_or_operator():
+    data = build_tree_data(
+        ["FOPT", "FOPR", "WOPT:OP_1", "WOPT:OP_2", "WOPT:INJ_1", "WGPT:OP|1"]
+    )
+    resolver = TagResolver(data)
+
+    assert resolver.resolve_tags(["FOP?", "W*:OP_*", "WOPT:OP_1|OP_2"]) == (
+        ["FOP?", "W*:OP_*", "WOPT:OP_1|OP_2"],
+        ["FOPT", "FOPR", "WOPT:OP_1", "WOPT:OP_2"],
+        [None, None, None, None],
+        ["WOPT:OP_1|OP_2"],
+        {"FOP?": ["FOPT", "FOPR"], "W*:OP_*": ["WOPT:OP_1", "WOPT:OP_2"]},
+    )
+    assert resolver.resolve_tags(["WGPT:OP|1"]).selected_nodes == ["WGPT:OP|1"]
+
+    resolver = TagResolver(data, allow_or_operator=True)
+    assert resolver.resolve_tags(["WOPT:OP_1|INJ_*"]).selected_nodes == [
+        "WOPT:OP_1",
+        "WOPT:INJ_1",
+    ]
+    assert resolver.resolve_tags(["WOPT:OP_1|"]).invalid_tags == ["WOPT:OP_1|"]
+
+
+def test_resolve_tags_selection():
+    data = build_tree_data(
+        ["FOPT", "WOPT:OP_1", "WOPT:OP_2", "WOPT:OP_3"],
+        meta_data={"WOPT:OP_1": {"id": "op-1"}, "WOPT:OP_2": {"id": "op-2"}},
+    )
+    resolver = TagResolver(flatten_tree_data(data))
+
+    # Empty tags are dropped, tags overlapping earlier tags are not selected
+    resolved = resolver.resolve_tags(["WOPT:OP_2", "", "WOPT", "WOPT:*", "FOPT"])
+    assert resolved.selected_tags == ["WOPT:OP_2", "WOPT", "WOPT:*", "FOPT"]
+    assert resolved.selected_nodes == ["WOPT:OP_2", "FOPT"]
+    assert resolved.selected_ids == ["op-2", None]
+    assert resolved.invalid_tags == ["WOPT"]
+
+    resolved = resolver.resolve_tags(["WOPT:*", "FOPT"], max_num_selected_nodes=2)
+    assert resolved.selected_nodes == ["WOPT:OP_1", "WOPT:OP_2"]
+    assert resolved.selected_ids == ["op-1", "op-2"]
+
+
+def test_resolve_tags_lazy_children():
+    resolver = TagResolver(
+        [
+            {"name": "WOPT", "lazyChildren": True},
+            {"name": "WGPT", "children": [{"name": "OP_1"}]},
+        ]
+    )
+
+    assert resolver.resolve_tags(["WOPT", "W*", "W*:OP_1"]).resolved_tags == {
+        "W*:OP_1": ["WGPT:OP_1"]
+    }
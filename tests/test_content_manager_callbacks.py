@@ -0,0 +1,90 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import time
+from typing import Callable, List
+
+from dash import Dash, Input, Output, html
+import webviz_core_components as wcc
+
+
+class CallbackCounter:
+    """Counts the invocations of a callback listening to the active ids of the
+    content manager, per user interaction.
+    """
+
+    def __init__(self, app: Dash, content_manager_id: str, settle_time: float = 1):
+        self._settle_time = settle_time
+        self.invocations: List[tuple] = []
+
+        @app.callback(
+            Output("callback-count", "children"),
+            Input(content_manager_id, "activePluginId"),
+            Input(content_manager_id, "activeViewId"),
+        )
+        def _count(active_plugin_id, active_view_id):
+            self.invocations.append((active_plugin_id, active_view_id))
+            return str(len(self.invocations))
+
+    def count_during(self, interaction: Callable[[], None]) -> int:
+        before = len(self.invocations)
+        interaction()
+        # Give debounced and chained updates time to arrive
+        time.sleep(self._settle_time)
+        return len(self.invocations) - before
+
+
+def _plugin(plugin_id: str) -> wcc.WebvizPluginWrapper:
+    return wcc.WebvizPluginWrapper(
+        id=plugin_id,
+        name=plugin_id,
+        views=[
+            {
+                "id": f"{plugin_id}-view",
+                "name": "View",
+                "group": "",
+                "showDownload": False,
+            }
+        ],
+        initiallyActiveViewId=f"{plugin_id}-view",
+        children=[html.Div(plugin_id, id=f"{plugin_id}-content")],
+    )
+
+
+def test_content_manager_callbacks(dash_duo):
+    app = Dash(__name__)
+    app.layout = html.Div(
+        [
+            wcc.WebvizContentManager(
+                id="content-manager",
+                children=[_plugin(f"plugin{i}") for i in range(5)],
+            ),
+            html.Div(id="callback-count"),
+        ]
+    )
+    counter = CallbackCounter(app, "content-manager")
+
+    dash_duo.start_server(app)
+    dash_duo.wait_for_text_to_equal("#callback-count", "2")
+    # The initial callback, and one report of the ids of the active plugin,
+    # independent of the number of plugins registering
+    assert len(counter.invocations) == 2
+
+    def click(selector: str) -> Callable[[], None]:
+        return lambda: dash_duo.find_element(selector).click()
+
+    assert counter.count_during(click("#plugin3")) == 1
+    assert counter.invocations[-1] == ("plugin3", "plugin3-view")
+    # Interacting within the already active plugin changes no ids
+    assert counter.count_during(click("#plugin3-content")) == 0
+    assert counter.count_during(click("#plugin1")) == 1
+
+    assert (
+        dash_duo.get_logs() is None or dash_duo.get_logs() == []
+    ), f"browser console should contain no error: {dash_duo.get_logs()}"
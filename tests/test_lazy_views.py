@@ -0,0 +1,82 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import json
+
+from dash import Dash, html
+from dash._utils import to_json
+
+from webviz_core_components.lazy_views import LazyViews
+
+
+def _request_view(app: Dash, view_id: dict) -> tuple:
+    # The callback is identified by its pattern-matching output
+    pattern_id = json.dumps(
+        {**view_id, "plugin": ["MATCH"], "view": ["MATCH"]},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    component_id = json.dumps(view_id, sort_keys=True, separators=(",", ":"))
+    response = app.server.test_client().post(
+        "/_dash-update-component",
+        json={
+            "output": f"{pattern_id}.children",
+            "outputs": {"id": view_id, "property": "children"},
+            "inputs": [{"id": view_id, "property": "requested", "value": 1}],
+            "changedPropIds": [f"{component_id}.requested"],
+            "state": [],
+        },
+    )
+    return response.status_code, response.get_json()
+
+
+def test_lazy_views():
+    app = Dash(__name__)
+    lazy_views = LazyViews(app)
+
+    def view_layout():
+        return html.Div(["x" * 1000] * 100, id="heavy")
+
+    views = [
+        lazy_views.view("plugin", f"plugin-view{i}", view_layout, loaded=i == 0)
+        for i in range(10)
+    ]
+    app.layout = html.Div(views)
+
+    assert views[0].children is not None
+    assert all(view.children is None for view in views[1:])
+    assert len(to_json(app.layout)) < 2 * len(to_json(views[0]))
+
+    status, response = _request_view(app, views[3].id)
+    assert status == 200
+    (view_response,) = response["response"].values()
+    assert view_response["children"]["props"]["id"] == "heavy"
+
+    status, _ = _request_view(
+        app, {"type": "wcc-lazy-view", "plugin": "plugin", "view": "unknown"}
+    )
+    assert status == 204
+
+
+def test_lazy_view_ids():
+    app = Dash(__name__)
+    lazy_views = LazyViews(app)
+
+    # Ids joined by a delimiter would be equal for these views
+    views = [
+        lazy_views.view("a-b", "c", html.Div(id="a-b/c")),
+        lazy_views.view("a", "b-c", html.Div(id="a/b-c")),
+    ]
+    app.layout = html.Div(views)
+
+    assert views[0].id != views[1].id
+    for view, content_id in zip(views, ["a-b/c", "a/b-c"]):
+        _, response = _request_view(app, view.id)
+        (view_response,) = response["response"].values()
+        assert view_response["children"]["props"]["id"] == content_id
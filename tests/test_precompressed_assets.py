@@ -0,0 +1,97 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import gzip
+import json
+
+from dash import Dash, html
+
+from webviz_core_components.static_assets import PrecompressedAssets
+
+BUNDLE = b"console.log('webviz');\n" * 100
+SUITES = "/_dash-component-suites/webviz_core_components"
+
+
+def _app(tmp_path):
+    (tmp_path / "bundle.min.js.gz").write_bytes(gzip.compress(BUNDLE))
+    (tmp_path / "bundle.min.js.br").write_bytes(b"brotli compressed bundle")
+    (tmp_path / "style.css.gz").write_bytes(gzip.compress(b"div {}"))
+    (tmp_path / "precompressed-assets.json").write_text(
+        json.dumps(
+            {
+                "bundle.min.js": {"hash": "0123abcd", "encodings": ["br", "gzip"]},
+                "style.css": {"hash": "4567ef01", "encodings": ["gzip"]},
+            }
+        )
+    )
+
+    app = Dash(__name__)
+    app.layout = html.Div()
+    PrecompressedAssets(app, package_path=tmp_path)
+    return app.server.test_client()
+
+
+def test_precompressed_encodings(tmp_path):
+    client = _app(tmp_path)
+
+    response = client.get(
+        f"{SUITES}/bundle.min.js", headers={"Accept-Encoding": "gzip, deflate, br"}
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "br"
+    assert response.data == b"brotli compressed bundle"
+    assert "javascript" in response.mimetype
+    assert response.headers["Vary"] == "Accept-Encoding"
+
+    response = client.get(
+        f"{SUITES}/bundle.min.js", headers={"Accept-Encoding": "gzip, br;q=0"}
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.data) == BUNDLE
+
+    response = client.get(f"{SUITES}/style.css", headers={"Accept-Encoding": "br"})
+    assert "Content-Encoding" not in response.headers
+
+    # Other files, and clients not accepting any of the encodings, are left to Dash
+    for path, headers in [
+        (f"{SUITES}/bundle.min.js", {}),
+        (f"{SUITES}/unknown.js", {"Accept-Encoding": "gzip"}),
+    ]:
+        assert "Content-Encoding" not in client.get(path, headers=headers).headers
+
+
+def test_precompressed_caching(tmp_path):
+    client = _app(tmp_path)
+    headers = {"Accept-Encoding": "gzip"}
+
+    # Fingerprinted by Dash
+    response = client.get(f"{SUITES}/style.v1_0_0m1700000000.css", headers=headers)
+    assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert gzip.decompress(response.data) == b"div {}"
+
+    response = client.get(f"{SUITES}/style.css", headers=headers)
+    assert response.headers["Cache-Control"] == "no-cache"
+    assert response.headers["ETag"] == '"4567ef01-gzip"'
+
+    response = client.get(
+        f"{SUITES}/style.css", headers={**headers, "If-None-Match": '"4567ef01-gzip"'}
+    )
+    assert response.status_code == 304
+    assert response.data == b""
+
+
+def test_without_manifest(tmp_path):
+    app = Dash(__name__)
+    app.layout = html.Div()
+    PrecompressedAssets(app, package_path=tmp_path)
+
+    response = app.server.test_client().get(
+        f"{SUITES}/bundle.min.js", headers={"Accept-Encoding": "gzip"}
+    )
+    assert "Content-Encoding" not in response.headers
@@ -0,0 +1,124 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import json
+
+import plotly.graph_objects as go
+import pytest
+from dash import Dash, html
+
+np = pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position, no-member
+from webviz_core_components.resampled_graphs import ResampledGraphs
+
+N_POINTS = 1_000_000
+
+
+def _relayout(app: Dash, graph_id: dict, relayout_data: dict) -> tuple:
+    # The callback is identified by its pattern-matching output
+    pattern_id = json.dumps(
+        {**graph_id, "graph": ["MATCH"]}, sort_keys=True, separators=(",", ":")
+    )
+    component_id = json.dumps(graph_id, sort_keys=True, separators=(",", ":"))
+    response = app.server.test_client().post(
+        "/_dash-update-component",
+        json={
+            "output": f"{pattern_id}.figure",
+            "outputs": {"id": graph_id, "property": "figure"},
+            "inputs": [
+                {"id": graph_id, "property": "relayoutData", "value": relayout_data}
+            ],
+            "changedPropIds": [f"{component_id}.relayoutData"],
+            "state": [],
+        },
+    )
+    return response.status_code, response.get_json()
+
+
+def _figure():
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=N_POINTS)
+    y[123_456] = 100
+    return {
+        "data": [
+            {"x": np.arange(N_POINTS) / 10, "y": y, "text": np.arange(N_POINTS)},
+            {"x": [0, 1, 2], "y": [3, 4, 5]},
+        ],
+        "layout": {"title": "Rates"},
+    }
+
+
+def test_resampled_graphs():
+    app = Dash(__name__)
+    resampled_graphs = ResampledGraphs(app, n_points=1000)
+    figure = _figure()
+    graph = resampled_graphs.graph("rates", figure)
+    app.layout = html.Div([graph])
+
+    trace = graph.figure["data"][0]
+    assert len(trace["x"]) <= 1000
+    assert len(trace["text"]) == len(trace["y"])
+    assert trace["y"].max() == 100
+    assert trace["x"][0] == 0 and trace["x"][-1] == figure["data"][0]["x"][-1]
+    assert graph.figure["data"][1] is figure["data"][1]
+    assert graph.figure["layout"]["uirevision"] == "rates"
+    assert len(figure["data"][0]["y"]) == N_POINTS
+
+    status, response = _relayout(
+        app, graph.id, {"xaxis.range[0]": 1000, "xaxis.range[1]": 1010}
+    )
+    assert status == 200
+    (operations,) = response["response"].values()
+    x = next(
+        operation["params"]["value"]
+        for operation in operations["figure"]["operations"]
+        if operation["location"] == ["data", 0, "x"]
+    )
+    # All 101 points in the range, and one on each side
+    assert len(x) == 103
+    assert x[0] < 1000 and x[-1] > 1010
+
+    status, _ = _relayout(app, graph.id, {"dragmode": "pan"})
+    assert status == 204
+
+
+def test_resampled_graphs_plotly_figure():
+    app = Dash(__name__)
+    resampled_graphs = ResampledGraphs(app, n_points=1000)
+    figure = _figure()
+    # The arrays are encoded as typed arrays when plotly converts it to a dict
+    graph = resampled_graphs.graph("rates", go.Figure(figure))
+    app.layout = html.Div([graph])
+
+    trace = graph.figure["data"][0]
+    assert len(trace["x"]) <= 1000
+    assert len(trace["text"]) == len(trace["y"])
+    assert trace["y"].max() == 100
+    assert trace["x"][-1] == figure["data"][0]["x"][-1]
+
+    status, _ = _relayout(
+        app, graph.id, {"xaxis.range[0]": 1000, "xaxis.range[1]": 1010}
+    )
+    assert status == 200
+
+
+def test_resampled_graphs_cache_bound():
+    app = Dash(__name__)
+    figure = _figure()
+    trace_bytes = sum(array.nbytes for array in figure["data"][0].values())
+    resampled_graphs = ResampledGraphs(app, max_cache_bytes=int(2.5 * trace_bytes))
+
+    graphs = [resampled_graphs.graph(f"graph-{i}", figure) for i in range(4)]
+    app.layout = html.Div(graphs)
+
+    status, _ = _relayout(app, graphs[0].id, {"xaxis.autorange": True})
+    assert status == 204
+    status, _ = _relayout(app, graphs[3].id, {"xaxis.autorange": True})
+    assert status == 200
@@ -0,0 +1,136 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+import pytest
+from dash import Dash, dcc
+
+import webviz_core_components as wcc
+from webviz_core_components.dropdown_options import SearchableOptions
+
+WELLS = ["OP_1", "OP_2", "OP_10", "INJ_1", "INJ_OP_1", "Op_3"]
+STORE_ID = "well-persisted-value"
+
+
+def _update(app: Dash, changed: str, search_value=None, value=None, persisted=None):
+    """Calls the callback registered for the dropdown, with the given prop
+    (`search_value`, `value` or `data` of the store) changed.
+    """
+    inputs = [
+        {"id": "well", "property": "search_value", "value": search_value},
+        {"id": "well", "property": "value", "value": value},
+        {"id": STORE_ID, "property": "data", "value": persisted},
+    ]
+    response = app.server.test_client().post(
+        "/_dash-update-component",
+        json={
+            "output": f"..well.options...well.value...{STORE_ID}.data..",
+            "outputs": [
+                {"id": "well", "property": "options"},
+                {"id": "well", "property": "value"},
+                {"id": STORE_ID, "property": "data"},
+            ],
+            "inputs": inputs,
+            "changedPropIds": [changed] if changed else [],
+            "state": [],
+        },
+    )
+    if response.status_code == 204:
+        return None
+    return response.get_json()["response"]
+
+
+def test_search():
+    options = SearchableOptions(WELLS, max_results=3)
+
+    assert [option["value"] for option in options.search("op")] == [
+        "OP_1",
+        "OP_10",
+        "OP_2",
+    ]
+    assert [option["value"] for option in options.search("_op")] == ["INJ_OP_1"]
+    assert [option["value"] for option in options.search("J_")] == [
+        "INJ_1",
+        "INJ_OP_1",
+    ]
+    assert options.search("gas") == []
+    assert len(options.search("")) == 3
+
+    options = SearchableOptions({"a": "Alpha", "b": "Beta"})
+    assert options.search("ALP") == [{"label": "Alpha", "value": "a"}]
+    assert options.options_for(["b", "c", "a"]) == [
+        {"label": "Beta", "value": "b"},
+        {"label": "Alpha", "value": "a"},
+    ]
+
+
+def test_searchable_dropdown_layout():
+    options = SearchableOptions(WELLS)
+    dropdown = wcc.Dropdown(
+        label="Well", id="well", searchable_options=options, value="OP_2"
+    )
+    inner_dropdown, store = dropdown.children.children[1].children
+
+    assert isinstance(inner_dropdown, dcc.Dropdown)
+    assert inner_dropdown.options == [{"label": "OP_2", "value": "OP_2"}]
+    assert not getattr(inner_dropdown, "persistence", None)
+    assert store.id == STORE_ID
+    assert store.storage_type == "session"
+    assert store.data == {"original": "OP_2"}
+
+    store = (
+        wcc.Dropdown(id="well", searchable_options=options, persistence=False)
+        .children.children[0]
+        .children[1]
+    )
+    assert store.storage_type == "memory"
+    assert store.data is None
+
+    with pytest.raises(ValueError):
+        wcc.Dropdown(searchable_options=options)
+
+
+def test_searchable_dropdown_callback():
+    app = Dash(__name__)
+    options = SearchableOptions(WELLS, max_results=2)
+    app.layout = wcc.Dropdown(id="well", searchable_options=options, multi=True)
+    options.register_callback(app, "well")
+
+    # Search results, keeping the selected options
+    response = _update(app, "well.search_value", search_value="inj", value=["OP_2"])
+    assert [option["value"] for option in response["well"]["options"]] == [
+        "INJ_1",
+        "INJ_OP_1",
+        "OP_2",
+    ]
+    assert _update(app, "well.search_value", search_value="") is None
+
+    # Persisting the value
+    response = _update(app, "well.value", value=["OP_1"], persisted={"original": None})
+    assert response == {STORE_ID: {"data": {"original": None, "value": ["OP_1"]}}}
+    assert _update(app, "well.value", value=["OP_1"]) is None
+
+    # Restoring the persisted value, without values no longer among the options
+    response = _update(
+        app,
+        f"{STORE_ID}.data",
+        persisted={"original": None, "value": ["OP_10", "OP_4"]},
+    )
+    assert response["well"] == {
+        "options": [{"label": "OP_10", "value": "OP_10"}],
+        "value": ["OP_10"],
+    }
+
+    # Not restored when the value in the layout has changed
+    response = _update(
+        app,
+        f"{STORE_ID}.data",
+        value=["OP_1"],
+        persisted={"original": None, "value": ["OP_10"]},
+    )
+    assert response == {STORE_ID: {"data": {"original": ["OP_1"]}}}
@@ -0,0 +1,53 @@
+##################################################################
+#
+# Copyright (c) 2026- Equinor ASA
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+##################################################################
+
+from dash import Dash, html
+
+from webviz_core_components.download import StreamedDownloads
+
+
+def test_streamed_downloads(tmp_path):
+    app = Dash(__name__, requests_pathname_prefix="/app/", routes_pathname_prefix="/")
+    app.layout = html.Div()
+    downloads = StreamedDownloads(app)
+    client = app.server.test_client()
+
+    file_path = tmp_path / "data.csv"
+    file_path.write_bytes(b"a,b\n1,2\n")
+    descriptor = downloads.download(
+        file_path, filename="data.csv", mime_type="text/csv"
+    )
+    assert descriptor["filename"] == "data.csv"
+    assert descriptor["mime_type"] == "text/csv"
+    assert descriptor["url"].startswith("/app/_wcc-download/")
+    assert "content" not in descriptor
+
+    url = descriptor["url"][len("/app") :]
+    for _ in range(2):
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.data == b"a,b\n1,2\n"
+        assert "attachment" in response.headers["Content-Disposition"]
+
+    def chunks():
+        for i in range(1000):
+            yield f"{i}\n".encode()
+
+    expected = b"".join(chunks())
+
+    url = downloads.download(chunks, filename="numbers.txt")["url"][len("/app") :]
+    assert client.get(url).data == expected
+    assert client.get(url).data == expected
+
+    # A generator can only be consumed once
+    url = downloads.download(chunks(), filename="numbers.txt")["url"][len("/app") :]
+    assert client.get(url).data == expected
+    assert client.get(url).status_code == 404
+
+    assert client.get("/_wcc-download/unknown").status_code == 404
@@ -3,25 +3,12 @@ from __future__ import print_function as _
 import os as _os
 import sys as _sys
 import json
-
-from importlib.metadata import version
+import types as _types
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING as _TYPE_CHECKING
 
 import dash as _dash
 
-from ._imports_ import *
-from ._imports_ import __all__
-
-from .wrapped_components import *
-from .wrapped_components import __all__ as wrapped_components
-
-from .WebvizPluginPlaceholderWrapper import (
-    WebvizPluginPlaceholderWrapper as WebvizPluginPlaceholder,
-)
-
-__all__ += wrapped_components
-
-__version__ = version(__name__)
-
 if not hasattr(_dash, "development"):
     print(
         "Dash was not successfully imported. "
@@ -31,40 +18,137 @@ if not hasattr(_dash, "development"):
     )
     _sys.exit(1)
 
+# pylint: disable=wrong-import-position
+from dash.development.base_component import ComponentRegistry as _ComponentRegistry
+
+from . import wrapped_components as _wrapped_components
+
 _basepath = _os.path.dirname(__file__)
 _filepath = _os.path.abspath(_os.path.join(_basepath, "package.json"))
-with open(_filepath, encoding="utf8") as f:
-    package = json.load(f)
-
-package_name = (
-    package["name"]
-    .replace(" ", "_")
-    .replace("-", "_")
-    .replace("/", "_")
-    .replace("@", "")
-)
 
 _current_path = _os.path.dirname(_os.path.abspath(__file__))
 
 _this_module = _sys.modules[__name__]
 
 
-_js_dist = [
-    {
-        "relative_package_path": "webviz_core_components.min.js",
-        "dev_package_path": "webviz_core_components.dev.js",
-        "namespace": package_name,
-    },
-]
+def _generated_component_names():
+    """Returns the names of the components generated by dash-generate-components,
+    as listed in _imports_.py, without importing them.
+    """
+    with open(_os.path.join(_basepath, "_imports_.py"), encoding="utf8") as f:
+        return [line.split()[-1] for line in f if line.startswith("from .")]
+
+
+# Component classes are imported, and given their dist metadata, on first access.
+# Maps exported name -> (module, attribute in module).
+_COMPONENTS = {name: (f".{name}", name) for name in _generated_component_names()}
+_COMPONENTS["WebvizPluginPlaceholder"] = (
+    ".WebvizPluginPlaceholderWrapper",
+    "WebvizPluginPlaceholderWrapper",
+)
+_COMPONENTS.update(
+    {name: (".wrapped_components", name) for name in _wrapped_components.__all__}
+)
+
+__all__ = list(_COMPONENTS)
+
+if _TYPE_CHECKING:
+    # Static imports of the lazily loaded classes, for linters and IDEs
+    # pylint: disable=wildcard-import, unused-wildcard-import
+    from ._imports_ import *
+    from .WebvizPluginPlaceholderWrapper import (
+        WebvizPluginPlaceholderWrapper as WebvizPluginPlaceholder,
+    )
+    from .wrapped_components import *
 
-_css_dist = [
-    {
-        "relative_package_path": "webviz_core_components.css",
-        "namespace": package_name,
+# Dash collects _js_dist/_css_dist from the modules in the component registry.
+# Components add their module to the registry when their class is created,
+# so register this package up front in case no component has been accessed yet.
+_ComponentRegistry.registry.add(__name__)
+
+# Chunks split from the bundle by webpack (named by the webpackChunkName of the
+# dynamic imports), which are loaded by the bundle when first used.
+_ASYNC_CHUNKS = ["dialog", "html2canvas", "reactour", "smart-node-selector"]
+
+
+def _load_package():
+    with open(_filepath, encoding="utf8") as f:
+        package = json.load(f)
+
+    package_name = (
+        package["name"]
+        .replace(" ", "_")
+        .replace("-", "_")
+        .replace("/", "_")
+        .replace("@", "")
+    )
+
+    return {
+        "package": package,
+        "package_name": package_name,
+        "_js_dist": [
+            {
+                "relative_package_path": "webviz_core_components.min.js",
+                "dev_package_path": "webviz_core_components.dev.js",
+                "namespace": package_name,
+            },
+            *(
+                {
+                    "relative_package_path": f"webviz_core_components-{chunk}.min.js",
+                    "dev_package_path": f"webviz_core_components-{chunk}.dev.js",
+                    "namespace": package_name,
+                    "async": True,
+                }
+                for chunk in _ASYNC_CHUNKS
+            ),
+        ],
+        "_css_dist": [
+            {
+                "relative_package_path": "webviz_core_components.css",
+                "namespace": package_name,
+            }
+        ],
     }
-]
 
 
-for _component in __all__:
-    setattr(locals()[_component], "_js_dist", _js_dist)
-    setattr(locals()[_component], "_css_dist", _css_dist)
+def _load_component(name):
+    module_name, attribute = _COMPONENTS[name]
+    component = getattr(_import_module(module_name, __name__), attribute)
+    for dist_type in ("_js_dist", "_css_dist"):
+        setattr(component, dist_type, getattr(_this_module, dist_type))
+    return component
+
+
+def __getattr__(name):
+    if name in _COMPONENTS:
+        globals()[name] = _load_component(name)
+    elif name in ("package", "package_name", "_js_dist", "_css_dist"):
+        globals().update(_load_package())
+    elif name == "__version__":
+        # pylint: disable=import-outside-toplevel
+        from importlib.metadata import version
+
+        globals()[name] = version(__name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _ComponentPackage(_types.ModuleType):
+    """Most generated component classes share name with the submodule defining
+    them. Importing such a submodule (e.g. `from webviz_core_components.Select
+    import Select`) sets the submodule as attribute of this package, which would
+    hide the component class from `__getattr__`. The class is set instead.
+    """
+
+    def __setattr__(self, name, value):
+        if name in _COMPONENTS and isinstance(value, _types.ModuleType):
+            value = _load_component(name)
+        super().__setattr__(name, value)
+
+
+_this_module.__class__ = _ComponentPackage
@@ -0,0 +1,4 @@
+from ._compressed_download import compressed_download
+from ._streamed_downloads import StreamedDownloads
+
+__all__ = ["compressed_download", "StreamedDownloads"]
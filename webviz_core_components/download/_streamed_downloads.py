@@ -0,0 +1,102 @@
+import os
+import secrets
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, NamedTuple, Union
+
+import flask
+from dash import Dash
+
+DownloadSource = Union[str, os.PathLike, Iterable[bytes], Callable[[], Iterable[bytes]]]
+
+
+class _Download(NamedTuple):
+    source: DownloadSource
+    filename: str
+    mime_type: str
+
+
+class StreamedDownloads:
+    """Serves downloads from a route on the Dash server, such that the browser
+    streams the file directly to disk. Use this instead of a base64 encoded
+    `content` for large files given as the `download` prop of
+    `WebvizPluginPlaceholder`, `WebvizView` and `WebvizViewElement`.
+
+    The route is registered when the object is created, which has to be done
+    before the app starts serving requests:
+
+        downloads = StreamedDownloads(app)
+
+        @app.callback(Output("view", "download"), Input("view", "data_requested"))
+        def _download(_):
+            return downloads.download("/path/to/file.csv", filename="data.csv")
+
+    The downloads are kept in memory in the server process, so with multiple
+    server processes the same process must serve the callback and the download.
+    """
+
+    def __init__(self, app: Dash, route: str = "_wcc-download", max_downloads=256):
+        self._app = app
+        self._route = route.strip("/")
+        self._max_downloads = max_downloads
+        self._downloads: "OrderedDict[str, _Download]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        app.server.add_url_rule(
+            f"{app.config.routes_pathname_prefix}{self._route}/<token>",
+            endpoint=f"wcc_streamed_download_{self._route}",
+            view_func=self._serve,
+        )
+
+    def download(
+        self,
+        source: DownloadSource,
+        filename: str,
+        mime_type: str = "application/octet-stream",
+    ) -> Dict[str, str]:
+        """Returns the value for a `download` prop downloading the given source.
+
+        * source: A file path, a callable returning an iterable of bytes chunks
+                  (e.g. a generator function), or an iterable of bytes chunks.
+                  A plain iterable (e.g. a generator) can only be downloaded once.
+        * filename: The name of the downloaded file.
+        * mime_type: The mime type of the downloaded file.
+        """
+        token = secrets.token_urlsafe(16)
+        with self._lock:
+            self._downloads[token] = _Download(source, filename, mime_type)
+            while len(self._downloads) > self._max_downloads:
+                self._downloads.popitem(last=False)
+
+        return {
+            "filename": filename,
+            "url": self._app.get_relative_path(f"/{self._route}/{token}"),
+            "mime_type": mime_type,
+        }
+
+    def _serve(self, token: str) -> flask.Response:
+        with self._lock:
+            download = self._downloads.get(token)
+            if download is None:
+                flask.abort(404)
+            source = download.source
+            if not isinstance(source, (str, os.PathLike)) and not callable(source):
+                # Iterators can not be restarted
+                del self._downloads[token]
+
+        if isinstance(source, (str, os.PathLike)):
+            return flask.send_file(
+                source,
+                mimetype=download.mime_type,
+                as_attachment=True,
+                download_name=download.filename,
+            )
+
+        chunks = source() if callable(source) else source
+        response = flask.Response(
+            flask.stream_with_context(chunks), mimetype=download.mime_type
+        )
+        response.headers.set(
+            "Content-Disposition", "attachment", filename=download.filename
+        )
+        return response
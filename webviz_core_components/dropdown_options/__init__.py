@@ -0,0 +1,3 @@
+from ._searchable_options import SearchableOptions, persisted_value_id
+
+__all__ = ["SearchableOptions", "persisted_value_id"]
@@ -0,0 +1,174 @@
+import json
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from dash import Dash, Input, Output, ctx, no_update
+from dash.exceptions import PreventUpdate
+
+ComponentId = Union[str, Dict[str, Any]]
+
+
+def persisted_value_id(component_id: ComponentId) -> ComponentId:
+    """The id of the `dcc.Store` persisting the value of the `wcc.Dropdown` with
+    the given id, when it has `searchable_options`.
+    """
+    if isinstance(component_id, dict):
+        return {**component_id, "wcc_persisted": "value"}
+    return f"{component_id}-persisted-value"
+
+
+class SearchableOptions:
+    """The options of a `wcc.Dropdown`, kept in an index on the server instead of
+    being sent to the browser. Use this for lists of options too large for the
+    layout (e.g. 100k wells or vectors).
+
+    The dropdown is given the index as `searchable_options`, and only gets the
+    options matching what the user types in it, from a callback registered by
+    `register_callback`:
+
+        wells = SearchableOptions(all_wells)
+
+        app.layout = wcc.Dropdown(
+            label="Well", id="well", searchable_options=wells, value="OP_1"
+        )
+        wells.register_callback(app, "well")
+
+    The options are searched case-insensitively by label. Options with labels
+    starting with the search value come first, in alphabetical order, followed by
+    options with labels containing it elsewhere, in the order of the options.
+    The search stops when `max_results` options are found, such that the time
+    taken for each keystroke is bounded, also for common search values.
+
+    * options: A list of options as given to `dcc.Dropdown` (dicts with `label`
+               and `value`, or plain values used as both), or a dict mapping
+               values to labels. Labels have to be strings or numbers.
+    * max_results: The maximum number of options sent for each search value.
+    """
+
+    def __init__(
+        self,
+        options: Union[Sequence[Any], Dict[Any, Any]],
+        max_results: int = 100,
+    ):
+        if isinstance(options, dict):
+            options = [
+                {"label": label, "value": value} for value, label in options.items()
+            ]
+        self._options: List[Dict[str, Any]] = [
+            option if isinstance(option, dict) else {"label": option, "value": option}
+            for option in options
+        ]
+        self._max_results = max_results
+        self._indices = {option["value"]: i for i, option in enumerate(self._options)}
+
+        labels = [str(option["label"]).lower() for option in self._options]
+
+        # All labels joined in one string, such that a search for a substring is a
+        # single pass over it, stopped when enough options have been found
+        self._text = "\n".join(label.replace("\n", " ") for label in labels)
+        self._starts: List[int] = []
+        start = 0
+        for label in labels:
+            self._starts.append(start)
+            start += len(label) + 1
+
+        # The labels in sorted order, where the labels starting with a search value
+        # are found by bisection
+        self._sorted = sorted(range(len(labels)), key=labels.__getitem__)
+        self._sorted_labels = [labels[i] for i in self._sorted]
+
+    def search(self, search_value: Optional[str]) -> List[Dict[str, Any]]:
+        """The options with labels matching the search value, at most
+        `max_results` of them. All options match an empty search value.
+        """
+        query = (search_value or "").lower()
+        if not query:
+            return self._options[: self._max_results]
+
+        matches: List[int] = []
+        position = bisect_left(self._sorted_labels, query)
+        while (
+            len(matches) < self._max_results
+            and position < len(self._sorted_labels)
+            and self._sorted_labels[position].startswith(query)
+        ):
+            matches.append(self._sorted[position])
+            position += 1
+
+        if len(matches) < self._max_results and "\n" not in query:
+            offset = self._text.find(query)
+            while offset != -1 and len(matches) < self._max_results:
+                index = bisect_right(self._starts, offset) - 1
+                # Labels starting with the search value have all been found above
+                if offset != self._starts[index]:
+                    matches.append(index)
+                if index + 1 == len(self._starts):
+                    break
+                offset = self._text.find(query, self._starts[index + 1])
+
+        return [self._options[i] for i in matches]
+
+    def options_for(self, value: Any) -> List[Dict[str, Any]]:
+        """The options of the given value, or list of values (for `multi`
+        dropdowns). Values not among the options are left out.
+        """
+        values = value if isinstance(value, list) else [value]
+        return [self._options[self._indices[v]] for v in values if v in self._indices]
+
+    def register_callback(self, app: Dash, component_id: ComponentId) -> None:
+        """Registers the callback giving the `wcc.Dropdown` with the given id the
+        options matching its `search_value`, and restoring its persisted value.
+        """
+        store_id = persisted_value_id(component_id)
+
+        @app.callback(
+            Output(component_id, "options"),
+            Output(component_id, "value"),
+            Output(store_id, "data"),
+            Input(component_id, "search_value"),
+            Input(component_id, "value"),
+            Input(store_id, "data"),
+        )
+        def _update(
+            search_value: Optional[str], value: Any, persisted: Optional[dict]
+        ) -> tuple:
+            triggered = ctx.triggered_prop_ids
+            if f"{_prop_id(component_id)}.value" in triggered:
+                # Persisted as by Dash persistence, keeping the value from the
+                # layout such that a changed value in the layout is not overridden
+                if persisted is None:
+                    raise PreventUpdate
+                return no_update, no_update, {**persisted, "value": value}
+
+            if f"{_prop_id(component_id)}.search_value" in triggered:
+                if not search_value:
+                    raise PreventUpdate
+                options = self.search(search_value)
+                # The selected options are kept, to show their labels
+                values = {option["value"] for option in options}
+                selected = [
+                    option
+                    for option in self.options_for(value)
+                    if option["value"] not in values
+                ]
+                return options + selected, no_update, no_update
+
+            # The initial call, or the persisted value restored from the browser
+            if persisted is None or "value" not in persisted:
+                raise PreventUpdate
+            if persisted["original"] != value:
+                return no_update, no_update, {"original": value}
+            persisted_value = persisted["value"]
+            restored = self.options_for(persisted_value)
+            if isinstance(persisted_value, list):
+                persisted_value = [option["value"] for option in restored]
+            elif persisted_value is not None and not restored:
+                # No longer among the options
+                raise PreventUpdate
+            return restored, persisted_value, no_update
+
+
+def _prop_id(component_id: ComponentId) -> str:
+    if isinstance(component_id, dict):
+        return json.dumps(component_id, sort_keys=True, separators=(",", ":"))
+    return component_id
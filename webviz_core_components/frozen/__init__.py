@@ -0,0 +1,3 @@
+from ._frozen import FrozenComponent, frozen
+
+__all__ = ["FrozenComponent", "frozen"]
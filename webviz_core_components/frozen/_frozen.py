@@ -0,0 +1,127 @@
+import functools
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from dash._utils import to_json
+
+try:
+    from orjson import Fragment as _OrjsonFragment
+except ImportError:  # orjson not installed, or older than 3.9.15
+    _OrjsonFragment = None
+
+
+class FrozenComponent:
+    """A component subtree serialized once, when frozen. The serialized JSON is
+    used as is whenever the subtree is part of a layout or callback response,
+    instead of serializing the components again.
+
+    The subtree is immutable: changes made to the components after freezing them
+    are not included.
+    """
+
+    __slots__ = ("_json", "_value")
+
+    def __init__(self, component: Any):
+        self._json = to_json(component)
+        self._value: Any = None
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the serialized subtree."""
+        return len(self._json)
+
+    def to_plotly_json(self) -> Any:
+        # Used when serializing with the json module. The parsed value is written
+        # by its C encoder, without calling back into Python for each component.
+        if self._value is None:
+            self._value = json.loads(self._json)
+        return self._value
+
+    def tolist(self) -> Any:
+        # Used before to_plotly_json when serializing with orjson, and taken as is,
+        # without walking into the value. Fragments are inserted by orjson as
+        # they are, without serializing the subtree again.
+        if _OrjsonFragment is not None:
+            return _OrjsonFragment(self._json)
+        return self.to_plotly_json()
+
+
+def frozen(
+    function: Optional[Callable[..., Any]] = None,
+    *,
+    max_cache_bytes: int = 64 * 2**20,
+) -> Any:
+    """Decorator for functions building static parts of layouts, e.g. a
+    `wcc.Frame` with its selectors. The returned component subtree is frozen
+    (see `FrozenComponent`) and cached, such that calls with the same arguments
+    neither build nor serialize the components again:
+
+        @frozen
+        def ensemble_selectors(ensembles):
+            return wcc.Selectors(
+                label="Ensembles",
+                children=[wcc.Dropdown(id="ensemble", options=[...])],
+            )
+
+    The cache is keyed by a hash of the arguments as serialized to JSON, so
+    arguments are compared by value. The subtrees used least recently are
+    evicted when their total serialized size exceeds `max_cache_bytes`.
+    The function should not depend on anything but its arguments.
+    """
+
+    def decorator(function: Callable[..., Any]) -> Callable[..., FrozenComponent]:
+        cache = _FrozenCache(max_cache_bytes)
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> FrozenComponent:
+            key = hashlib.sha1(  # nosec - not used for security
+                to_json([args, sorted(kwargs.items())]).encode()
+            ).digest()
+            subtree = cache.get(key)
+            if subtree is None:
+                subtree = FrozenComponent(function(*args, **kwargs))
+                cache.set(key, subtree)
+            return subtree
+
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator if function is None else decorator(function)
+
+
+class _FrozenCache:
+    """Frozen subtrees by key, evicting the subtrees used least recently when
+    their total size exceeds `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._subtrees: "OrderedDict[bytes, FrozenComponent]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[FrozenComponent]:
+        with self._lock:
+            subtree = self._subtrees.get(key)
+            if subtree is not None:
+                self._subtrees.move_to_end(key)
+            return subtree
+
+    def set(self, key: bytes, subtree: FrozenComponent) -> None:
+        with self._lock:
+            previous = self._subtrees.pop(key, None)
+            if previous is not None:
+                self._nbytes -= previous.nbytes
+            self._subtrees[key] = subtree
+            self._nbytes += subtree.nbytes
+            while self._nbytes > self._max_bytes and len(self._subtrees) > 1:
+                _, evicted = self._subtrees.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._subtrees.clear()
+            self._nbytes = 0
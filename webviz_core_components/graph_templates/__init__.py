@@ -0,0 +1,7 @@
+from ._graph_templates import (
+    graph_templates,
+    register_graph_template,
+    use_graph_template,
+)
+
+__all__ = ["graph_templates", "register_graph_template", "use_graph_template"]
@@ -0,0 +1,52 @@
+from typing import Any, Dict
+
+# Registered templates by name
+_TEMPLATES: Dict[str, Dict[str, Any]] = {}
+
+
+def register_graph_template(name: str, template: Any) -> None:
+    """Registers a plotly template (a dict or a `plotly.graph_objects.layout.Template`),
+    which `wcc.Graph` figures can refer to by name, given `template=name`.
+
+    The registered templates are sent to the browser once, by adding
+    `graph_templates()` to the layout before the graphs:
+
+        register_graph_template("webviz", {"layout": {"colorway": [...], ...}})
+
+        app.layout = html.Div(
+            [
+                graph_templates(),
+                wcc.Graph(figure=figure, template="webviz"),
+                ...
+            ]
+        )
+    """
+    if hasattr(template, "to_plotly_json"):
+        template = template.to_plotly_json()
+    _TEMPLATES[name] = template
+
+
+def graph_templates(component_id: str = "wcc-graph-templates") -> Any:
+    """Returns a `WebvizGraphTemplates` holding all registered templates."""
+    # pylint: disable=import-outside-toplevel
+    from webviz_core_components import WebvizGraphTemplates
+
+    return WebvizGraphTemplates(id=component_id, templates=dict(_TEMPLATES))
+
+
+def use_graph_template(figure: Any, name: str) -> Any:
+    """Returns the figure referring to the registered template by name, instead of
+    holding a template itself. Use this for figures returned by callbacks, to
+    get the same as given `template=name` to `wcc.Graph`. The names are only
+    resolved by graphs created with a `template`.
+    """
+    if name not in _TEMPLATES:
+        raise ValueError(
+            f'The graph template "{name}" has not been registered. Registered '
+            f"templates: {', '.join(_TEMPLATES) or 'none'}."
+        )
+    if figure is None:
+        return {"layout": {"template": name}}
+    if hasattr(figure, "to_dict"):
+        figure = figure.to_dict()
+    return {**figure, "layout": {**figure.get("layout", {}), "template": name}}
@@ -0,0 +1,7 @@
+from ._layout_profiler import (
+    LayoutBudgetExceeded,
+    LayoutProfile,
+    profile_layout,
+)
+
+__all__ = ["LayoutBudgetExceeded", "LayoutProfile", "profile_layout"]
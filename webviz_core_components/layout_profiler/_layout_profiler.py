@@ -0,0 +1,295 @@
+import hashlib
+import heapq
+import itertools
+from collections import defaultdict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from dash.development.base_component import Component
+from plotly.io.json import to_json_plotly
+
+# The JSON of a component is {"props": {...}, "type": "...", "namespace": "..."}
+_COMPONENT_OVERHEAD = len('{"props":{},"type":"","namespace":""}')
+# "key":value, (quotes, colon and comma)
+_PROP_OVERHEAD = 4
+
+
+class SubtreeSize(NamedTuple):
+    path: str
+    component_type: str
+    size: int
+
+
+class DuplicatedSubtree(NamedTuple):
+    component_type: str
+    size: int
+    count: int
+    paths: List[str]
+
+
+class LayoutBudgetExceeded(AssertionError):
+    """Raised by `LayoutProfile.check_budgets` when a size budget is exceeded."""
+
+
+class LayoutProfile:
+    """Serialized sizes (in bytes of compact JSON, as sent to the browser) of a
+    layout, as created by `profile_layout`.
+
+    * total_size: The size of the whole layout.
+    * size_by_type: The size of the props of all components of each type,
+                    excluding the child components.
+    * size_by_prop: The size of each prop (`<type>.<prop>`) summed over all
+                    components of each type, excluding the child components.
+    * largest_subtrees: The largest subtrees, largest first.
+    * duplicated_subtrees: Identical subtrees occurring more than once, the ones
+                           wasting most bytes first.
+
+    The sizes are sums of the sizes of the individual props, so they can differ
+    from the size of the serialized layout by a few bytes of separators per
+    component.
+    """
+
+    def __init__(
+        self,
+        total_size: int,
+        size_by_type: Dict[str, int],
+        size_by_prop: Dict[str, int],
+        largest_subtrees: List[SubtreeSize],
+        duplicated_subtrees: List[DuplicatedSubtree],
+    ):
+        self.total_size = total_size
+        self.size_by_type = size_by_type
+        self.size_by_prop = size_by_prop
+        self.largest_subtrees = largest_subtrees
+        self.duplicated_subtrees = duplicated_subtrees
+
+    def check_budgets(
+        self,
+        max_total_size: Optional[int] = None,
+        max_size_by_type: Optional[Dict[str, int]] = None,
+        max_size_by_prop: Optional[Dict[str, int]] = None,
+        max_duplicated_size: Optional[int] = None,
+    ) -> None:
+        """Raises LayoutBudgetExceeded, listing all exceeded budgets, if any of
+        the given budgets (in bytes) are exceeded. `max_duplicated_size` limits
+        the bytes wasted on duplicated subtrees.
+        """
+        exceeded = []
+        if max_total_size is not None and self.total_size > max_total_size:
+            exceeded.append(f"layout: {self.total_size} > {max_total_size} bytes")
+        for budgets, sizes in [
+            (max_size_by_type, self.size_by_type),
+            (max_size_by_prop, self.size_by_prop),
+        ]:
+            for name, budget in (budgets or {}).items():
+                if sizes.get(name, 0) > budget:
+                    exceeded.append(f"{name}: {sizes[name]} > {budget} bytes")
+        if max_duplicated_size is not None:
+            duplicated_size = sum(
+                duplicate.size * (duplicate.count - 1)
+                for duplicate in self.duplicated_subtrees
+            )
+            if duplicated_size > max_duplicated_size:
+                exceeded.append(
+                    f"duplicated subtrees: {duplicated_size} > "
+                    f"{max_duplicated_size} bytes"
+                )
+        if exceeded:
+            raise LayoutBudgetExceeded(
+                "Layout size budgets exceeded:\n" + "\n".join(exceeded)
+            )
+
+    def report(self, top: int = 10) -> str:
+        """Returns a human readable summary of the profile."""
+        lines = [f"Layout size: {self.total_size} bytes", "", "Largest types:"]
+        lines += [
+            f"  {size:>12}  {name}" for name, size in _largest(self.size_by_type, top)
+        ]
+        lines += ["", "Largest props:"]
+        lines += [
+            f"  {size:>12}  {name}" for name, size in _largest(self.size_by_prop, top)
+        ]
+        lines += ["", "Largest subtrees:"]
+        lines += [
+            f"  {subtree.size:>12}  {subtree.path}"
+            for subtree in self.largest_subtrees[:top]
+        ]
+        if self.duplicated_subtrees:
+            lines += ["", "Duplicated subtrees:"]
+            lines += [
+                f"  {duplicate.size:>12}  {duplicate.count} x "
+                f"{duplicate.component_type}, e.g. {duplicate.paths[0]}"
+                for duplicate in self.duplicated_subtrees[:top]
+            ]
+        return "\n".join(lines)
+
+
+class _Frame:
+    """A component being profiled, waiting for its children to be profiled."""
+
+    __slots__ = ("parent", "name", "component_type", "size", "digest", "children")
+
+    def __init__(self, parent: Optional["_Frame"], name: str, component_type: str):
+        self.parent = parent
+        self.name = name
+        self.component_type = component_type
+        self.size = 0
+        self.digest = hashlib.sha1()  # nosec - not used for security
+        self.children: List["_Frame"] = []
+
+    @property
+    def path(self) -> str:
+        """The path of the component in the layout. Only created for the
+        reported subtrees, as it is as long as the component is deep.
+        """
+        names = []
+        frame: Optional[_Frame] = self
+        while frame is not None and frame.name:
+            names.append(frame.name)
+            frame = frame.parent
+        return " > ".join(reversed(names))
+
+
+def profile_layout(
+    layout: Component,
+    num_largest_subtrees: int = 20,
+    min_duplicated_size: int = 1000,
+) -> LayoutProfile:
+    """Profiles the serialized size of a Dash layout.
+
+    The component tree is walked iteratively, serializing one prop value at a
+    time, such that the whole layout is never held serialized in memory.
+
+    * layout: The root component of the layout.
+    * num_largest_subtrees: The number of largest subtrees to include.
+    * min_duplicated_size: The minimum size of duplicated subtrees to include.
+    """
+    # pylint: disable=protected-access, too-many-locals
+    size_by_type: Dict[str, int] = defaultdict(int)
+    size_by_prop: Dict[str, int] = defaultdict(int)
+    largest_subtrees: List[Tuple[int, int, _Frame]] = []
+    # The component type, size and frames of the subtrees by digest
+    duplicates: Dict[bytes, Tuple[str, int, List[_Frame]]] = {}
+    # Tie breaker for subtrees of equal size
+    counter = itertools.count()
+
+    root = _Frame(None, "", "")
+    stack: List[Tuple[Any, _Frame, Optional[_Frame]]] = [
+        (layout, _Frame(root, _path_name(layout, 0), _type_name(layout)), root)
+    ]
+    while stack:
+        component, frame, parent = stack.pop()
+
+        if parent is None:
+            # All children of the component have been profiled
+            for child in frame.children:
+                frame.size += child.size
+                frame.digest.update(child.digest.digest())
+            frame.children = []
+
+            entry = (frame.size, next(counter), frame)
+            if len(largest_subtrees) < num_largest_subtrees:
+                heapq.heappush(largest_subtrees, entry)
+            elif largest_subtrees and entry > largest_subtrees[0]:
+                heapq.heapreplace(largest_subtrees, entry)
+
+            if frame.size >= min_duplicated_size:
+                duplicates.setdefault(
+                    frame.digest.digest(), (frame.component_type, frame.size, [])
+                )[2].append(frame)
+            continue
+
+        parent.children.append(frame)
+        stack.append((component, frame, None))
+
+        own_size = _COMPONENT_OVERHEAD + len(component._type)
+        own_size += len(component._namespace)
+        frame.digest.update(f"{component._namespace}.{component._type}".encode())
+        children: List[Component] = []
+        for prop_name, value in _props(component):
+            child_components, value = _split_components(value)
+            children.extend(child_components)
+
+            serialized = to_json_plotly(value).encode() if value is not None else b""
+            prop_size = _PROP_OVERHEAD + len(prop_name) + len(serialized)
+            if child_components:
+                # Separators between the children
+                prop_size += len(child_components) + 1
+            own_size += prop_size
+            size_by_prop[f"{frame.component_type}.{prop_name}"] += prop_size
+            frame.digest.update(prop_name.encode())
+            frame.digest.update(serialized)
+
+        frame.size = own_size
+        size_by_type[frame.component_type] += own_size
+
+        for index in reversed(range(len(children))):
+            child = children[index]
+            stack.append(
+                (
+                    child,
+                    _Frame(frame, _path_name(child, index), _type_name(child)),
+                    frame,
+                )
+            )
+
+    return LayoutProfile(
+        total_size=root.children[0].size,
+        size_by_type=dict(size_by_type),
+        size_by_prop=dict(size_by_prop),
+        largest_subtrees=[
+            SubtreeSize(frame.path, frame.component_type, size)
+            for size, _, frame in sorted(largest_subtrees, reverse=True)
+        ],
+        duplicated_subtrees=sorted(
+            (
+                DuplicatedSubtree(
+                    component_type,
+                    size,
+                    len(frames),
+                    [frame.path for frame in frames],
+                )
+                for component_type, size, frames in duplicates.values()
+                if len(frames) > 1
+            ),
+            key=lambda duplicate: duplicate.size * (duplicate.count - 1),
+            reverse=True,
+        ),
+    )
+
+
+def _props(component: Component):
+    # pylint: disable=protected-access
+    for prop_name in component._prop_names:
+        value = getattr(component, prop_name, None)
+        if value is not None:
+            yield prop_name, value
+
+
+def _split_components(value: Any) -> Tuple[List[Component], Any]:
+    """Splits a prop value into its child components, and the rest of the value."""
+    if isinstance(value, Component):
+        return [value], None
+    if isinstance(value, (list, tuple)) and any(
+        isinstance(item, Component) for item in value
+    ):
+        rest = [item for item in value if not isinstance(item, Component)]
+        return [item for item in value if isinstance(item, Component)], (
+            rest if rest else None
+        )
+    return [], value
+
+
+def _type_name(component: Component) -> str:
+    component_class = type(component)
+    return f"{component_class.__module__.split('.')[0]}.{component_class.__name__}"
+
+
+def _path_name(component: Component, index: int) -> str:
+    component_id = getattr(component, "id", None)
+    if component_id is not None:
+        return f"{type(component).__name__}#{component_id}"
+    return f"{type(component).__name__}[{index}]"
+
+
+def _largest(sizes: Dict[str, int], top: int) -> List[Tuple[str, int]]:
+    return heapq.nlargest(top, sizes.items(), key=lambda item: item[1])
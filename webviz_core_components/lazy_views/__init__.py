@@ -0,0 +1,3 @@
+from ._lazy_views import LazyViews
+
+__all__ = ["LazyViews"]
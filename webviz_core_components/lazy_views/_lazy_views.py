@@ -0,0 +1,76 @@
+from typing import Callable, Dict, Tuple, Union
+
+from dash import MATCH, Dash, Input, Output, ctx
+from dash.development.base_component import Component
+from dash.exceptions import PreventUpdate
+
+from webviz_core_components import WebvizLazyView
+
+_ID_TYPE = "wcc-lazy-view"
+
+ViewLayout = Union[Component, Callable[[], Component]]
+
+
+class LazyViews:
+    """Serves the content of `WebvizLazyView`s, such that only the content of the
+    views actually opened is sent to the browser.
+
+    A single callback, registered when the object is created, answers the
+    requests of all views created by `view`:
+
+        lazy_views = LazyViews(app)
+
+        app.layout = wcc.WebvizContentManager(
+            id="content-manager",
+            lazyViewBudget=5,
+            children=[
+                wcc.WebvizPluginWrapper(
+                    id="plugin",
+                    ...,
+                    children=[
+                        lazy_views.view("plugin", "plugin-view1", view1_layout),
+                        lazy_views.view("plugin", "plugin-view2", view2_layout),
+                    ],
+                )
+            ],
+        )
+    """
+
+    def __init__(self, app: Dash):
+        # Layouts by plugin id and view id
+        self._layouts: Dict[Tuple[str, str], ViewLayout] = {}
+
+        pattern = {"type": _ID_TYPE, "plugin": MATCH, "view": MATCH}
+
+        @app.callback(
+            Output(pattern, "children"),
+            Input(pattern, "requested"),
+            prevent_initial_call=True,
+        )
+        def _load_view(_requested: int) -> Component:
+            layout = self._layouts.get(
+                (ctx.triggered_id["plugin"], ctx.triggered_id["view"])
+            )
+            if layout is None:
+                raise PreventUpdate
+            return layout() if callable(layout) else layout
+
+    def view(
+        self, plugin_id: str, view_id: str, layout: ViewLayout, loaded: bool = False
+    ) -> WebvizLazyView:
+        """Returns a `WebvizLazyView` for the given view, having its content loaded
+        when the view is activated.
+
+        * plugin_id: The id of the plugin wrapper the view belongs to.
+        * view_id: The id of the view, as in the `views` of the plugin wrapper.
+        * layout: The content of the view, or a function returning it.
+        * loaded: Include the content in the initial layout, e.g. for the view
+                  initially active.
+        """
+        self._layouts[(plugin_id, view_id)] = layout
+        return WebvizLazyView(
+            id={"type": _ID_TYPE, "plugin": plugin_id, "view": view_id},
+            pluginId=plugin_id,
+            viewId=view_id,
+            children=(layout() if callable(layout) else layout) if loaded else None,
+        )
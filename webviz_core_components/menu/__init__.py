@@ -0,0 +1,3 @@
+from ._search_index import menu_search_index
+
+__all__ = ["menu_search_index"]
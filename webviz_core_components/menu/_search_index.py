@@ -0,0 +1,35 @@
+import re
+from typing import Any, Dict, List, Sequence
+
+# The characters matched by `\s` in JavaScript regular expressions, as used by
+# `normalizeTitle` in react/src/lib/components/Menu/utils/search-index.ts. Both
+# are tested against react/src/tests/js/Menu/search-index.json.
+_WHITESPACE = re.compile(
+    "[\t\n\v\f\r \u00a0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000\ufeff]"
+)
+
+
+def menu_search_index(navigation_items: Sequence[Dict[str, Any]]) -> List[str]:
+    """Returns the `searchIndex` of a `wcc.Menu` with the given `navigationItems`,
+    such that the browser does not have to normalize the titles of all pages
+    before the pages can be filtered:
+
+        wcc.Menu(
+            navigationItems=navigation_items,
+            searchIndex=menu_search_index(navigation_items),
+        )
+
+    The index holds the titles of all pages normalized as in the browser (lower
+    case, without whitespace), in the order they appear in `navigation_items`.
+    """
+    titles: List[str] = []
+    stack = [iter(navigation_items)]
+    while stack:
+        item = next(stack[-1], None)
+        if item is None:
+            stack.pop()
+        elif item["type"] == "page":
+            titles.append(_WHITESPACE.sub("", item["title"].lower()))
+        else:
+            stack.append(iter(item.get("content", [])))
+    return titles
@@ -0,0 +1,3 @@
+from ._resampled_graphs import ResampledGraphs
+
+__all__ = ["ResampledGraphs"]
@@ -0,0 +1,320 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from dash import MATCH, Dash, Input, Output, Patch, ctx
+from dash.exceptions import PreventUpdate
+
+from ..wrapped_components._typed_arrays import _decode_array, _is_typed_array
+from ..wrapped_components.graph import Graph
+
+_ID_TYPE = "wcc-resampled-graph"
+
+_AXIS_RANGE = re.compile(r"^(xaxis\d*)\.range(?:\[([01])\])?$")
+_AXIS_AUTORANGE = re.compile(r"^(xaxis\d*)\.autorange$")
+
+# The path (keys in the trace) of each per point array of a trace
+_ArrayPath = Tuple[str, ...]
+
+
+class _Trace:
+    """The full per point arrays of a resampled trace, sorted by x. `x` holds the
+    x values as compared with axis ranges, e.g. dates parsed from strings.
+    """
+
+    __slots__ = ("index", "xaxis", "x", "arrays", "nbytes")
+
+    def __init__(self, index: int, xaxis: str, arrays: Dict[_ArrayPath, np.ndarray]):
+        self.index = index
+        self.xaxis = xaxis
+        self.x = _comparable_x(arrays[("x",)])
+        self.arrays = arrays
+        self.nbytes = sum(array.nbytes for array in arrays.values())
+        if self.x is not arrays[("x",)]:
+            self.nbytes += self.x.nbytes
+
+
+class ResampledGraphs:
+    """Serves `wcc.Graph`s with traces too large to send to the browser as a
+    whole. The traces are sent downsampled to `n_points` points, keeping the
+    minimum and maximum y values of each interval, and are resampled from the full
+    data at higher resolution when the user zooms in.
+
+    A single callback, registered when the object is created, serves all graphs
+    created by `graph`:
+
+        resampled_graphs = ResampledGraphs(app)
+
+        app.layout = html.Div(
+            [
+                resampled_graphs.graph("oil-rate", oil_rate_figure),
+                resampled_graphs.graph("water-rate", water_rate_figure),
+            ]
+        )
+
+    Graphs having their figure set by other callbacks have to have the figure
+    passed through `figure`.
+
+    * n_points: The maximum number of points sent per trace.
+    * min_points: Traces with fewer points are sent unchanged.
+    * max_cache_bytes: The maximum total size of the full traces kept in memory.
+                       The graphs used least recently are evicted first, and are
+                       not resampled when zoomed in.
+
+    Traces are sorted by x, and other per point arrays (e.g. `text` and
+    `marker.color`) are resampled together with x and y. The full traces are kept
+    in memory in the server process, so with multiple server processes the
+    graphs might not be resampled when zooming.
+    """
+
+    def __init__(
+        self,
+        app: Dash,
+        n_points: int = 2000,
+        min_points: Optional[int] = None,
+        max_cache_bytes: int = 512 * 2**20,
+    ):
+        self._n_points = n_points
+        self._min_points = n_points if min_points is None else min_points
+        self._max_cache_bytes = max_cache_bytes
+        self._traces: "OrderedDict[str, List[_Trace]]" = OrderedDict()
+        self._cache_bytes = 0
+        self._lock = threading.Lock()
+
+        @app.callback(
+            Output({"type": _ID_TYPE, "graph": MATCH}, "figure"),
+            Input({"type": _ID_TYPE, "graph": MATCH}, "relayoutData"),
+            prevent_initial_call=True,
+        )
+        def _resample(relayout_data: Optional[Dict[str, Any]]) -> Patch:
+            traces = self._get_traces(ctx.triggered_id["graph"])
+            x_ranges = _x_ranges(relayout_data or {})
+            if traces is None or not x_ranges:
+                raise PreventUpdate
+
+            patched_figure = Patch()
+            for trace in traces:
+                if trace.xaxis not in x_ranges:
+                    continue
+                for path, array in self._resample(trace, x_ranges[trace.xaxis]):
+                    _set_path(patched_figure["data"][trace.index], path, array)
+            return patched_figure
+
+    def graph(self, graph_id: str, figure: Any, **kwargs: Any) -> Graph:
+        """Returns a `wcc.Graph` showing the figure, with its large traces
+        downsampled. Additional keyword arguments are given to `wcc.Graph`.
+        """
+        return Graph(
+            id={"type": _ID_TYPE, "graph": graph_id},
+            figure=self.figure(graph_id, figure),
+            **kwargs,
+        )
+
+    def figure(self, graph_id: str, figure: Any) -> Dict[str, Any]:
+        """Returns the figure with its large traces downsampled, and stores the
+        full traces for resampling. Use this for figures of graphs created by
+        `graph` returned by other callbacks.
+        """
+        if hasattr(figure, "to_dict"):
+            figure = figure.to_dict()
+
+        data = list(figure.get("data", []))
+        traces: List[_Trace] = []
+        for index, trace_data in enumerate(data):
+            arrays = _per_point_arrays(trace_data)
+            if arrays is None or len(arrays[("x",)]) <= self._min_points:
+                continue
+            trace = _Trace(index, "x" + trace_data.get("xaxis", "x")[1:], arrays)
+            traces.append(trace)
+
+            resampled = dict(trace_data)
+            for path, array in self._resample(trace, None):
+                resampled = _set_path(resampled, path, array)
+            data[index] = resampled
+
+        self._set_traces(graph_id, traces)
+
+        layout = dict(figure.get("layout", {}))
+        # Keeps the zoom when the resampled data is shown
+        layout.setdefault("uirevision", graph_id)
+        return {**figure, "data": data, "layout": layout}
+
+    def _resample(
+        self, trace: _Trace, x_range: Optional[Tuple[Any, Any]]
+    ) -> List[Tuple[_ArrayPath, np.ndarray]]:
+        start, stop = 0, len(trace.x)
+        if x_range is not None:
+            x_min, x_max = (_to_x_value(trace.x, value) for value in x_range)
+            # Include one point outside the range on each side, such that lines
+            # continue to the edges of the plot
+            start = max(int(np.searchsorted(trace.x, x_min, side="left")) - 1, 0)
+            stop = min(int(np.searchsorted(trace.x, x_max, side="right")) + 1, stop)
+
+        indices = _min_max_indices(trace.arrays[("y",)], start, stop, self._n_points)
+        return [(path, array[indices]) for path, array in trace.arrays.items()]
+
+    def _get_traces(self, graph_id: str) -> Optional[List[_Trace]]:
+        with self._lock:
+            traces = self._traces.get(graph_id)
+            if traces is not None:
+                self._traces.move_to_end(graph_id)
+            return traces
+
+    def _set_traces(self, graph_id: str, traces: List[_Trace]) -> None:
+        with self._lock:
+            previous = self._traces.pop(graph_id, None)
+            if previous is not None:
+                self._cache_bytes -= sum(trace.nbytes for trace in previous)
+            if not traces:
+                return
+            self._traces[graph_id] = traces
+            self._cache_bytes += sum(trace.nbytes for trace in traces)
+            while self._cache_bytes > self._max_cache_bytes and len(self._traces) > 1:
+                _, evicted = self._traces.popitem(last=False)
+                self._cache_bytes -= sum(trace.nbytes for trace in evicted)
+
+
+def _per_point_arrays(
+    trace_data: Dict[str, Any]
+) -> Optional[Dict[_ArrayPath, np.ndarray]]:
+    """Returns the per point arrays of the trace, sorted by x, or None if the
+    trace does not have y values. Typed arrays (as numpy arrays are encoded in
+    plotly figures converted to dicts) are decoded.
+    """
+    y = trace_data.get("y")
+    if _is_typed_array(y):
+        y = _decode_array(np, y)
+    if y is None or isinstance(y, (str, dict)) or not hasattr(y, "__len__"):
+        return None
+    num_points = len(y)
+
+    arrays: Dict[_ArrayPath, np.ndarray] = {}
+
+    def collect(values: Dict[str, Any], path: _ArrayPath) -> None:
+        for key, value in values.items():
+            if _is_typed_array(value):
+                value = _decode_array(np, value)
+            elif isinstance(value, dict):
+                collect(value, path + (key,))
+                continue
+            if (
+                not isinstance(value, str)
+                and hasattr(value, "__len__")
+                and len(value) == num_points
+            ):
+                arrays[path + (key,)] = np.asarray(value)
+
+    collect(trace_data, ())
+    if ("x",) not in arrays:
+        arrays[("x",)] = np.arange(num_points)
+
+    x = _comparable_x(arrays[("x",)])
+    if num_points > 1 and not np.all(x[1:] >= x[:-1]):
+        order = np.argsort(x, kind="stable")
+        arrays = {path: array[order] for path, array in arrays.items()}
+    return arrays
+
+
+def _min_max_indices(y: np.ndarray, start: int, stop: int, n_points: int) -> Any:
+    """Returns the indices of the minimum and maximum y values in each of
+    `n_points / 2` intervals of [start, stop), together with the first and last
+    index.
+    """
+    num_points = stop - start
+    if num_points <= n_points:
+        return slice(start, stop)
+
+    # Two points per interval, and the first and last points of the range and of
+    # the remainder not filling an interval
+    n_intervals = max((n_points - 4) // 2, 1)
+    interval_size = num_points // n_intervals
+    end = start + n_intervals * interval_size
+    values = y[start:end].reshape(n_intervals, interval_size)
+    if values.dtype.kind == "f":
+        # NaN values are only picked for intervals having nothing else
+        min_values = np.where(np.isnan(values), np.inf, values)
+        max_values = np.where(np.isnan(values), -np.inf, values)
+    else:
+        min_values = max_values = values
+
+    offsets = start + np.arange(n_intervals) * interval_size
+    indices = np.concatenate(
+        [
+            [start],
+            offsets + np.argmin(min_values, axis=1),
+            offsets + np.argmax(max_values, axis=1),
+            [stop - 1],
+        ]
+    )
+    if end < stop:
+        remainder = y[end:stop]
+        indices = np.concatenate(
+            [indices, [end + np.argmin(remainder), end + np.argmax(remainder)]]
+        )
+    return np.unique(indices)
+
+
+def _x_ranges(relayout_data: Dict[str, Any]) -> Dict[str, Optional[Tuple[Any, Any]]]:
+    """Returns the new x ranges (None if autoranged) by x axis (e.g. "x", "x2")
+    in relayout data.
+    """
+    ranges: Dict[str, Any] = {}
+    for key, value in relayout_data.items():
+        match = _AXIS_RANGE.match(key)
+        if match:
+            axis = "x" + match.group(1)[len("xaxis") :]
+            if match.group(2) is None:
+                ranges[axis] = tuple(value)
+            else:
+                axis_range = list(ranges.get(axis) or (None, None))
+                axis_range[int(match.group(2))] = value
+                ranges[axis] = tuple(axis_range)
+            continue
+        match = _AXIS_AUTORANGE.match(key)
+        if match and value:
+            ranges["x" + match.group(1)[len("xaxis") :]] = None
+    return {
+        axis: axis_range
+        for axis, axis_range in ranges.items()
+        if axis_range is None or None not in axis_range
+    }
+
+
+def _comparable_x(x: np.ndarray) -> np.ndarray:
+    """Returns the x values as compared with axis ranges. Strings are parsed as
+    dates, or else taken as categories, having their index as axis value.
+    """
+    if x.dtype.kind not in "UO":
+        return x
+    try:
+        return x.astype("datetime64[ns]")
+    except (ValueError, TypeError):
+        return np.arange(len(x))
+
+
+def _to_x_value(x: np.ndarray, value: Any) -> Any:
+    """Converts an axis range value from plotly.js to the type of the x values."""
+    if x.dtype.kind == "M":
+        return np.datetime64(str(value).replace(" ", "T"))
+    return value
+
+
+def _set_path(values: Any, path: _ArrayPath, array: np.ndarray) -> Any:
+    """Sets the array at the path in the trace or trace patch. Dicts along the path
+    are copied, such that given figures are not modified.
+    """
+    if isinstance(values, Patch):
+        patched = values
+        for key in path[:-1]:
+            patched = patched[key]
+        patched[path[-1]] = array
+        return values
+
+    values = dict(values)
+    if len(path) == 1:
+        values[path[0]] = array
+    else:
+        values[path[0]] = _set_path(values.get(path[0], {}), path[1:], array)
+    return values
@@ -0,0 +1,12 @@
+from ._build_tree_data import build_tree_data
+from ._flat_tree_data import flatten_tree_data
+from ._lazy_tree_data import LazyTreeData
+from ._tag_resolver import ResolvedTags, TagResolver
+
+__all__ = [
+    "build_tree_data",
+    "flatten_tree_data",
+    "LazyTreeData",
+    "ResolvedTags",
+    "TagResolver",
+]
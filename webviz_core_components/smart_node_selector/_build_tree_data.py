@@ -0,0 +1,123 @@
+from collections import OrderedDict
+from collections.abc import Iterator
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+_Node = Dict[str, Any]
+
+# Maps (id(paths), id(meta_data), delimiter, num_meta_nodes) ->
+# (paths, meta_data, tree data). The inputs are kept referenced by the cache,
+# such that their ids are not reused by other objects while cached.
+_CACHE: "OrderedDict[Tuple[int, int, str, int], Tuple[Any, Any, List[_Node]]]" = (
+    OrderedDict()
+)
+_CACHE_SIZE = 8
+
+
+def build_tree_data(
+    paths: Iterable[str],
+    delimiter: str = ":",
+    num_meta_nodes: int = 0,
+    meta_data: Optional[Mapping[str, Mapping[str, Any]]] = None,
+) -> List[_Node]:
+    """Builds SmartNodeSelector `data` (nested `{"name", "children", ...}` nodes)
+    from delimited node paths, e.g. `["FOPT:WELL:OP_1", "FOPT:WELL:OP_2"]`.
+
+    * paths: Any iterable of node paths, consumed once. Paths which are prefixes of
+             other paths, and duplicates, are merged into the same nodes.
+    * delimiter: The delimiter used in the paths, as given to the SmartNodeSelector.
+    * num_meta_nodes: The `numMetaNodes` of the SmartNodeSelector. Every path must
+                      have at least one node in addition to the meta nodes.
+    * meta_data: Optional additional node values (`description`, `color`, `icon`,
+                 `id`) keyed by node path.
+
+    The result is memoized on the identity of `paths` and `meta_data` (unless
+    `paths` is an iterator), such that callbacks building data from the same
+    objects get the same tree data back without rebuilding it. Neither the inputs
+    nor the returned tree data should therefore be modified in place.
+    """
+    if isinstance(paths, Iterator):
+        return _build_tree_data(paths, delimiter, num_meta_nodes, meta_data)
+
+    key = (id(paths), id(meta_data), delimiter, num_meta_nodes)
+    cached = _CACHE.get(key)
+    if cached is not None:
+        _CACHE.move_to_end(key)
+        return cached[2]
+
+    tree_data = _build_tree_data(paths, delimiter, num_meta_nodes, meta_data)
+    _CACHE[key] = (paths, meta_data, tree_data)
+    if len(_CACHE) > _CACHE_SIZE:
+        _CACHE.popitem(last=False)
+    return tree_data
+
+
+def _build_tree_data(
+    paths: Iterable[str],
+    delimiter: str,
+    num_meta_nodes: int,
+    meta_data: Optional[Mapping[str, Mapping[str, Any]]],
+) -> List[_Node]:
+    tree_data: List[_Node] = []
+
+    # Maps the path of each node having children -> (list of children, dict of
+    # children by name). The top level is given by the empty path.
+    inner_nodes: Dict[str, Tuple[List[_Node], Dict[str, _Node]]] = {"": (tree_data, {})}
+
+    def get_inner_node(path: str):
+        inner_node = inner_nodes.get(path)
+        if inner_node is None:
+            parent, separator, name = path.rpartition(delimiter)
+            _validate_name(name, parent, separator, path)
+            siblings, siblings_by_name = get_inner_node(parent)
+            node = siblings_by_name.get(name)
+            if node is None:
+                node = siblings_by_name[name] = {"name": name}
+                siblings.append(node)
+            inner_node = inner_nodes[path] = (node.setdefault("children", []), {})
+        return inner_node
+
+    # Consecutive paths usually share parent, so the parent is only looked up
+    # when it changes. Leaves are then added with a single dict lookup each.
+    last_parent = None
+    children, children_by_name = inner_nodes[""]
+    for path in paths:
+        parent, separator, name = path.rpartition(delimiter)
+        if parent != last_parent:
+            if (
+                num_meta_nodes
+                and (parent.count(delimiter) + 1 if separator else 0) < num_meta_nodes
+            ):
+                raise ValueError(
+                    f'The node path "{path}" does not have any nodes in addition to '
+                    f"the {num_meta_nodes} meta node(s)."
+                )
+            children, children_by_name = get_inner_node(parent)
+            last_parent = parent
+        if name in children_by_name:
+            continue
+        if not name or (separator and not parent):
+            _validate_name(name, parent, separator, path)
+        node = children_by_name[name] = {"name": name}
+        children.append(node)
+
+    if meta_data:
+        _add_meta_data(inner_nodes, meta_data, delimiter)
+
+    return tree_data
+
+
+def _add_meta_data(
+    inner_nodes: Dict[str, Tuple[List[_Node], Dict[str, _Node]]],
+    meta_data: Mapping[str, Mapping[str, Any]],
+    delimiter: str,
+) -> None:
+    for path, values in meta_data.items():
+        parent, _, name = path.rpartition(delimiter)
+        inner_node = inner_nodes.get(parent)
+        if inner_node is not None and name in inner_node[1]:
+            inner_node[1][name].update(values)
+
+
+def _validate_name(name: str, parent: str, separator: str, path: str) -> None:
+    if name == "" or (separator and parent == ""):
+        raise ValueError(f'Empty strings are not allowed as names of nodes: "{path}"')
@@ -0,0 +1,56 @@
+from typing import Any, Dict, List, Sequence
+
+_META_DATA_KEYS = ("id", "description", "color", "icon", "lazyChildren")
+
+
+def flatten_tree_data(data: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Converts SmartNodeSelector `data`, given as a nested list of nodes
+    (`{"name", "children", "description", "color", "icon", "id"}`), to flattened form.
+
+    The flattened form holds the node names in pre-order, the index of each
+    node's parent (-1 for top level nodes), and meta data keyed by node index for
+    the nodes having any. It can be given directly as the `data` prop of
+    SmartNodeSelector, which then builds its index in a single linear pass
+    instead of traversing and stringifying the nested structure. It is also
+    more compact than the nested form.
+    """
+    names: List[str] = []
+    parents: List[int] = []
+    meta_data: Dict[str, Dict[str, Any]] = {}
+
+    stack = [(node, -1) for node in reversed(data)]
+    while stack:
+        node, parent = stack.pop()
+        name = node.get("name")
+        if not isinstance(name, str) or name == "":
+            raise ValueError(
+                "Empty/invalid strings are not allowed as names of nodes: "
+                f'"{_node_path(names, parents, parent)}"'
+            )
+
+        index = len(names)
+        names.append(name)
+        parents.append(parent)
+
+        node_meta_data = {
+            key: node[key] for key in _META_DATA_KEYS if node.get(key) is not None
+        }
+        if node_meta_data:
+            meta_data[str(index)] = node_meta_data
+
+        children = node.get("children")
+        if children:
+            stack.extend((child, index) for child in reversed(children))
+
+    flat_data: Dict[str, Any] = {"names": names, "parents": parents}
+    if meta_data:
+        flat_data["metaData"] = meta_data
+    return flat_data
+
+
+def _node_path(names: List[str], parents: List[int], index: int) -> str:
+    path = []
+    while index != -1:
+        path.append(names[index])
+        index = parents[index]
+    return ":".join(reversed(path))
@@ -0,0 +1,89 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+from dash import Dash, Input, Output
+from dash.exceptions import PreventUpdate
+
+
+class LazyTreeData:
+    """Serves SmartNodeSelector `data` in parts, for trees too large to be sent to
+    the browser up front.
+
+    Only the nodes down to `load_depth` levels are included in `initial_data()`.
+    Deeper nodes having children are marked with `lazyChildren`, and their
+    children are sent when the SmartNodeSelector requests them through its
+    `requestedNodePaths` prop (when the user navigates into the node).
+    Use `register_callback` to answer these requests.
+    """
+
+    def __init__(
+        self,
+        data: Sequence[Dict[str, Any]],
+        delimiter: str = ":",
+        load_depth: int = 1,
+    ):
+        if load_depth < 1:
+            raise ValueError("load_depth must be at least 1.")
+
+        self._data = data
+        self._delimiter = delimiter
+        self._load_depth = load_depth
+
+        # Maps node path -> children, for all nodes having children
+        self._children: Dict[str, Sequence[Dict[str, Any]]] = {}
+        stack = [(node, "") for node in data]
+        while stack:
+            node, parent_path = stack.pop()
+            children = node.get("children")
+            if children:
+                path = f"{parent_path}{node['name']}"
+                self._children[path] = children
+                stack.extend((child, path + delimiter) for child in children)
+
+    def initial_data(self) -> List[Dict[str, Any]]:
+        """The `data` to give the SmartNodeSelector."""
+        return _truncate(self._data, self._load_depth)
+
+    def children(self, node_path: str) -> Optional[List[Dict[str, Any]]]:
+        """The children to load for the node with the given node path (node names
+        joined by the delimiter), or None if there is no such node with children.
+        """
+        children = self._children.get(node_path)
+        if children is None:
+            return None
+        return _truncate(children, self._load_depth)
+
+    def register_callback(self, app: Dash, component_id: str) -> None:
+        """Registers a callback sending the children requested by the
+        SmartNodeSelector with the given id.
+        """
+
+        @app.callback(
+            Output(component_id, "loadedChildren"),
+            Input(component_id, "requestedNodePaths"),
+            prevent_initial_call=True,
+        )
+        def _load_children(
+            requested_node_paths: Optional[List[str]],
+        ) -> Dict[str, List[Dict[str, Any]]]:
+            loaded_children = {}
+            for node_path in requested_node_paths or []:
+                children = self.children(node_path)
+                if children is not None:
+                    loaded_children[node_path] = children
+            if not loaded_children:
+                raise PreventUpdate
+            return loaded_children
+
+
+def _truncate(nodes: Sequence[Dict[str, Any]], depth: int) -> List[Dict[str, Any]]:
+    truncated = []
+    for node in nodes:
+        children = node.get("children")
+        if children:
+            node = {key: value for key, value in node.items() if key != "children"}
+            if depth > 1:
+                node["children"] = _truncate(children, depth - 1)
+            else:
+                node["lazyChildren"] = True
+        truncated.append(node)
+    return truncated
@@ -0,0 +1,195 @@
+import re
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Pattern, Sequence
+
+from ._flat_tree_data import flatten_tree_data
+
+_MAX_CACHED_PATTERNS = 1024
+
+
+class ResolvedTags(NamedTuple):
+    """The result of `TagResolver.resolve_tags`.
+
+    * selected_tags: The non-empty tags, as reported by the SmartNodeSelector.
+    * selected_nodes: The complete node paths matched by the valid tags, in the
+                      order of the tags (and of the tree for each tag), without
+                      nodes matched by an earlier tag.
+    * selected_ids: The id of the last node of each selected node path (None for
+                    nodes without id).
+    * invalid_tags: The tags not matching any complete node path.
+    * resolved_tags: The complete node paths matched by each valid tag, to be
+                     given as the `resolvedTags` prop of the SmartNodeSelector.
+    """
+
+    selected_tags: List[str]
+    selected_nodes: List[str]
+    selected_ids: List[Optional[str]]
+    invalid_tags: List[str]
+    resolved_tags: Dict[str, List[str]]
+
+
+class TagResolver:
+    """Validates and expands SmartNodeSelector tags (e.g. persisted `selectedTags`)
+    against the tree data on the server, such that callbacks get the selected node
+    paths and ids without a round trip through the browser:
+
+        resolver = TagResolver(data)
+
+        @app.callback(
+            Output("vector-selector", "resolvedTags"),
+            Output("graph", "figure"),
+            Input("vector-selector", "selectedTags"),
+        )
+        def _update(selected_tags):
+            resolved = resolver.resolve_tags(selected_tags)
+            return resolved.resolved_tags, make_figure(resolved.selected_nodes)
+
+    Tags are matched as by the SmartNodeSelector: each node name in a tag matches
+    the node names on its level, where `*` matches any characters, `?` a single
+    character, and (with `allow_or_operator`, i.e. `useBetaFeatures`) `a|b`
+    either of the alternatives. A tag is valid if it matches at least one complete
+    node path, i.e. one ending in a node without children (nodes marked with
+    `lazyChildren` are not complete).
+
+    The tree is indexed once, when the resolver is created, and each batch of
+    tags is resolved in a single traversal of the index, visiting only the nodes
+    matched by at least one tag.
+    """
+
+    def __init__(
+        self,
+        data: Any,
+        delimiter: str = ":",
+        allow_or_operator: bool = False,
+    ):
+        flat_data = data if isinstance(data, dict) else flatten_tree_data(data)
+        names: Sequence[str] = flat_data["names"]
+        parents: Sequence[int] = flat_data["parents"]
+        meta_data: Dict[str, Dict[str, Any]] = flat_data.get("metaData") or {}
+
+        self._delimiter = delimiter
+        self._allow_or_operator = allow_or_operator
+        self._paths: List[str] = []
+        self._patterns: Dict[str, Optional[Pattern[str]]] = {}
+
+        # Children of each node by name (several for siblings with identical
+        # names). The top level is held by the last entry, such that it is found
+        # at index -1.
+        self._children: List[Dict[str, List[int]]] = [{} for _ in range(len(names) + 1)]
+        for index, (name, parent) in enumerate(zip(names, parents)):
+            if parent >= index:
+                raise ValueError("Flat tree data must be given in pre-order.")
+            self._children[parent].setdefault(name, []).append(index)
+            self._paths.append(
+                name if parent == -1 else self._paths[parent] + delimiter + name
+            )
+
+        self._ids: List[Optional[str]] = [None] * len(names)
+        self._complete = [not children for children in self._children[:-1]]
+        for key, values in meta_data.items():
+            index = int(key)
+            self._ids[index] = values.get("id")
+            if values.get("lazyChildren"):
+                self._complete[index] = False
+
+    def resolve_tags(
+        self, tags: Optional[Iterable[str]], max_num_selected_nodes: int = -1
+    ) -> ResolvedTags:
+        """Resolves the tags, e.g. the `selectedTags` of a SmartNodeSelector.
+        At most `max_num_selected_nodes` nodes are selected (-1 for no limit), as
+        by the SmartNodeSelector with the same `maxNumSelectedNodes`.
+        """
+        selected_tags = [tag for tag in tags or [] if tag != ""]
+        node_paths = [tag.split(self._delimiter) for tag in selected_tags]
+        matches = self._match(node_paths)
+
+        selected_nodes: List[str] = []
+        selected_ids: List[Optional[str]] = []
+        invalid_tags: List[str] = []
+        resolved_tags: Dict[str, List[str]] = {}
+        matched_nodes: set = set()
+        for tag, nodes in zip(selected_tags, matches):
+            if not nodes:
+                invalid_tags.append(tag)
+                continue
+            resolved_tags[tag] = [self._paths[node] for node in nodes]
+            # Tags overlapping with earlier tags are skipped as a whole
+            if matched_nodes.intersection(nodes):
+                continue
+            matched_nodes.update(nodes)
+            for node in nodes:
+                if 0 < max_num_selected_nodes <= len(selected_nodes):
+                    break
+                selected_nodes.append(self._paths[node])
+                selected_ids.append(self._ids[node])
+
+        return ResolvedTags(
+            selected_tags, selected_nodes, selected_ids, invalid_tags, resolved_tags
+        )
+
+    def _match(self, node_paths: List[List[str]]) -> List[List[int]]:
+        """Returns the complete nodes matched by each node path, in tree order."""
+        matches: List[List[int]] = [[] for _ in node_paths]
+
+        # Depth-first traversal of the nodes matched by the first levels of any
+        # of the node paths, each node visited once with all of these paths
+        stack = [(-1, 0, list(range(len(node_paths))))]
+        while stack:
+            node, level, active = stack.pop()
+            next_level: Dict[int, List[int]] = {}
+            matched_children: Dict[str, List[int]] = {}
+            for path_index in active:
+                node_path = node_paths[path_index]
+                if level == len(node_path):
+                    if self._complete[node]:
+                        matches[path_index].append(node)
+                    continue
+                name = node_path[level]
+                children = matched_children.get(name)
+                if children is None:
+                    children = matched_children[name] = self._match_children(node, name)
+                for child in children:
+                    next_level.setdefault(child, []).append(path_index)
+            # Node indices are in pre-order, so popping the children in index
+            # order visits the tree in order
+            stack.extend(
+                (child, level + 1, next_level[child])
+                for child in sorted(next_level, reverse=True)
+            )
+        return matches
+
+    def _match_children(self, node: int, name: str) -> List[int]:
+        pattern = self._pattern(name)
+        if pattern is None:
+            return self._children[node].get(name, [])
+        return [
+            child
+            for child_name, children in self._children[node].items()
+            if pattern.fullmatch(child_name)
+            for child in children
+        ]
+
+    def _pattern(self, name: str) -> Optional[Pattern[str]]:
+        """The regular expression matching node names for the given name in a
+        tag, or None if it only matches itself.
+        """
+        if name in self._patterns:
+            return self._patterns[name]
+
+        alternatives = [name]
+        if self._allow_or_operator and "|" in name:
+            alternatives = name.split("|")
+            if "" in alternatives:
+                alternatives = [name]
+        if len(alternatives) == 1 and not any(char in name for char in "*?"):
+            pattern = None
+        else:
+            pattern = re.compile(
+                "|".join(
+                    re.escape(alternative).replace(r"\*", ".*").replace(r"\?", ".")
+                    for alternative in alternatives
+                )
+            )
+        if len(self._patterns) >= _MAX_CACHED_PATTERNS:
+            self._patterns.clear()
+        self._patterns[name] = pattern
+        return pattern
@@ -0,0 +1,3 @@
+from ._precompressed_assets import PrecompressedAssets
+
+__all__ = ["PrecompressedAssets"]
@@ -0,0 +1,119 @@
+import json
+import mimetypes
+import os
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+
+import flask
+from dash import Dash
+from dash.fingerprint import check_fingerprint
+
+_PACKAGE_NAME = "webviz_core_components"
+
+# Written by the PrecompressPlugin in react/webpack.config.js
+_MANIFEST = "precompressed-assets.json"
+
+# In order of preference, with the file extension of each
+_ENCODINGS = {"br": "br", "gzip": "gz"}
+
+
+class _Asset(NamedTuple):
+    hash: str
+    encodings: Tuple[str, ...]
+
+
+class PrecompressedAssets:
+    """Serves the JavaScript and CSS files of this package from their gzip and
+    brotli compressed variants written when the bundle is built, instead of
+    having Dash serve them uncompressed.
+
+    A Flask `before_request` hook is registered when the object is created, which
+    has to be done before the app starts serving requests:
+
+        app = dash.Dash(__name__)
+        PrecompressedAssets(app)
+
+    The hook answers requests for the files in `_dash-component-suites` accepting
+    one of the encodings, preferring brotli, and leaves all other requests to
+    Dash. Files requested with the fingerprint added to their URL by Dash are
+    cached by the browser for a year. Files requested without it (the chunks
+    loaded on first use) are revalidated, using the content hash of the file as
+    ETag.
+
+    The compressed files are read once, and kept in memory. Nothing is served if
+    the bundle was built without them (e.g. the development bundle).
+    """
+
+    def __init__(
+        self, app: Dash, package_path: Optional[Union[str, os.PathLike]] = None
+    ):
+        self._package_path = Path(package_path or Path(__file__).parents[1])
+        self._prefix = (
+            f"{app.config.routes_pathname_prefix}"
+            f"_dash-component-suites/{_PACKAGE_NAME}/"
+        )
+        self._assets = self._load_manifest()
+        self._files: Dict[Tuple[str, str], bytes] = {}
+
+        app.server.before_request(self._serve)
+
+    def _load_manifest(self) -> Dict[str, _Asset]:
+        try:
+            with open(self._package_path / _MANIFEST, encoding="utf8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return {}
+        return {
+            path: _Asset(
+                entry["hash"],
+                tuple(
+                    encoding
+                    for encoding in _ENCODINGS
+                    if encoding in entry["encodings"]
+                ),
+            )
+            for path, entry in manifest.items()
+        }
+
+    def _serve(self) -> Optional[flask.Response]:
+        request = flask.request
+        if request.method not in ("GET", "HEAD") or not request.path.startswith(
+            self._prefix
+        ):
+            return None
+        path, has_fingerprint = check_fingerprint(request.path[len(self._prefix) :])
+        asset = self._assets.get(path)
+        if asset is None:
+            return None
+        encoding = next(
+            (
+                encoding
+                for encoding in asset.encodings
+                if request.accept_encodings[encoding] > 0
+            ),
+            None,
+        )
+        if encoding is None:
+            return None
+
+        extension = "." + path.split(".")[-1]
+        response = flask.Response(
+            self._read(path, encoding),
+            mimetype=mimetypes.types_map.get(extension, "application/octet-stream"),
+        )
+        response.headers["Content-Encoding"] = encoding
+        response.vary.add("Accept-Encoding")
+        # Each encoding of a file is a different representation, with its own tag
+        response.set_etag(f"{asset.hash}-{encoding}")
+        response.headers["Cache-Control"] = (
+            "public, max-age=31536000, immutable" if has_fingerprint else "no-cache"
+        )
+        return response.make_conditional(request)
+
+    def _read(self, path: str, encoding: str) -> bytes:
+        key = (path, encoding)
+        if key not in self._files:
+            self._files[key] = (
+                self._package_path / f"{path}.{_ENCODINGS[encoding]}"
+            ).read_bytes()
+        return self._files[key]
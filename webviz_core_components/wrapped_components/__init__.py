@@ -1,38 +1,59 @@
-from .checklist import Checklist
-from .collapsive_header import CollapsiveHeader
-from .dropdown import Dropdown
-from .flexbox import FlexBox
-from .flexcolumn import FlexColumn
-from .frame import Frame
-from .graph import Graph
-from .header import Header
-from .label import Label
-from .labeled_container import LabeledContainer
-from .range_slider import RangeSlider
-from .radioitems import RadioItems
+# pylint: disable=undefined-all-variable
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING as _TYPE_CHECKING
 
-from .select_with_label import SelectWithLabel
-from .selectors import Selectors
-from .slider import Slider
-from .tab import Tab
-from .tabs import Tabs
+# Wrapped components are imported on first access.
+# Maps component name -> module defining it.
+_COMPONENT_MODULES = {
+    "Checklist": ".checklist",
+    "CollapsiveHeader": ".collapsive_header",
+    "Dropdown": ".dropdown",
+    "FlexBox": ".flexbox",
+    "FlexColumn": ".flexcolumn",
+    "Frame": ".frame",
+    "Graph": ".graph",
+    "Header": ".header",
+    "Label": ".label",
+    "LabeledContainer": ".labeled_container",
+    "RangeSlider": ".range_slider",
+    "RadioItems": ".radioitems",
+    "SelectWithLabel": ".select_with_label",
+    "Selectors": ".selectors",
+    "Slider": ".slider",
+    "Tab": ".tab",
+    "Tabs": ".tabs",
+}
 
-__all__ = [
-    "Checklist",
-    "CollapsiveHeader",
-    "Dropdown",
-    "FlexBox",
-    "FlexColumn",
-    "Frame",
-    "Graph",
-    "Header",
-    "Label",
-    "LabeledContainer",
-    "RangeSlider",
-    "RadioItems",
-    "SelectWithLabel",
-    "Selectors",
-    "Slider",
-    "Tab",
-    "Tabs",
-]
+__all__ = list(_COMPONENT_MODULES)
+
+if _TYPE_CHECKING:
+    # Static imports of the lazily loaded classes, for linters and IDEs
+    from .checklist import Checklist
+    from .collapsive_header import CollapsiveHeader
+    from .dropdown import Dropdown
+    from .flexbox import FlexBox
+    from .flexcolumn import FlexColumn
+    from .frame import Frame
+    from .graph import Graph
+    from .header import Header
+    from .label import Label
+    from .labeled_container import LabeledContainer
+    from .range_slider import RangeSlider
+    from .radioitems import RadioItems
+    from .select_with_label import SelectWithLabel
+    from .selectors import Selectors
+    from .slider import Slider
+    from .tab import Tab
+    from .tabs import Tabs
+
+
+def __getattr__(name):
+    if name not in _COMPONENT_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    component = getattr(_import_module(_COMPONENT_MODULES[name], __name__), name)
+    globals()[name] = component
+    return component
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,4 +1,15 @@
 import inspect
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _argument_index(parent_class, argument_name):
+    """Returns the index of argument_name in the parent_class __init__ signature.
+
+    The argspec of a class is static, so it is resolved once per
+    (class, argument) pair instead of on every instance creation.
+    """
+    return inspect.getfullargspec(parent_class).args.index(argument_name)
 
 
 def argument_modifier(parent_class, argument_name, modifying_function, args, kwargs):
@@ -14,7 +25,7 @@ def argument_modifier(parent_class, argument_name, modifying_function, args, kwa
     Returns new pair of args and kwargs.
     """
 
-    arg_index = inspect.getfullargspec(parent_class).args.index(argument_name)
+    arg_index = _argument_index(parent_class, argument_name)
 
     if len(args) > arg_index:  # given as positional argument
         args = (
@@ -23,7 +34,8 @@ def argument_modifier(parent_class, argument_name, modifying_function, args, kwa
             + args[arg_index + 1 :]
         )
     else:
-        if modifying_function(kwargs.get(argument_name)) is not None:
-            kwargs[argument_name] = modifying_function(kwargs.get(argument_name))
+        modified_value = modifying_function(kwargs.get(argument_name))
+        if modified_value is not None:
+            kwargs[argument_name] = modified_value
 
     return args, kwargs
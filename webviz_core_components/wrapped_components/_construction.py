@@ -0,0 +1,32 @@
+import copy
+from typing import Any, Dict, Type
+
+from dash.development.base_component import Component
+
+_TEMPLATES: Dict[Type[Component], Component] = {}
+
+
+def set_props(component: Component, **props: Any) -> Component:
+    """Sets the given props on an already constructed component, and returns it.
+
+    The Dash component __init__ validates each given prop, which is relatively
+    slow. Props the wrapped components add themselves are known to be valid,
+    and are therefore set directly instead.
+    """
+    for name, value in props.items():
+        setattr(component, name, value)
+    return component
+
+
+def from_template(component_class: Type[Component], **props: Any) -> Component:
+    """Returns a new instance of component_class with the given props set.
+
+    The instance is a shallow copy of a cached empty instance, such that the
+    Dash component __init__ is only run once per class. Only use this for the
+    internal helper components (wrapping divs, labels) of the wrapped components.
+    """
+    template = _TEMPLATES.get(component_class)
+    if template is None:
+        template = _TEMPLATES[component_class] = component_class()
+
+    return set_props(copy.copy(template), **props)
@@ -0,0 +1,130 @@
+import base64
+import sys
+from typing import Any, Optional
+
+# numpy dtype -> plotly.js typed array dtype
+_TYPED_ARRAY_DTYPES = {
+    "int8": "i1",
+    "uint8": "u1",
+    "int16": "i2",
+    "uint16": "u2",
+    "int32": "i4",
+    "uint32": "u4",
+    "float32": "f4",
+    "float64": "f8",
+}
+
+
+def encode_figure_arrays(figure: Any, float32_tolerance: Optional[float] = None) -> Any:
+    """Returns the figure with the numpy arrays and pandas series/indices in the
+    traces replaced by plotly.js typed arrays (`{"dtype": ..., "bdata": ...}`), which
+    are faster to serialize and smaller than JSON lists of numbers.
+
+    * figure: A figure dict, or a plotly figure (converted to a dict, where plotly
+              has already encoded the numpy arrays as typed arrays).
+    * float32_tolerance: If given, float64 arrays are sent as float32 when all
+                         values are within this relative tolerance of the original.
+                         This includes float64 typed arrays already in the figure.
+
+    Arrays of other than integer and float values (e.g. dates and strings), and
+    int64 arrays with values not fitting in 32 bits, are left as they are. The given
+    figure is not modified.
+    """
+    # Without numpy imported, there can be no numpy arrays to encode
+    np = sys.modules.get("numpy")
+    if figure is None or np is None:
+        return figure
+
+    if hasattr(figure, "to_dict"):
+        figure = figure.to_dict()
+
+    if not isinstance(figure, dict) or not figure.get("data"):
+        return figure
+
+    return {
+        **figure,
+        "data": [
+            _encode_value(np, trace, float32_tolerance) for trace in figure["data"]
+        ],
+    }
+
+
+def _encode_value(np: Any, value: Any, float32_tolerance: Optional[float]) -> Any:
+    if _is_typed_array(value):
+        if value["dtype"] == "f8" and float32_tolerance is not None:
+            return _encode_array(np, _decode_array(np, value), float32_tolerance)
+        return value
+
+    if isinstance(value, dict):
+        return {
+            key: _encode_value(np, item, float32_tolerance)
+            for key, item in value.items()
+        }
+
+    # Lists of objects, e.g. the `dimensions` of splom and parcoords traces
+    if isinstance(value, list) and value and isinstance(value[0], dict):
+        return [_encode_value(np, item, float32_tolerance) for item in value]
+
+    pandas = sys.modules.get("pandas")
+    if pandas is not None and isinstance(value, (pandas.Series, pandas.Index)):
+        value = value.to_numpy()
+
+    if isinstance(value, np.ndarray):
+        return _encode_array(np, value, float32_tolerance)
+
+    return value
+
+
+def _encode_array(np: Any, array: Any, float32_tolerance: Optional[float]) -> Any:
+    if array.size == 0 or array.dtype.kind not in "iuf":
+        return array
+
+    if array.dtype.kind in "iu" and array.dtype.itemsize == 8:
+        # plotly.js does not support 64 bit integers
+        for dtype in (
+            ["int8", "int16", "int32"]
+            if array.dtype.kind == "i"
+            else ["uint8", "uint16", "uint32"]
+        ):
+            info = np.iinfo(dtype)
+            if array.min() >= info.min and array.max() <= info.max:
+                array = array.astype(dtype)
+                break
+        else:
+            return array
+    elif array.dtype.kind == "f":
+        # plotly.js only supports float32 and float64
+        if array.dtype.itemsize < 4:
+            array = array.astype("float32")
+        elif array.dtype.itemsize > 8:
+            array = array.astype("float64")
+        if array.dtype.itemsize == 8 and float32_tolerance is not None:
+            float32_array = array.astype("float32")
+            if np.allclose(
+                float32_array, array, rtol=float32_tolerance, atol=0, equal_nan=True
+            ):
+                array = float32_array
+
+    dtype = _TYPED_ARRAY_DTYPES[array.dtype.name]
+    # plotly.js reads the data as little-endian and in row-major order
+    array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+    typed_array = {"dtype": dtype, "bdata": base64.b64encode(array).decode("ascii")}
+    if array.ndim > 1:
+        typed_array["shape"] = ", ".join(str(length) for length in array.shape)
+    return typed_array
+
+
+def _is_typed_array(value: Any) -> bool:
+    return isinstance(value, dict) and "dtype" in value and "bdata" in value
+
+
+def _decode_array(np: Any, typed_array: dict) -> Any:
+    array = np.frombuffer(
+        base64.b64decode(typed_array["bdata"]),
+        dtype=np.dtype(typed_array["dtype"]).newbyteorder("<"),
+    )
+    if "shape" in typed_array:
+        array = array.reshape(
+            [int(length) for length in str(typed_array["shape"]).split(",")]
+        )
+    return array
@@ -2,28 +2,73 @@ from typing import Any
 
 from dash import html, dcc
 
+from ..dropdown_options import persisted_value_id
+from ._construction import from_template, set_props
+
 
 class Dropdown(html.Div):
+    """Wraps `dcc.Dropdown`, with an optional label.
+
+    Given `searchable_options` (a
+    `webviz_core_components.dropdown_options.SearchableOptions`), the options are
+    kept on the server, and the dropdown only gets the options of its value and
+    those matching what the user searches for. The callback sending them has to
+    be registered with `searchable_options.register_callback(app, id)`. The value
+    is then persisted in a `dcc.Store` next to the dropdown, as Dash persistence
+    would clear values not among the options sent in the layout.
+    """
+
     def __init__(
         self,
         label: str = None,
         wrapper_id: str = None,
         persistence: bool = True,
         persistence_type: str = "session",
+        searchable_options: Any = None,
         **kwargs: Any,
     ) -> None:
         super().__init__()
         if wrapper_id is not None:
             self.id = wrapper_id
-        children = [html.Label(label)] if label else []
-        children.append(
-            html.Div(
-                className="webviz-dropdown",
-                children=dcc.Dropdown(
-                    persistence=persistence,
-                    persistence_type=persistence_type,
-                    **kwargs,
-                ),
+        children = [from_template(html.Label, children=label)] if label else []
+        if searchable_options is None:
+            dropdown = set_props(
+                dcc.Dropdown(**kwargs),
+                persistence=persistence,
+                persistence_type=persistence_type,
+            )
+        else:
+            dropdown = _searchable_dropdown(
+                searchable_options, persistence, persistence_type, **kwargs
             )
+        children.append(
+            from_template(html.Div, className="webviz-dropdown", children=dropdown)
+        )
+        self.children = from_template(
+            html.Div, style={"fontSize": "15px"}, children=children
         )
-        self.children = html.Div(style={"fontSize": "15px"}, children=children)
+
+
+def _searchable_dropdown(
+    searchable_options: Any,
+    persistence: bool,
+    persistence_type: str,
+    **kwargs: Any,
+) -> list:
+    if "id" not in kwargs:
+        raise ValueError("A Dropdown with searchable_options must have an id.")
+    if "options" in kwargs:
+        raise ValueError("A Dropdown with searchable_options can not be given options.")
+
+    value = kwargs.get("value")
+    dropdown = set_props(
+        dcc.Dropdown(**kwargs),
+        options=searchable_options.options_for(value),
+        searchable=True,
+    )
+    store = dcc.Store(
+        id=persisted_value_id(kwargs["id"]),
+        storage_type=persistence_type if persistence else "memory",
+        data={"original": value} if persistence else None,
+    )
+    return [dropdown, store]
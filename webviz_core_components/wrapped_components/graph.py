@@ -1,36 +1,155 @@
 from dash import dcc
 
+from ..graph_templates import use_graph_template
 from ._argument_modifier import argument_modifier
+from ._typed_arrays import encode_figure_arrays
+
+
+class _FrozenConfig(dict):
+    """A read-only dict. Used for the graph config which is shared between all
+    wcc.Graph instances not overriding any of the default values.
+    """
+
+    def _readonly(self, *_args, **_kwargs):
+        raise TypeError(
+            "The default wcc.Graph config is shared between graphs and can not be "
+            "modified in place. Give the graph a new config instead."
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def copy(self):
+        return dict(self)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, _memo):
+        return self
+
+    def __reduce__(self):
+        return (_FrozenConfig, (dict(self),))
+
+
+_DEFAULT_CONFIG = _FrozenConfig(
+    modeBarButtonsToRemove=("sendDataToCloud",),
+    displaylogo=False,
+    responsive=True,
+)
 
 
 class Graph(dcc.Graph):
     """This Dash component can be used the same way as dcc.Graph,
     however in addition it helps populate the graph config
     with reasonable default values in a Webviz context.
+
+    Given `typed_arrays=True`, numpy arrays and pandas series in the traces of the
+    figure are sent to the browser as binary typed arrays, see
+    `Graph.encode_figure_arrays`. Float64 arrays are then sent as float32 when
+    within the relative `float32_tolerance`, if given.
+
+    Given the name of a template registered with
+    `webviz_core_components.graph_templates.register_graph_template` as `template`,
+    the figure refers to the template by name, instead of holding it. The graph
+    is then rendered by the `WebvizGraph` component, which replaces the name by the
+    template before the figure is given to `dcc.Graph` in the browser.
+
+    Given `browser_config_defaults=True`, the graph is also rendered by
+    `WebvizGraph`, which applies the default config values in the browser. Only
+    the config values differing from the defaults are then sent with the graph,
+    such that a layout with many graphs does not repeat the default config.
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        typed_arrays=False,
+        float32_tolerance=None,
+        template=None,
+        browser_config_defaults=False,
+        **kwargs,
+    ):
         args, kwargs = argument_modifier(
-            dcc.Graph, "config", Graph.populate_config, args, kwargs
+            dcc.Graph,
+            "config",
+            _browser_config if browser_config_defaults else _populate_config,
+            args,
+            kwargs,
         )
+        if template is not None:
+            args, kwargs = argument_modifier(
+                dcc.Graph,
+                "figure",
+                lambda figure: use_graph_template(figure, template),
+                args,
+                kwargs,
+            )
+        if typed_arrays:
+            args, kwargs = argument_modifier(
+                dcc.Graph,
+                "figure",
+                lambda figure: encode_figure_arrays(figure, float32_tolerance),
+                args,
+                kwargs,
+            )
         super().__init__(*args, **kwargs)
+        if template is not None or browser_config_defaults:
+            self._namespace = "webviz_core_components"
+            self._type = "WebvizGraph"
+
+    @staticmethod
+    def encode_figure_arrays(figure, float32_tolerance=None):
+        """Returns the figure with the numpy arrays and pandas series in its traces
+        replaced by plotly.js typed arrays (base64 encoded `bdata` with a `dtype`).
+        Use this for figures returned by callbacks, to get the same encoding as
+        given `typed_arrays=True`.
+
+        If `float32_tolerance` is given, float64 arrays are sent as float32 when
+        all values are within this relative tolerance of the original values.
+        """
+        return encode_figure_arrays(figure, float32_tolerance)
 
     @staticmethod
     def populate_config(input_config=None):
         """Populates an optionally given plotly config with default values"""
 
-        if input_config is None:
-            config = {}
-        else:
-            config = input_config.copy()
+        config = {} if input_config is None else dict(input_config)
 
         if "modeBarButtonsToRemove" not in config:
-            config["modeBarButtonsToRemove"] = ["sendDataToCloud"]
+            config["modeBarButtonsToRemove"] = list(
+                _DEFAULT_CONFIG["modeBarButtonsToRemove"]
+            )
 
-        if "displaylogo" not in config:
-            config["displaylogo"] = False
-
-        if "responsive" not in config:
-            config["responsive"] = True
+        for key in ("displaylogo", "responsive"):
+            config.setdefault(key, _DEFAULT_CONFIG[key])
 
         return config
+
+
+def _populate_config(input_config=None):
+    """Like `Graph.populate_config`, but returns the shared read-only default
+    config if no values differing from the defaults are given. A new dict is only
+    created when the input config overrides or adds keys.
+    """
+    if not input_config or input_config is _DEFAULT_CONFIG:
+        return _DEFAULT_CONFIG
+
+    config = {**_DEFAULT_CONFIG, **input_config}
+    if config == _DEFAULT_CONFIG:
+        return _DEFAULT_CONFIG
+
+    return Graph.populate_config(input_config)
+
+
+def _browser_config(input_config=None):
+    """Returns the values of the config differing from the default config, which
+    is applied by `WebvizGraph` in the browser, or None if there are none.
+    """
+    defaults = Graph.populate_config()
+    config = {
+        key: value
+        for key, value in (input_config or {}).items()
+        if key not in defaults or value != defaults[key]
+    }
+    return config or None
@@ -2,6 +2,8 @@ from typing import Any
 
 from dash import html, dcc
 
+from ._construction import from_template, set_props
+
 
 class RadioItems(html.Div):
     """A Div wrapping a dcc.RadioItems with an
@@ -49,15 +51,17 @@ class RadioItems(html.Div):
         super().__init__()
         if wrapper_id is not None:
             self.id = wrapper_id
-        children = [html.Label(label)] if label else []
+        children = [from_template(html.Label, children=label)] if label else []
         children.append(
-            dcc.RadioItems(
+            set_props(
+                dcc.RadioItems(**kwargs),
                 persistence=persistence,
                 persistence_type=persistence_type,
                 className=className + " webviz-block-options"
                 if vertical
                 else className,
-                **kwargs,
             )
         )
-        self.children = html.Div(style={"fontSize": "15px"}, children=children)
+        self.children = from_template(
+            html.Div, style={"fontSize": "15px"}, children=children
+        )
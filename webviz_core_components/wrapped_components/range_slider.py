@@ -2,6 +2,8 @@ from typing import Any
 
 from dash import html, dcc
 
+from ._construction import from_template, set_props
+
 
 class RangeSlider(html.Div):
     """A Div wrapping a dcc.Slider with an optional label.
@@ -40,15 +42,18 @@ class RangeSlider(html.Div):
         super().__init__()
         if wrapper_id is not None:
             self.id = wrapper_id
-        children = [html.Label(label)] if label else []
+        children = [from_template(html.Label, children=label)] if label else []
         children.append(
-            html.Div(
+            from_template(
+                html.Div,
                 className="webviz-slider",
-                children=dcc.RangeSlider(
+                children=set_props(
+                    dcc.RangeSlider(**kwargs),
                     persistence=persistence,
                     persistence_type=persistence_type,
-                    **kwargs,
                 ),
             )
         )
-        self.children = html.Div(style={"fontSize": "15px"}, children=children)
+        self.children = from_template(
+            html.Div, style={"fontSize": "15px"}, children=children
+        )
@@ -3,6 +3,8 @@ from typing import Any
 from dash import html
 from webviz_core_components import Select as BaseSelect
 
+from ._construction import from_template, set_props
+
 
 class SelectWithLabel(html.Div):
     """A Div wrapping a wcc.Select with an optional label.
@@ -50,20 +52,25 @@ class SelectWithLabel(html.Div):
         if wrapper_id is not None:
             self.id = wrapper_id
         if collapsible:
-            children = [html.Summary(label)] if label else []
+            children = [from_template(html.Summary, children=label)] if label else []
         else:
-            children = [html.Label(label)] if label else []
+            children = [from_template(html.Label, children=label)] if label else []
         children.append(
-            BaseSelect(
+            set_props(
+                BaseSelect(**kwargs),
                 persistence=persistence,
                 persistence_type=persistence_type,
-                **kwargs,
             )
         )
         if collapsible:
-            self.children = html.Div(
+            self.children = from_template(
+                html.Div,
                 style={"fontSize": "15px"},
-                children=html.Details(open=open_details, children=children),
+                children=from_template(
+                    html.Details, open=open_details, children=children
+                ),
             )
         else:
-            self.children = html.Div(style={"fontSize": "15px"}, children=children)
+            self.children = from_template(
+                html.Div, style={"fontSize": "15px"}, children=children
+            )